@@ -48,7 +48,7 @@ from ..mparser import (
 if T.TYPE_CHECKING:
     from .visitor import AstVisitor
     from ..interpreter import Interpreter
-    from ..interpreterbase import SubProject, TYPE_nkwargs, TYPE_var
+    from ..interpreterbase import InterpreterObject, SubProject, TYPE_nkwargs, TYPE_var
     from ..mparser import (
         AndNode,
         ComparisonNode,
@@ -60,6 +60,16 @@ if T.TYPE_CHECKING:
         UMinusNode,
     )
 
+# resolve_node() looks up the exact type of a method's source object here.
+# bool must come before int for the isinstance() fallback.
+_PRIMITIVE_HOLDERS: T.Dict[type, T.Callable[[T.Any, Interpreter], InterpreterObject]] = {
+    str: StringHolder,
+    bool: BooleanHolder,
+    int: IntegerHolder,
+    list: ArrayHolder,
+    dict: DictHolder,
+}
+
 class DontCareObject(MesonInterpreterObject):
     pass
 
@@ -373,17 +383,16 @@ class AstInterpreter(InterpreterBase):
             margs = self.flatten_args(node.args.arguments, include_unknown_args, id_loop_detect)
             mkwargs: T.Dict[str, TYPE_var] = {}
             method_name = node.name.value
+            holder = _PRIMITIVE_HOLDERS.get(type(src))
+            if holder is None:
+                for typ, holder in _PRIMITIVE_HOLDERS.items():
+                    if isinstance(src, typ):
+                        break
+                else:
+                    holder = None
             try:
-                if isinstance(src, str):
-                    result = StringHolder(src, T.cast('Interpreter', self)).method_call(method_name, margs, mkwargs)
-                elif isinstance(src, bool):
-                    result = BooleanHolder(src, T.cast('Interpreter', self)).method_call(method_name, margs, mkwargs)
-                elif isinstance(src, int):
-                    result = IntegerHolder(src, T.cast('Interpreter', self)).method_call(method_name, margs, mkwargs)
-                elif isinstance(src, list):
-                    result = ArrayHolder(src, T.cast('Interpreter', self)).method_call(method_name, margs, mkwargs)
-                elif isinstance(src, dict):
-                    result = DictHolder(src, T.cast('Interpreter', self)).method_call(method_name, margs, mkwargs)
+                if holder is not None:
+                    result = holder(src, T.cast('Interpreter', self)).method_call(method_name, margs, mkwargs)
             except mesonlib.MesonException:
                 return None
 
@@ -59,6 +59,8 @@ if T.TYPE_CHECKING:
 # Assembly files cannot be unitified and neither can LLVM IR files
 LANGS_CANT_UNITY = ('d', 'fortran', 'vala')
 
+versioned_so_regex = re.compile(r'.+\.so(\.|$)')
+
 @dataclass(eq=False)
 class RegenInfo:
     source_dir: str
@@ -276,10 +278,10 @@ class Backend:
         self.processed_targets: T.Set[str] = set()
         self.build_dir = self.environment.get_build_dir()
         self.source_dir = self.environment.get_source_dir()
-        self.build_to_src = mesonlib.relpath(self.environment.get_source_dir(),
-                                             self.environment.get_build_dir())
-        self.src_to_build = mesonlib.relpath(self.environment.get_build_dir(),
-                                             self.environment.get_source_dir())
+        self.build_to_src = mesonlib.relpath(self.source_dir, self.build_dir)
+        self.src_to_build = mesonlib.relpath(self.build_dir, self.source_dir)
+        # Always-on and warning arguments, by compiler and warning level
+        self.always_and_warn_args: T.Dict[T.Tuple['Compiler', str], T.List[str]] = {}
 
     # If requested via 'capture = True', returns captured compile args per
     # target (e.g. captured_args[target]) that can be used later, for example,
@@ -306,7 +308,7 @@ class Backend:
         return os.path.join(self.get_target_dir(t), filename)
 
     def get_target_filename_abs(self, target: T.Union[build.Target, build.CustomTargetIndex]) -> str:
-        return os.path.join(self.environment.get_build_dir(), self.get_target_filename(target))
+        return os.path.join(self.build_dir, self.get_target_filename(target))
 
     def get_target_debug_filename(self, target: build.BuildTarget) -> T.Optional[str]:
         assert isinstance(target, build.BuildTarget), target
@@ -320,7 +322,7 @@ class Backend:
         assert isinstance(target, build.BuildTarget), target
         if not target.get_debug_filename():
             return None
-        return os.path.join(self.environment.get_build_dir(), self.get_target_debug_filename(target))
+        return os.path.join(self.build_dir, self.get_target_debug_filename(target))
 
     def get_source_dir_include_args(self, target: build.BuildTarget, compiler: 'Compiler', *, absolute_path: bool = False) -> T.List[str]:
         curdir = target.get_subdir()
@@ -377,8 +379,8 @@ class Backend:
 
     def get_target_dir_relative_to(self, t: build.Target, o: build.Target) -> str:
         '''Get a target dir relative to another target's directory'''
-        target_dir = os.path.join(self.environment.get_build_dir(), self.get_target_dir(t))
-        othert_dir = os.path.join(self.environment.get_build_dir(), self.get_target_dir(o))
+        target_dir = os.path.join(self.build_dir, self.get_target_dir(t))
+        othert_dir = os.path.join(self.build_dir, self.get_target_dir(o))
         return os.path.relpath(target_dir, othert_dir)
 
     def get_target_source_dir(self, target: build.Target) -> str:
@@ -388,11 +390,12 @@ class Backend:
             return os.path.join(self.build_to_src, target_dir)
         return self.build_to_src
 
+    @lru_cache(maxsize=None)
     def get_target_private_dir(self, target: T.Union[build.BuildTarget, build.CustomTarget, build.CustomTargetIndex]) -> str:
-        return os.path.join(self.get_target_filename(target, warn_multi_output=False) + '.p')
+        return self.get_target_filename(target, warn_multi_output=False) + '.p'
 
     def get_target_private_dir_abs(self, target: T.Union[build.BuildTarget, build.CustomTarget, build.CustomTargetIndex]) -> str:
-        return os.path.join(self.environment.get_build_dir(), self.get_target_private_dir(target))
+        return os.path.join(self.build_dir, self.get_target_private_dir(target))
 
     @lru_cache(maxsize=None)
     def get_target_generated_dir(
@@ -427,34 +430,21 @@ class Backend:
 
         def init_language_file(suffix: str, unity_file_number: int) -> T.TextIO:
             unity_src = self.get_unity_source_file(target, suffix, unity_file_number)
-            outfileabs = unity_src.absolute_path(self.environment.get_source_dir(),
-                                                 self.environment.get_build_dir())
+            outfileabs = unity_src.absolute_path(self.source_dir,
+                                                 self.build_dir)
             outfileabs_tmp = outfileabs + '.tmp'
             abs_files.append(outfileabs)
-            outfileabs_tmp_dir = os.path.dirname(outfileabs_tmp)
-            if not os.path.exists(outfileabs_tmp_dir):
-                os.makedirs(outfileabs_tmp_dir)
+            os.makedirs(os.path.dirname(outfileabs_tmp), exist_ok=True)
             result.append(unity_src)
             return open(outfileabs_tmp, 'w', encoding='utf-8')
 
         # For each language, generate unity source files and return the list
         for comp, srcs in compsrcs.items():
-            files_in_current = unity_size + 1
-            unity_file_number = 0
-            # TODO: this could be simplified with an algorithm that pre-sorts
-            # the sources into the size of chunks we want
-            ofile = None
-            for src in srcs:
-                if files_in_current >= unity_size:
-                    if ofile:
-                        ofile.close()
-                    ofile = init_language_file(comp.get_default_suffix(), unity_file_number)
-                    unity_file_number += 1
-                    files_in_current = 0
-                ofile.write(f'#include<{src}>\n')
-                files_in_current += 1
-            if ofile:
-                ofile.close()
+            suffix = comp.get_default_suffix()
+            # Each unity file includes the next unity_size sources, written out at once
+            for unity_file_number, start in enumerate(range(0, len(srcs), unity_size)):
+                with init_language_file(suffix, unity_file_number) as ofile:
+                    ofile.write(''.join(f'#include<{src}>\n' for src in srcs[start:start + unity_size]))
 
         for x in abs_files:
             mesonlib.replace_if_different(x, x + '.tmp')
@@ -479,10 +469,10 @@ class Backend:
                              proj_dir_to_build_root: str) -> T.Tuple[T.List[str], T.List[build.BuildTargetTypes]]:
         obj_list: T.List[str] = []
         deps: T.List[build.BuildTargetTypes] = []
+        src_root = os.path.join(proj_dir_to_build_root, self.build_to_src)
         for obj in objects:
             if isinstance(obj, str):
-                o = os.path.join(proj_dir_to_build_root,
-                                 self.build_to_src, target.get_subdir(), obj)
+                o = os.path.join(src_root, target.get_subdir(), obj)
                 obj_list.append(o)
             elif isinstance(obj, mesonlib.File):
                 if obj.is_built:
@@ -490,9 +480,7 @@ class Backend:
                                      obj.rel_to_builddir(self.build_to_src))
                     obj_list.append(o)
                 else:
-                    o = os.path.join(proj_dir_to_build_root,
-                                     self.build_to_src)
-                    obj_list.append(obj.rel_to_builddir(o))
+                    obj_list.append(obj.rel_to_builddir(src_root))
             elif isinstance(obj, build.ExtractedObjects):
                 if obj.recursive:
                     objs, d = self._flatten_object_list(obj.target, obj.objlist, proj_dir_to_build_root)
@@ -584,7 +572,7 @@ class Backend:
                 exe_cmd = ['mono'] + exe_cmd
             exe_wrapper = None
 
-        workdir = workdir or self.environment.get_build_dir()
+        workdir = workdir or self.build_dir
         return ExecutableSerialisation(exe_cmd + cmd_args, env,
                                        exe_wrapper, workdir,
                                        extra_paths, capture, feed, tag, verbose, installdir_map)
@@ -671,7 +659,7 @@ class Backend:
         # avoids collisions and also makes the name deterministic over
         # regenerations which avoids a rebuild by Ninja because the cmdline
         # stays the same.
-        hasher = hashlib.sha1()
+        hasher = hashlib.blake2b(digest_size=20)
         if es.env:
             es.env.hash(hasher)
         hasher.update(bytes(str(es.cmd_args), encoding='utf-8'))
@@ -682,7 +670,7 @@ class Backend:
         scratch_file = f'meson_exe_{basename}_{digest}.dat'
         exe_data = os.path.join(self.environment.get_scratch_dir(), scratch_file)
         with open(exe_data, 'wb') as f:
-            pickle.dump(es, f)
+            pickle.dump(es, f, protocol=pickle.HIGHEST_PROTOCOL)
         return (self.environment.get_build_command() + ['--internal', 'exe', '--unpickle', exe_data],
                 ', '.join(reasons))
 
@@ -763,7 +751,8 @@ class Backend:
     @lru_cache(maxsize=None)
     def rpaths_for_non_system_absolute_shared_libraries(self, target: build.BuildTarget, exclude_system: bool = True) -> 'ImmutableListProtocol[str]':
         paths: OrderedSet[str] = OrderedSet()
-        srcdir = self.environment.get_source_dir()
+        srcdir = self.source_dir
+        external_rpath_dirs: T.Optional[T.Set[str]] = None
 
         for dep in target.external_deps:
             if dep.type_name not in {'library', 'pkgconfig', 'cmake'}:
@@ -777,7 +766,9 @@ class Backend:
                     # No point in adding system paths.
                     continue
                 # Don't remove rpaths specified in LDFLAGS.
-                if libdir in self.get_external_rpath_dirs(target):
+                if external_rpath_dirs is None:
+                    external_rpath_dirs = self.get_external_rpath_dirs(target)
+                if libdir in external_rpath_dirs:
                     continue
                 # Windows doesn't support rpaths, but we use this function to
                 # emulate rpaths by setting PATH
@@ -785,7 +776,7 @@ class Backend:
                 # .so's may be extended with version information, e.g. libxyz.so.1.2.3
                 if not (
                     os.path.splitext(libpath)[1] in {'.dll', '.lib', '.so', '.dylib'}
-                    or re.match(r'.+\.so(\.|$)', os.path.basename(libpath))
+                    or versioned_so_regex.match(os.path.basename(libpath))
                 ):
                     continue
 
@@ -836,11 +827,12 @@ class Backend:
             fname = fname.replace(ch, '_')
         return hashed + fname
 
+    @lru_cache(maxsize=None)
     def object_filename_from_source(self, target: build.BuildTarget, source: 'FileOrString', targetdir: T.Optional[str] = None) -> str:
         assert isinstance(source, mesonlib.File)
         if isinstance(target, build.CompileTarget):
             return target.sources_map[source]
-        build_dir = self.environment.get_build_dir()
+        build_dir = self.build_dir
         rel_src = source.rel_to_builddir(self.build_to_src)
 
         # foo.vala files compile down to foo.c and then foo.c.o, not foo.vala.o
@@ -865,7 +857,7 @@ class Backend:
                 gen_source = rel_src
             else:
                 gen_source = os.path.relpath(os.path.join(build_dir, rel_src),
-                                             os.path.join(self.environment.get_source_dir(), target.get_subdir()))
+                                             os.path.join(self.source_dir, target.get_subdir()))
         machine = self.environment.machines[target.for_machine]
         ret = self.canonicalize_filename(gen_source) + '.' + machine.get_object_suffix()
         if targetdir is not None:
@@ -925,8 +917,9 @@ class Backend:
 
         for osrc in sources:
             objname = self.object_filename_from_source(extobj.target, osrc, targetdir)
-            objpath = os.path.join(proj_dir_to_build_root, objname)
-            result.append(objpath)
+            if proj_dir_to_build_root:
+                objname = os.path.join(proj_dir_to_build_root, objname)
+            result.append(objname)
 
         return result
 
@@ -971,19 +964,23 @@ class Backend:
     @staticmethod
     def escape_extra_args(args: T.List[str]) -> T.List[str]:
         # all backslashes in defines are doubly-escaped
-        extra_args: T.List[str] = []
-        for arg in args:
-            if arg.startswith(('-D', '/D')):
-                arg = arg.replace('\\', '\\\\')
-            extra_args.append(arg)
-
-        return extra_args
+        return [arg.replace('\\', '\\\\') if arg.startswith(('-D', '/D')) else arg
+                for arg in args]
 
     def get_no_stdlib_args(self, target: 'build.BuildTarget', compiler: 'Compiler') -> T.List[str]:
         if compiler.language in self.build.stdlibs[target.for_machine]:
             return compiler.get_no_stdinc_args()
         return []
 
+    def _get_always_and_warn_args(self, compiler: 'Compiler', warning_level: str) -> 'ImmutableListProtocol[str]':
+        # Shared by every target using this compiler and warning level
+        key = (compiler, warning_level)
+        args = self.always_and_warn_args.get(key)
+        if args is None:
+            args = compiler.get_always_args() + compiler.get_warn_args(warning_level)
+            self.always_and_warn_args[key] = args
+        return args
+
     def generate_basic_compiler_args(self, target: build.BuildTarget, compiler: 'Compiler') -> 'CompilerArgs':
         # Create an empty commands list, and start adding arguments from
         # various sources in the order in which they must override each other
@@ -995,10 +992,10 @@ class Backend:
         #
         # Add -nostdinc/-nostdinc++ if needed; can't be overridden
         commands += self.get_no_stdlib_args(target, compiler)
-        # Add things like /NOLOGO or -pipe; usually can't be overridden
-        commands += compiler.get_always_args()
-        # warning_level is a string, but mypy can't determine that
-        commands += compiler.get_warn_args(T.cast('str', target.get_option(OptionKey('warning_level'))))
+        # Add things like /NOLOGO or -pipe; usually can't be overridden.
+        # Then the warning flags; warning_level is a string, but mypy can't
+        # determine that
+        commands += self._get_always_and_warn_args(compiler, T.cast('str', target.get_option(OptionKey('warning_level'))))
         # Add -Werror if werror=true is set in the build options set on the
         # command-line or default_options inside project(). This only sets the
         # action to be done for warnings if/when they are emitted, so it's ok
@@ -1043,11 +1040,13 @@ class Backend:
         # added while generating the link command.
         # NOTE: We must preserve the order in which external deps are
         # specified, so we reverse the list before iterating over it.
+        is_vala = compiler.language == 'vala'
+        is_executable = isinstance(target, build.Executable)
         for dep in reversed(target.get_external_deps()):
             if not dep.found():
                 continue
 
-            if compiler.language == 'vala':
+            if is_vala:
                 if dep.type_name == 'pkgconfig':
                     assert isinstance(dep, dependencies.ExternalDependency)
                     if dep.name == 'glib-2.0' and dep.version_reqs is not None:
@@ -1062,7 +1061,7 @@ class Backend:
                 commands += compiler.get_dependency_compile_args(dep)
             # Qt needs -fPIC for executables
             # XXX: We should move to -fPIC for all executables
-            if isinstance(target, build.Executable):
+            if is_executable:
                 commands += dep.get_exe_args(compiler)
             # For 'automagic' deps: Boost and GTest. Also dependency('threads').
             # pkg-config puts the thread flags itself via `Cflags:`
@@ -1192,7 +1191,7 @@ class Backend:
                 prospectives.update(bdep.get_transitive_link_deps())
         # Internal deps
         for ld in prospectives:
-            dirseg = os.path.join(self.environment.get_build_dir(), self.get_target_dir(ld))
+            dirseg = os.path.join(self.build_dir, self.get_target_dir(ld))
             result.add(dirseg)
         if (isinstance(target, build.BuildTarget) and
                 not self.environment.machines.matches_build_machine(target.for_machine)):
@@ -1212,7 +1211,7 @@ class Backend:
             if isinstance(exe, programs.ExternalProgram):
                 cmd = exe.get_command()
             else:
-                cmd = [os.path.join(self.environment.get_build_dir(), self.get_target_filename(exe))]
+                cmd = [os.path.join(self.build_dir, self.get_target_filename(exe))]
             if isinstance(exe, (build.BuildTarget, programs.ExternalProgram)):
                 test_for_machine = exe.for_machine
             else:
@@ -1249,17 +1248,16 @@ class Backend:
             if isinstance(exe, build.Target):
                 depends.add(exe)
             for a in t.cmd_args:
-                if isinstance(a, build.Target):
+                # Plain strings are by far the most common argument
+                if isinstance(a, str):
+                    cmd_args.append(a)
+                elif isinstance(a, mesonlib.File):
+                    cmd_args.append(os.path.join(self.build_dir, a.rel_to_builddir(self.build_to_src)))
+                elif isinstance(a, build.Target):
                     depends.add(a)
+                    cmd_args.extend(self.construct_target_rel_paths(a, t.workdir))
                 elif isinstance(a, build.CustomTargetIndex):
                     depends.add(a.target)
-
-                if isinstance(a, mesonlib.File):
-                    a = os.path.join(self.environment.get_build_dir(), a.rel_to_builddir(self.build_to_src))
-                    cmd_args.append(a)
-                elif isinstance(a, str):
-                    cmd_args.append(a)
-                elif isinstance(a, (build.Target, build.CustomTargetIndex)):
                     cmd_args.extend(self.construct_target_rel_paths(a, t.workdir))
                 else:
                     raise MesonException('Bad object in test command.')
@@ -1273,7 +1271,7 @@ class Backend:
                             if isinstance(l, build.SharedLibrary):
                                 ld_lib_path_libs.add(l)
 
-                env_build_dir = self.environment.get_build_dir()
+                env_build_dir = self.build_dir
                 ld_lib_path: T.Set[str] = set(os.path.join(env_build_dir, l.get_subdir()) for l in ld_lib_path_libs)
 
                 if ld_lib_path:
@@ -1293,7 +1291,7 @@ class Backend:
         return arr
 
     def write_test_serialisation(self, tests: T.List['Test'], datafile: T.BinaryIO) -> None:
-        pickle.dump(self.create_test_serialisation(tests), datafile)
+        pickle.dump(self.create_test_serialisation(tests), datafile, protocol=pickle.HIGHEST_PROTOCOL)
 
     def construct_target_rel_paths(self, t: T.Union[build.Target, build.CustomTargetIndex], workdir: T.Optional[str]) -> T.List[str]:
         target_dir = self.get_target_dir(t)
@@ -1310,7 +1308,7 @@ class Backend:
         outputs = [os.path.join(target_dir, x) for x in outputs]
         if workdir is not None:
             assert os.path.isabs(workdir)
-            outputs = [os.path.join(self.environment.get_build_dir(), x) for x in outputs]
+            outputs = [os.path.join(self.build_dir, x) for x in outputs]
             outputs = [os.path.relpath(x, workdir) for x in outputs]
         return outputs
 
@@ -1323,7 +1321,7 @@ class Backend:
                 depmf_path = os.path.join(option_dir, 'depmf.json')
             else:
                 return
-        ifilename = os.path.join(self.environment.get_build_dir(), 'depmf.json')
+        ifilename = os.path.join(self.build_dir, 'depmf.json')
         ofilename = os.path.join(self.environment.get_prefix(), depmf_path)
         odirname = os.path.join(self.environment.get_prefix(), os.path.dirname(depmf_path))
         out_name = os.path.join('{prefix}', depmf_path)
@@ -1356,8 +1354,8 @@ class Backend:
 
     def generate_regen_info(self) -> None:
         deps = self.get_regen_filelist()
-        regeninfo = RegenInfo(self.environment.get_source_dir(),
-                              self.environment.get_build_dir(),
+        regeninfo = RegenInfo(self.source_dir,
+                              self.build_dir,
                               deps)
         filename = os.path.join(self.environment.get_scratch_dir(),
                                 'regeninfo.dump')
@@ -1371,7 +1369,7 @@ class Backend:
         import time
         now = time.time()
         for f in file_list:
-            absf = os.path.join(self.environment.get_build_dir(), f)
+            absf = os.path.join(self.build_dir, f)
             ftime = os.path.getmtime(absf)
             delta = ftime - now
             # On Windows disk time stamps sometimes point
@@ -1382,7 +1380,7 @@ class Backend:
 
     def build_target_to_cmd_array(self, bt: T.Union[build.BuildTarget, programs.ExternalProgram]) -> T.List[str]:
         if isinstance(bt, build.BuildTarget):
-            arr = [os.path.join(self.environment.get_build_dir(), self.get_target_filename(bt))]
+            arr = [os.path.join(self.build_dir, self.get_target_filename(bt))]
         else:
             arr = bt.get_command()
         return arr
@@ -1475,7 +1473,7 @@ class Backend:
             else:
                 fname = [i.rel_to_builddir(self.build_to_src)]
             if target.absolute_paths:
-                fname = [os.path.join(self.environment.get_build_dir(), f) for f in fname]
+                fname = [os.path.join(self.build_dir, f) for f in fname]
             srcs += fname
         return srcs
 
@@ -1484,13 +1482,13 @@ class Backend:
         for i in target.depend_files:
             if isinstance(i, mesonlib.File):
                 if absolute_paths:
-                    deps.append(i.absolute_path(self.environment.get_source_dir(),
-                                                self.environment.get_build_dir()))
+                    deps.append(i.absolute_path(self.source_dir,
+                                                self.build_dir))
                 else:
                     deps.append(i.rel_to_builddir(self.build_to_src))
             else:
                 if absolute_paths:
-                    deps.append(os.path.join(self.environment.get_source_dir(), target.subdir, i))
+                    deps.append(os.path.join(self.source_dir, target.subdir, i))
                 else:
                     deps.append(os.path.join(self.build_to_src, target.subdir, i))
         return deps
@@ -1522,7 +1520,7 @@ class Backend:
             if not idir:
                 idir = '.'
             if absolute_path:
-                idir = os.path.join(self.environment.get_build_dir(), idir)
+                idir = os.path.join(self.build_dir, idir)
             if idir not in custom_target_include_dirs:
                 custom_target_include_dirs.append(idir)
         return custom_target_include_dirs
@@ -1544,9 +1542,9 @@ class Backend:
         build_root = '.'
         outdir = self.get_custom_target_output_dir(target)
         if absolute_outputs:
-            source_root = self.environment.get_source_dir()
-            build_root = self.environment.get_build_dir()
-            outdir = os.path.join(self.environment.get_build_dir(), outdir)
+            source_root = self.source_dir
+            build_root = self.build_dir
+            outdir = os.path.join(self.build_dir, outdir)
         outputs = [os.path.join(outdir, i) for i in target.get_outputs()]
         inputs = self.get_custom_target_sources(target)
         # Evaluate the command list
@@ -1563,7 +1561,7 @@ class Backend:
             elif isinstance(i, mesonlib.File):
                 i = i.rel_to_builddir(self.build_to_src)
                 if target.absolute_paths or absolute_outputs:
-                    i = os.path.join(self.environment.get_build_dir(), i)
+                    i = os.path.join(self.build_dir, i)
             # FIXME: str types are blindly added ignoring 'target.absolute_paths'
             # because we can't know if they refer to a file or just a string
             elif isinstance(i, str):
@@ -1619,16 +1617,16 @@ class Backend:
     def get_run_target_env(self, target: build.RunTarget) -> mesonlib.EnvironmentVariables:
         env = target.env if target.env else mesonlib.EnvironmentVariables()
         if target.default_env:
-            env.set('MESON_SOURCE_ROOT', [self.environment.get_source_dir()])
-            env.set('MESON_BUILD_ROOT', [self.environment.get_build_dir()])
+            env.set('MESON_SOURCE_ROOT', [self.source_dir])
+            env.set('MESON_BUILD_ROOT', [self.build_dir])
             env.set('MESON_SUBDIR', [target.subdir])
             env.set('MESONINTROSPECT', [self.get_introspect_command()])
         return env
 
     def run_postconf_scripts(self) -> None:
         from ..scripts.meson_exe import run_exe
-        env = {'MESON_SOURCE_ROOT': self.environment.get_source_dir(),
-               'MESON_BUILD_ROOT': self.environment.get_build_dir(),
+        env = {'MESON_SOURCE_ROOT': self.source_dir,
+               'MESON_BUILD_ROOT': self.build_dir,
                'MESONINTROSPECT': self.get_introspect_command(),
                }
 
@@ -1651,8 +1649,8 @@ class Backend:
         umask = self.environment.coredata.get_option(OptionKey('install_umask'))
         assert isinstance(umask, (str, int)), 'for mypy'
 
-        d = InstallData(self.environment.get_source_dir(),
-                        self.environment.get_build_dir(),
+        d = InstallData(self.source_dir,
+                        self.build_dir,
                         self.environment.get_prefix(),
                         self.environment.get_libdir(),
                         strip_bin,
@@ -1838,12 +1836,12 @@ class Backend:
         incroot = self.environment.get_includedir()
         headers = self.build.get_headers()
 
-        srcdir = self.environment.get_source_dir()
-        builddir = self.environment.get_build_dir()
+        srcdir = self.source_dir
+        builddir = self.build_dir
         for h in headers:
-            outdir = outdir_name = h.get_custom_install_dir()
+            outdir = outdir_name = h.custom_install_dir
             if outdir is None:
-                subdir = h.get_install_subdir()
+                subdir = h.install_subdir
                 if subdir is None:
                     outdir = incroot
                     outdir_name = '{includedir}'
@@ -1851,18 +1849,20 @@ class Backend:
                     outdir = os.path.join(incroot, subdir)
                     outdir_name = os.path.join('{includedir}', subdir)
 
-            for f in h.get_sources():
+            for f in h.sources:
                 abspath = f.absolute_path(srcdir, builddir)
-                i = InstallDataBase(abspath, outdir, outdir_name, h.get_custom_install_mode(), h.subproject, tag='devel', follow_symlinks=h.follow_symlinks)
+                i = InstallDataBase(abspath, outdir, outdir_name, h.custom_install_mode, h.subproject, tag='devel', follow_symlinks=h.follow_symlinks)
                 d.headers.append(i)
 
     def generate_man_install(self, d: InstallData) -> None:
         manroot = self.environment.get_mandir()
         man = self.build.get_man()
+        srcdir = self.source_dir
+        builddir = self.build_dir
         for m in man:
-            for f in m.get_sources():
+            for f in m.sources:
                 num = f.split('.')[-1]
-                subdir = m.get_custom_install_dir()
+                subdir = m.custom_install_dir
                 if subdir is None:
                     if m.locale:
                         subdir = os.path.join('{mandir}', m.locale, 'man' + num)
@@ -1871,10 +1871,10 @@ class Backend:
                 fname = f.fname
                 if m.locale: # strip locale from file name
                     fname = fname.replace(f'.{m.locale}', '')
-                srcabs = f.absolute_path(self.environment.get_source_dir(), self.environment.get_build_dir())
+                srcabs = f.absolute_path(srcdir, builddir)
                 dstname = os.path.join(subdir, os.path.basename(fname))
                 dstabs = dstname.replace('{mandir}', manroot)
-                i = InstallDataBase(srcabs, dstabs, dstname, m.get_custom_install_mode(), m.subproject, tag='man')
+                i = InstallDataBase(srcabs, dstabs, dstname, m.custom_install_mode, m.subproject, tag='man')
                 d.man.append(i)
 
     def generate_emptydir_install(self, d: InstallData) -> None:
@@ -1886,8 +1886,8 @@ class Backend:
 
     def generate_data_install(self, d: InstallData) -> None:
         data = self.build.get_data()
-        srcdir = self.environment.get_source_dir()
-        builddir = self.environment.get_build_dir()
+        srcdir = self.source_dir
+        builddir = self.build_dir
         for de in data:
             assert isinstance(de, build.Data)
             subdir = de.install_dir
@@ -1915,9 +1915,9 @@ class Backend:
     def generate_subdir_install(self, d: InstallData) -> None:
         for sd in self.build.get_install_subdirs():
             if sd.from_source_dir:
-                from_dir = self.environment.get_source_dir()
+                from_dir = self.source_dir
             else:
-                from_dir = self.environment.get_build_dir()
+                from_dir = self.build_dir
             src_dir = os.path.join(from_dir,
                                    sd.source_subdir,
                                    sd.installable_subdir).rstrip('/')
@@ -1995,7 +1995,7 @@ class Backend:
             in_default_dir = t.should_install() and not t.get_install_dir()[2]
             if t.for_machine != MachineChoice.HOST or not in_default_dir:
                 continue
-            tdir = os.path.join(self.environment.get_build_dir(), self.get_target_dir(t))
+            tdir = os.path.join(self.build_dir, self.get_target_dir(t))
             if isinstance(t, build.Executable):
                 # Add binaries that are going to be installed in bindir into PATH
                 # so they get used by default instead of searching on system when
@@ -70,9 +70,12 @@ def cmd_quote(arg: str) -> str:
 
     return arg
 
+# The build machine can't change while we run, so only probe it once
+_is_windows = mesonlib.is_windows()
+
 # How ninja executes command lines differs between Unix and Windows
 # (see https://ninja-build.org/manual.html#ref_rule_command)
-if mesonlib.is_windows():
+if _is_windows:
     quote_func = cmd_quote
     execute_wrapper = ['cmd', '/c']  # unused
     rmfile_prefix = ['del', '/f', '/s', '/q', '{}', '&&']
@@ -96,7 +99,7 @@ def get_rsp_threshold() -> int:
     above which a response file should be used.  May be overridden for
     debugging by setting environment variable MESON_RSP_THRESHOLD.'''
 
-    if mesonlib.is_windows():
+    if _is_windows:
         # Usually 32k, but some projects might use cmd.exe,
         # and that has a limit of 8k.
         limit = 8192
@@ -402,7 +405,7 @@ class NinjaBuildElement:
         # do not require quoting, unless explicitly specified, which is necessary for
         # the csc compiler.
         line = line.replace('\\', '/')
-        if mesonlib.is_windows():
+        if _is_windows:
             # Support network paths as backslash, otherwise they are interpreted as
             # arguments for compile/link commands when using MSVC
             line = ' '.join(
@@ -544,7 +547,7 @@ class NinjaBackend(backends.Backend):
             # IFort / masm on windows is MSVC like, but doesn't have /showincludes
             if compiler.language in {'fortran', 'masm'}:
                 continue
-            if compiler.id == 'pgi' and mesonlib.is_windows():
+            if compiler.id == 'pgi' and _is_windows:
                 # for the purpose of this function, PGI doesn't act enough like MSVC
                 return open(tempfilename, 'a', encoding='utf-8')
             if compiler.get_argument_syntax() == 'msvc':
@@ -608,7 +611,7 @@ class NinjaBackend(backends.Backend):
             raise MesonBugException('We do not expect the ninja backend to be given a valid \'vslite_ctx\'')
         ninja = environment.detect_ninja_command_and_version(log=True)
         if self.environment.coredata.get_option(OptionKey('vsenv')):
-            builddir = Path(self.environment.get_build_dir())
+            builddir = Path(self.build_dir)
             try:
                 # For prettier printing, reduce to a relative path. If
                 # impossible (e.g., because builddir and cwd are on
@@ -623,7 +626,7 @@ class NinjaBackend(backends.Backend):
         if ninja is None:
             raise MesonException('Could not detect Ninja v1.8.2 or newer')
         (self.ninja_command, self.ninja_version) = ninja
-        outfilename = os.path.join(self.environment.get_build_dir(), self.ninja_filename)
+        outfilename = os.path.join(self.build_dir, self.ninja_filename)
         tempfilename = outfilename + '~'
         with open(tempfilename, 'w', encoding='utf-8') as outfile:
             outfile.write(f'# This is the build file for project "{self.build.get_project()}"\n')
@@ -705,7 +708,7 @@ class NinjaBackend(backends.Backend):
         """Generate a rust-analyzer compatible rust-project.json file."""
         if not self.rust_crates:
             return
-        with open(os.path.join(self.environment.get_build_dir(), 'rust-project.json'),
+        with open(os.path.join(self.build_dir, 'rust-project.json'),
                   'w', encoding='utf-8') as f:
             json.dump(
                 {
@@ -728,7 +731,7 @@ class NinjaBackend(backends.Backend):
                           for ext in ['', '_RSP']]
         compdb_options = ['-x'] if mesonlib.version_compare(self.ninja_version, '>=1.9') else []
         ninja_compdb = self.ninja_command + ['-t', 'compdb'] + compdb_options + rules
-        builddir = self.environment.get_build_dir()
+        builddir = self.build_dir
         try:
             jsondb = subprocess.check_output(ninja_compdb, cwd=builddir)
             with open(os.path.join(builddir, 'compile_commands.json'), 'wb') as f:
@@ -968,7 +971,7 @@ class NinjaBackend(backends.Backend):
             if self.environment.is_source(rel_src):
                 if is_unity and self.get_target_source_can_unity(target, rel_src):
                     unity_deps.append(raw_src)
-                    abs_src = os.path.join(self.environment.get_build_dir(), rel_src)
+                    abs_src = os.path.join(self.build_dir, rel_src)
                     unity_src.append(abs_src)
                 else:
                     generated_source_files.append(raw_src)
@@ -1049,7 +1052,7 @@ class NinjaBackend(backends.Backend):
                     o, s = self.generate_llvm_ir_compile(target, src)
                     obj_list.append(o)
                 elif is_unity and self.get_target_source_can_unity(target, src):
-                    abs_src = os.path.join(self.environment.get_build_dir(),
+                    abs_src = os.path.join(self.build_dir,
                                            src.rel_to_builddir(self.build_to_src))
                     unity_src.append(abs_src)
                 else:
@@ -1207,7 +1210,7 @@ class NinjaBackend(backends.Backend):
         if target.depfile is not None:
             depfile = target.get_dep_outname(elem.infilenames)
             rel_dfile = os.path.join(self.get_target_dir(target), depfile)
-            abs_pdir = os.path.join(self.environment.get_build_dir(), self.get_target_dir(target))
+            abs_pdir = os.path.join(self.build_dir, self.get_target_dir(target))
             os.makedirs(abs_pdir, exist_ok=True)
             elem.add_item('DEPFILE', rel_dfile)
         if target.console:
@@ -1268,10 +1271,10 @@ class NinjaBackend(backends.Backend):
         elem.add_item('COMMAND', self.environment.get_build_command() +
                       ['--internal', 'coverage'] +
                       outputs +
-                      [self.environment.get_source_dir(),
-                       os.path.join(self.environment.get_source_dir(),
+                      [self.source_dir,
+                       os.path.join(self.source_dir,
                                     self.build.get_subproject_dir()),
-                       self.environment.get_build_dir(),
+                       self.build_dir,
                        self.environment.get_log_dir()] +
                       exe_args +
                       (['--use-llvm-cov'] if use_llvm_cov else []))
@@ -1363,7 +1366,7 @@ class NinjaBackend(backends.Backend):
         c = self.environment.get_build_command() + \
             ['--internal',
              'regenerate',
-             self.environment.get_source_dir(),
+             self.source_dir,
              # Ninja always runs from the build_dir. This includes cases where the user moved the
              # build directory and invalidated most references. Make sure it still regenerates.
              '.']
@@ -1439,7 +1442,7 @@ class NinjaBackend(backends.Backend):
         class_list = self.generate_java_compile(src_list + gen_src_list, target, compiler, compile_args)
         class_dep_list = [os.path.join(self.get_target_private_dir(target), i) for i in class_list]
         manifest_path = os.path.join(self.get_target_private_dir(target), 'META-INF', 'MANIFEST.MF')
-        manifest_fullpath = os.path.join(self.environment.get_build_dir(), manifest_path)
+        manifest_fullpath = os.path.join(self.build_dir, manifest_path)
         os.makedirs(os.path.dirname(manifest_fullpath), exist_ok=True)
         with open(manifest_fullpath, 'w', encoding='utf-8') as manifest:
             if any(target.link_targets):
@@ -1689,8 +1692,8 @@ class NinjaBackend(backends.Backend):
             if isinstance(gensrc, (build.CustomTarget, build.GeneratedList)) or gensrc.is_built:
                 vala_c_file = os.path.splitext(os.path.basename(vala_file))[0] + '.c'
                 # Check if the vala file is in a subdir of --basedir
-                abs_srcbasedir = os.path.join(self.environment.get_source_dir(), target.get_subdir())
-                abs_vala_file = os.path.join(self.environment.get_build_dir(), vala_file)
+                abs_srcbasedir = os.path.join(self.source_dir, target.get_subdir())
+                abs_vala_file = os.path.join(self.build_dir, vala_file)
                 if PurePath(os.path.commonpath((abs_srcbasedir, abs_vala_file))) == PurePath(abs_srcbasedir):
                     vala_c_subdir = PurePath(abs_vala_file).parent.relative_to(abs_srcbasedir)
                     vala_c_file = os.path.join(str(vala_c_subdir), vala_c_file)
@@ -1801,7 +1804,7 @@ class NinjaBackend(backends.Backend):
                 element = NinjaBuildElement(
                     self.all_outputs, [output],
                     self.compiler_to_rule_name(cython),
-                    [src.absolute_path(self.environment.get_source_dir(), self.environment.get_build_dir())])
+                    [src.absolute_path(self.source_dir, self.build_dir)])
                 element.add_item('ARGS', args)
                 self.add_build(element)
                 # TODO: introspection?
@@ -2113,7 +2116,7 @@ class NinjaBackend(backends.Backend):
                 target_slashname_workaround_dir = self.get_target_dir(target)
             rpath_args, target.rpath_dirs_to_remove = (
                 rustc.build_rpath_args(self.environment,
-                                       self.environment.get_build_dir(),
+                                       self.build_dir,
                                        target_slashname_workaround_dir,
                                        self.determine_rpath_dirs(target),
                                        target.build_rpath,
@@ -2205,12 +2208,12 @@ class NinjaBackend(backends.Backend):
         for i in target.get_sources():
             if swiftc.can_compile(i):
                 rels = i.rel_to_builddir(self.build_to_src)
-                abss = os.path.normpath(os.path.join(self.environment.get_build_dir(), rels))
+                abss = os.path.normpath(os.path.join(self.build_dir, rels))
                 relsrc.append(rels)
                 abssrc.append(abss)
             elif self.environment.is_header(i):
                 relh = i.rel_to_builddir(self.build_to_src)
-                absh = os.path.normpath(os.path.join(self.environment.get_build_dir(), relh))
+                absh = os.path.normpath(os.path.join(self.build_dir, relh))
                 abs_headers.append(absh)
                 header_imports += swiftc.get_header_import_args(absh)
             else:
@@ -2226,11 +2229,11 @@ class NinjaBackend(backends.Backend):
                     expdir = os.path.join(basedir, d)
                 else:
                     expdir = basedir
-                srctreedir = os.path.normpath(os.path.join(self.environment.get_build_dir(), self.build_to_src, expdir))
+                srctreedir = os.path.normpath(os.path.join(self.build_dir, self.build_to_src, expdir))
                 sargs = swiftc.get_include_args(srctreedir, False)
                 compile_args += sargs
         compile_args += target.get_extra_args('swift')
-        link_args = swiftc.get_output_args(os.path.join(self.environment.get_build_dir(), self.get_target_filename(target)))
+        link_args = swiftc.get_output_args(os.path.join(self.build_dir, self.get_target_filename(target)))
         link_args += self.build.get_project_link_args(swiftc, target.subproject, target.for_machine)
         link_args += self.build.get_global_link_args(swiftc, target.for_machine)
         rundir = self.get_target_private_dir(target)
@@ -2241,14 +2244,14 @@ class NinjaBackend(backends.Backend):
         for x in abs_module_dirs:
             module_includes += swiftc.get_include_args(x, False)
         link_deps = self.get_swift_link_deps(target)
-        abs_link_deps = [os.path.join(self.environment.get_build_dir(), x) for x in link_deps]
+        abs_link_deps = [os.path.join(self.build_dir, x) for x in link_deps]
         for d in target.link_targets:
             reldir = self.get_target_dir(d)
             if reldir == '':
                 reldir = '.'
-            link_args += ['-L', os.path.normpath(os.path.join(self.environment.get_build_dir(), reldir))]
+            link_args += ['-L', os.path.normpath(os.path.join(self.build_dir, reldir))]
         (rel_generated, _) = self.split_swift_generated_sources(target)
-        abs_generated = [os.path.join(self.environment.get_build_dir(), x) for x in rel_generated]
+        abs_generated = [os.path.join(self.build_dir, x) for x in rel_generated]
         # We need absolute paths because swiftc needs to be invoked in a subdir
         # and this is the easiest way about it.
         objects = [] # Relative to swift invocation dir
@@ -2315,7 +2318,7 @@ class NinjaBackend(backends.Backend):
             #        them out to fix this properly on Windows. See:
             # https://github.com/mesonbuild/meson/issues/1517
             # https://github.com/mesonbuild/meson/issues/1526
-            if isinstance(static_linker, ArLikeLinker) and not mesonlib.is_windows():
+            if isinstance(static_linker, ArLikeLinker) and not _is_windows:
                 # `ar` has no options to overwrite archives. It always appends,
                 # which is never what we want. Delete an existing library first if
                 # it exists. https://github.com/mesonbuild/meson/issues/1355
@@ -2377,7 +2380,7 @@ class NinjaBackend(backends.Backend):
         args = self.environment.get_build_command() + \
             ['--internal',
              'symbolextractor',
-             self.environment.get_build_dir(),
+             self.build_dir,
              '$in',
              '$IMPLIB',
              '$out']
@@ -2399,7 +2402,7 @@ class NinjaBackend(backends.Backend):
         args = ['$ARGS', '$in']
         description = 'Compiling C Sharp target $out'
         self.add_rule(NinjaRule(rule, command, args, description,
-                                rspable=mesonlib.is_windows(),
+                                rspable=_is_windows,
                                 rspfile_quote_style=compiler.rsp_file_syntax()))
 
     def generate_vala_compile_rules(self, compiler) -> None:
@@ -2454,7 +2457,7 @@ class NinjaBackend(backends.Backend):
         if self.use_dyndeps_for_fortran():
             return
         rule = f'FORTRAN_DEP_HACK{crstr}'
-        if mesonlib.is_windows():
+        if _is_windows:
             cmd = ['cmd', '/C']
         else:
             cmd = ['true']
@@ -2632,7 +2635,7 @@ https://gcc.gnu.org/bugzilla/show_bug.cgi?id=47485'''))
                                                         self.replace_extra_args(args, genlist),
                                                         capture=outfiles[0] if generator.capture else None,
                                                         env=genlist.env)
-            abs_pdir = os.path.join(self.environment.get_build_dir(), self.get_target_dir(target))
+            abs_pdir = os.path.join(self.build_dir, self.get_target_dir(target))
             os.makedirs(abs_pdir, exist_ok=True)
 
             elem = NinjaBuildElement(self.all_outputs, outfiles, rulename, infilename)
@@ -2682,8 +2685,8 @@ https://gcc.gnu.org/bugzilla/show_bug.cgi?id=47485'''))
             # the configuration (configure_file() is OK)
             if not compiler.can_compile(s):
                 continue
-            filename = s.absolute_path(self.environment.get_source_dir(),
-                                       self.environment.get_build_dir())
+            filename = s.absolute_path(self.source_dir,
+                                       self.build_dir)
             # Fortran keywords must be ASCII.
             with open(filename, encoding='ascii', errors='ignore') as f:
                 for line in f:
@@ -2847,7 +2850,7 @@ https://gcc.gnu.org/bugzilla/show_bug.cgi?id=47485'''))
         # inc = include_directories('foo/bar/baz')
         #
         # But never subdir()s into the actual dir.
-        if os.path.isdir(os.path.join(self.environment.get_build_dir(), expdir)):
+        if os.path.isdir(os.path.join(self.build_dir, expdir)):
             bargs = compiler.get_include_args(expdir, is_system)
         else:
             bargs = []
@@ -2994,7 +2997,7 @@ https://gcc.gnu.org/bugzilla/show_bug.cgi?id=47485'''))
         else:
             self.create_target_source_introspection(target, compiler, commands, [], [src], unity_sources)
 
-        build_dir = self.environment.get_build_dir()
+        build_dir = self.build_dir
         if isinstance(src, File):
             rel_src = src.rel_to_builddir(self.build_to_src)
             if os.path.isabs(rel_src):
@@ -3344,7 +3347,7 @@ https://gcc.gnu.org/bugzilla/show_bug.cgi?id=47485'''))
         libs = OrderedSet()
         absolute_libs = []
 
-        build_dir = self.environment.get_build_dir()
+        build_dir = self.build_dir
         # the following loop sometimes consumes two items from command in one pass
         it = iter(linker.native_args_to_unix(commands))
         for item in it:
@@ -3444,7 +3447,7 @@ https://gcc.gnu.org/bugzilla/show_bug.cgi?id=47485'''))
             commands += compilers.get_base_link_args(target.get_options(),
                                                      linker,
                                                      isinstance(target, build.SharedModule),
-                                                     self.environment.get_build_dir())
+                                                     self.build_dir)
         # Add -nostdlib if needed; can't be overridden
         commands += self.get_no_stdlib_link_args(target, linker)
         # Add things like /NOLOGO; usually can't be overridden
@@ -3490,7 +3493,7 @@ https://gcc.gnu.org/bugzilla/show_bug.cgi?id=47485'''))
             target_slashname_workaround_dir = self.get_target_dir(target)
         (rpath_args, target.rpath_dirs_to_remove) = (
             linker.build_rpath_args(self.environment,
-                                    self.environment.get_build_dir(),
+                                    self.build_dir,
                                     target_slashname_workaround_dir,
                                     self.determine_rpath_dirs(target),
                                     target.build_rpath,
@@ -3565,14 +3568,14 @@ https://gcc.gnu.org/bugzilla/show_bug.cgi?id=47485'''))
             if t.is_built:
                 return t.relative_name()
             else:
-                return t.absolute_path(self.environment.get_source_dir(),
-                                       self.environment.get_build_dir())
+                return t.absolute_path(self.source_dir,
+                                       self.build_dir)
         return self.get_target_filename(t)
 
     def generate_shlib_aliases(self, target, outdir) -> None:
         for alias, to, tag in target.get_aliases():
             aliasfile = os.path.join(outdir, alias)
-            abs_aliasfile = os.path.join(self.environment.get_build_dir(), outdir, alias)
+            abs_aliasfile = os.path.join(self.build_dir, outdir, alias)
             try:
                 os.remove(abs_aliasfile)
             except Exception:
@@ -3588,7 +3591,7 @@ https://gcc.gnu.org/bugzilla/show_bug.cgi?id=47485'''))
 
     def generate_custom_target_clean(self, trees: T.List[str]) -> str:
         e = self.create_phony_target('clean-ctlist', 'CUSTOM_COMMAND', 'PHONY')
-        d = CleanTrees(self.environment.get_build_dir(), trees)
+        d = CleanTrees(self.build_dir, trees)
         d_file = os.path.join(self.environment.get_scratch_dir(), 'cleantrees.dat')
         e.add_item('COMMAND', self.environment.get_build_command() + ['--internal', 'cleantrees', d_file])
         e.add_item('description', 'Cleaning custom target directories')
@@ -1828,6 +1828,10 @@ class Generator(HoldableObject):
             extra_args=extra_args if extra_args is not None else [],
             env=env if env is not None else EnvironmentVariables())
 
+        source_dir = state.environment.source_dir
+        build_dir = state.environment.build_dir
+        subdir = state.subdir
+
         for e in files:
             if isinstance(e, (CustomTarget, CustomTargetIndex)):
                 output.depends.add(e)
@@ -1838,13 +1842,13 @@ class Generator(HoldableObject):
                 output.depends.add(e)
                 fs = [FileInTargetPrivateDir(f) for f in e.get_outputs()]
             elif isinstance(e, str):
-                fs = [File.from_source_file(state.environment.source_dir, state.subdir, e)]
+                fs = [File.from_source_file(source_dir, subdir, e)]
             else:
                 fs = [e]
 
             for f in fs:
                 if preserve_path_from:
-                    abs_f = f.absolute_path(state.environment.source_dir, state.environment.build_dir)
+                    abs_f = f.absolute_path(source_dir, build_dir)
                     if not self.is_parent_path(preserve_path_from, abs_f):
                         raise InvalidArguments('generator.process: When using preserve_path_from, all input files must be in a subdirectory of the given dir.')
                 f = FileMaybeInTargetPrivateDir(f)
@@ -27,8 +27,10 @@ __all__ = [
     'SUFFIX_TO_LANG',
 
     'compiler_from_language',
+    'compiler_is_stale',
     'detect_compiler_for',
     'detect_static_linker',
+    'prefetch_compiler_probes',
     'detect_c_compiler',
     'detect_cpp_compiler',
     'detect_cuda_compiler',
@@ -69,8 +71,10 @@ from .compilers import (
 )
 from .detect import (
     compiler_from_language,
+    compiler_is_stale,
     detect_compiler_for,
     detect_static_linker,
+    prefetch_compiler_probes,
     detect_c_compiler,
     detect_cpp_compiler,
     detect_cuda_compiler,
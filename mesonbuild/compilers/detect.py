@@ -12,6 +12,10 @@ from .. import mlog
 
 from ..linkers import guess_win_linker, guess_nix_linker
 
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+import contextlib
+import errno
 import subprocess
 import platform
 import re
@@ -80,6 +84,13 @@ defaults['gcc_static_linker'] = ['gcc-ar']
 defaults['clang_static_linker'] = ['llvm-ar']
 defaults['nasm'] = ['nasm', 'yasm']
 
+# Programs which take MSVC style arguments, and so have to be asked for their
+# version with /? rather than --version.
+_CL_NAMES = frozenset({'cl', 'cl.exe', 'clang-cl', 'clang-cl.exe'})
+_LIB_NAMES = frozenset({'lib', 'lib.exe', 'llvm-lib', 'llvm-lib.exe', 'xilib', 'xilib.exe'})
+# TI and ARM archivers, which print their version with ?
+_TI_AR_NAMES = frozenset({'ar2000', 'ar2000.exe', 'ar430', 'ar430.exe', 'armar', 'armar.exe', 'ar6x', 'ar6x.exe'})
+
 
 def compiler_from_language(env: 'Environment', lang: str, for_machine: MachineChoice) -> T.Optional[Compiler]:
     lang_map: T.Dict[str, T.Callable[['Environment', MachineChoice], Compiler]] = {
@@ -110,8 +121,36 @@ def detect_compiler_for(env: 'Environment', lang: str, for_machine: MachineChoic
     if not skip_sanity_check:
         comp.sanity_check(env.get_scratch_dir(), env)
     env.coredata.compilers[comp.for_machine][lang] = comp
+    env.coredata.compiler_stamps[comp.for_machine][lang] = get_compiler_stamp(comp)
     return comp
 
+def get_compiler_stamp(comp: Compiler) -> T.Optional[T.Tuple[int, int]]:
+    """Get the (mtime, size) of the compiler binary.
+
+    This is stored alongside a detected compiler so that a reconfigure can
+    reuse the compiler without probing it again, unless it has changed on disk.
+    """
+    exe = shutil.which(comp.get_exelist(ccache=False)[0])
+    if exe is None:
+        return None
+    try:
+        st = os.stat(exe)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+def compiler_is_stale(env: 'Environment', lang: str, comp: Compiler) -> bool:
+    """Check whether a compiler stored in coredata must be detected again.
+
+    If the binary can't be found, either now or when it was detected, there
+    is nothing to compare, and the stored compiler is kept as it always was.
+    """
+    stamp = env.coredata.compiler_stamps[comp.for_machine].get(lang)
+    if stamp is None:
+        return False
+    current = get_compiler_stamp(comp)
+    return current is not None and current != stamp
+
 
 # Helpers
 # =======
@@ -148,6 +187,88 @@ def _handle_exceptions(
             errmsg += f'\nRunning `{c}` gave "{e}"'
     raise EnvironmentException(errmsg)
 
+# Version probes started ahead of time, see _prefetch_probes()
+_prefetched_probes: T.Dict[T.Tuple[str, ...], Future[T.Tuple[subprocess.Popen[str], str, str]]] = {}
+
+@contextlib.contextmanager
+def _prefetch_probes(cmds: T.Iterable[T.List[str]]) -> T.Iterator[None]:
+    """Start running the given compiler probes concurrently.
+
+    Running a compiler to ask for its version is dominated by process startup,
+    so independent probes can overlap instead of waiting on each other. The
+    results are picked up in order by _probe_compiler(), which is also what
+    logs them, so the log does not depend on which probe finished first.
+    Probes which end up not being needed are discarded.
+    """
+    keys = [tuple(c) for c in cmds]
+    keys = [k for k in dict.fromkeys(keys)
+            if k not in _prefetched_probes and shutil.which(k[0]) is not None]
+    if not keys:
+        yield
+        return
+    with ThreadPoolExecutor(max_workers=len(keys)) as executor:
+        for k in keys:
+            _prefetched_probes[k] = executor.submit(Popen_safe, list(k))
+        try:
+            yield
+        finally:
+            for k in keys:
+                _prefetched_probes.pop(k, None)
+
+def _probe_compiler(cmd: T.List[str]) -> T.Tuple[subprocess.Popen[str], str, str]:
+    future = _prefetched_probes.pop(tuple(cmd), None)
+    if future is None:
+        # Looking the program up is much cheaper than failing to spawn it,
+        # which matters when most of the candidates are not installed.
+        if shutil.which(cmd[0]) is None:
+            excp = FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), cmd[0])
+            mlog.debug('-----------')
+            mlog.debug(f'Detecting compiler via: `{join_args(cmd)}` -> {excp}')
+            raise excp
+        return Popen_safe_logged(cmd, msg='Detecting compiler via')
+    try:
+        p, o, e = future.result()
+    except Exception as excp:
+        mlog.debug('-----------')
+        mlog.debug(f'Detecting compiler via: `{join_args(cmd)}` -> {excp}')
+        raise
+    mlog.debug('-----------')
+    mlog.debug(f'Detecting compiler via: `{join_args(cmd)}` -> {p.returncode}')
+    if o and o.strip():
+        mlog.debug(f'stdout:\n{o.strip()}\n-----------')
+    if e and e.strip():
+        mlog.debug(f'stderr:\n{e.strip()}\n-----------')
+    return p, o, e
+
+def _get_version_probes(env: 'Environment', lang: str, for_machine: MachineChoice) -> T.List[T.List[str]]:
+    """Get the commands run first when detecting the compiler for a language."""
+    if lang not in {'c', 'cpp', 'objc', 'objcpp', 'fortran'}:
+        return []
+    try:
+        compilers, _ = _get_compilers(env, lang, for_machine)
+    except EnvironmentException:
+        # Detection itself will report this
+        return []
+    compiler = compilers[0]
+    if lang == 'fortran':
+        return [compiler + ['--help'], compiler + ['--version']]
+    if lang in {'objc', 'objcpp'}:
+        return [compiler + ['--version']]
+    arg = _get_c_or_cpp_version_arg(compiler)
+    return [compiler + [arg]] if arg is not None else []
+
+def prefetch_compiler_probes(env: 'Environment', langs: T.Iterable[str],
+                             for_machine: MachineChoice) -> T.ContextManager[None]:
+    """Probe the most likely compiler of each language concurrently.
+
+    Use this around detecting the compilers of several languages at once, the
+    detection itself still happens in order, in the calling thread.
+    """
+    probes: T.List[T.List[str]] = []
+    for lang in langs:
+        probes.extend(_get_version_probes(env, lang, for_machine))
+    return _prefetch_probes(probes)
+
 
 # Linker specific
 # ===============
@@ -192,11 +313,12 @@ def detect_static_linker(env: 'Environment', compiler: Compiler) -> StaticLinker
             trials = default_linkers
     popen_exceptions = {}
     for linker in trials:
-        linker_name = os.path.basename(linker[0])
+        linker_names = [os.path.basename(x) for x in linker]
+        linker_name = linker_names[0]
 
-        if any(os.path.basename(x) in {'lib', 'lib.exe', 'llvm-lib', 'llvm-lib.exe', 'xilib', 'xilib.exe'} for x in linker):
+        if not _LIB_NAMES.isdisjoint(linker_names):
             arg = '/?'
-        elif linker_name in {'ar2000', 'ar2000.exe', 'ar430', 'ar430.exe', 'armar', 'armar.exe', 'ar6x', 'ar6x.exe'}:
+        elif linker_name in _TI_AR_NAMES:
             arg = '?'
         else:
             arg = '--version'
@@ -256,6 +378,88 @@ def detect_static_linker(env: 'Environment', compiler: Compiler) -> StaticLinker
 # =========
 
 
+def _get_c_or_cpp_version_arg(compiler: T.List[str]) -> T.Optional[str]:
+    """Get the argument that makes a C or C++ compiler print its version.
+
+    Returns None if the compiler must not be run at all.
+    """
+    compiler_name = os.path.basename(compiler[0])
+
+    if not _CL_NAMES.isdisjoint(os.path.basename(x) for x in compiler):
+        # Watcom C provides it's own cl.exe clone that mimics an older
+        # version of Microsoft's compiler. Since Watcom's cl.exe is
+        # just a wrapper, we skip using it if we detect its presence
+        # so as not to confuse Meson when configuring for MSVC.
+        #
+        # Additionally the help text of Watcom's cl.exe is paged, and
+        # the binary will not exit without human intervention. In
+        # practice, Meson will block waiting for Watcom's cl.exe to
+        # exit, which requires user input and thus will never exit.
+        if 'WATCOM' in os.environ:
+            def sanitize(p: T.Optional[str]) -> T.Optional[str]:
+                return os.path.normcase(os.path.abspath(p)) if p else None
+
+            watcom_cls = [sanitize(os.path.join(os.environ['WATCOM'], 'BINNT', 'cl')),
+                          sanitize(os.path.join(os.environ['WATCOM'], 'BINNT', 'cl.exe')),
+                          sanitize(os.path.join(os.environ['WATCOM'], 'BINNT64', 'cl')),
+                          sanitize(os.path.join(os.environ['WATCOM'], 'BINNT64', 'cl.exe'))]
+            found_cl = sanitize(shutil.which('cl'))
+            if found_cl in watcom_cls:
+                mlog.debug('Skipping unsupported cl.exe clone at:', found_cl)
+                return None
+        return '/?'
+    elif 'armcc' in compiler_name:
+        return '--vsn'
+    elif 'ccrx' in compiler_name:
+        return '-v'
+    elif 'xc16' in compiler_name:
+        return '--version'
+    elif 'ccomp' in compiler_name:
+        return '-version'
+    elif compiler_name in {'cl2000', 'cl2000.exe', 'cl430', 'cl430.exe', 'armcl', 'armcl.exe', 'cl6x', 'cl6x.exe'}:
+        # TI compiler
+        return '-version'
+    elif compiler_name in {'icl', 'icl.exe'}:
+        # if you pass anything to icl you get stuck in a pager
+        return ''
+    else:
+        return '--version'
+
+
+_CCompilerRule = T.Tuple[str, T.Type['CCompiler'], T.Union[T.Type['CCompiler'], T.Type['CPPCompiler']],
+                         T.Callable[[T.List[str], MachineChoice, str], 'DynamicLinker']]
+
+@lru_cache(maxsize=None)
+def _get_c_or_cpp_rules() -> T.Tuple[T.Tuple[_CCompilerRule, ...], T.Tuple[_CCompilerRule, ...]]:
+    """Get the C and C++ compilers which are recognised by a string in their
+    version output and only need a linker of a fixed type.
+
+    Each rule is (identifier, C class, C++ class, linker factory). The first
+    set has to be checked before Clang, the second one after all the other
+    compilers. Microchip and CompCert only have a C compiler.
+    """
+    from . import c, cpp
+    from ..linkers import linkers
+    ti_rules: T.Tuple[_CCompilerRule, ...] = (
+        ('TMS320C2000 C/C++', c.C2000CCompiler, cpp.C2000CPPCompiler,
+         lambda exe, m, v: linkers.C2000DynamicLinker(exe, m, version=v)),
+        ('TMS320C6x C/C++', c.C6000CCompiler, cpp.C6000CPPCompiler,
+         lambda exe, m, v: linkers.C6000DynamicLinker(exe, m, version=v)),
+        ('TI ARM C/C++ Compiler', c.TICCompiler, cpp.TICPPCompiler,
+         lambda exe, m, v: linkers.TIDynamicLinker(exe, m, version=v)),
+        ('MSP430 C/C++', c.TICCompiler, cpp.TICPPCompiler,
+         lambda exe, m, v: linkers.TIDynamicLinker(exe, m, version=v)),
+    )
+    embedded_rules: T.Tuple[_CCompilerRule, ...] = (
+        ('RX Family', c.CcrxCCompiler, cpp.CcrxCPPCompiler,
+         lambda exe, m, v: linkers.CcrxDynamicLinker(m, version=v)),
+        ('Microchip Technology', c.Xc16CCompiler, c.Xc16CCompiler,
+         lambda exe, m, v: linkers.Xc16DynamicLinker(m, version=v)),
+        ('CompCert', c.CompCertCCompiler, c.CompCertCCompiler,
+         lambda exe, m, v: linkers.CompCertDynamicLinker(m, version=v)),
+    )
+    return ti_rules, embedded_rules
+
 def _detect_c_or_cpp_compiler(env: 'Environment', lang: str, for_machine: MachineChoice, *, override_compiler: T.Optional[T.List[str]] = None) -> Compiler:
     """Shared implementation for finding the C or C++ compiler to use.
 
@@ -278,50 +482,13 @@ def _detect_c_or_cpp_compiler(env: 'Environment', lang: str, for_machine: Machin
         if isinstance(compiler, str):
             compiler = [compiler]
         compiler_name = os.path.basename(compiler[0])
-
-        if any(os.path.basename(x) in {'cl', 'cl.exe', 'clang-cl', 'clang-cl.exe'} for x in compiler):
-            # Watcom C provides it's own cl.exe clone that mimics an older
-            # version of Microsoft's compiler. Since Watcom's cl.exe is
-            # just a wrapper, we skip using it if we detect its presence
-            # so as not to confuse Meson when configuring for MSVC.
-            #
-            # Additionally the help text of Watcom's cl.exe is paged, and
-            # the binary will not exit without human intervention. In
-            # practice, Meson will block waiting for Watcom's cl.exe to
-            # exit, which requires user input and thus will never exit.
-            if 'WATCOM' in os.environ:
-                def sanitize(p: T.Optional[str]) -> T.Optional[str]:
-                    return os.path.normcase(os.path.abspath(p)) if p else None
-
-                watcom_cls = [sanitize(os.path.join(os.environ['WATCOM'], 'BINNT', 'cl')),
-                              sanitize(os.path.join(os.environ['WATCOM'], 'BINNT', 'cl.exe')),
-                              sanitize(os.path.join(os.environ['WATCOM'], 'BINNT64', 'cl')),
-                              sanitize(os.path.join(os.environ['WATCOM'], 'BINNT64', 'cl.exe'))]
-                found_cl = sanitize(shutil.which('cl'))
-                if found_cl in watcom_cls:
-                    mlog.debug('Skipping unsupported cl.exe clone at:', found_cl)
-                    continue
-            arg = '/?'
-        elif 'armcc' in compiler_name:
-            arg = '--vsn'
-        elif 'ccrx' in compiler_name:
-            arg = '-v'
-        elif 'xc16' in compiler_name:
-            arg = '--version'
-        elif 'ccomp' in compiler_name:
-            arg = '-version'
-        elif compiler_name in {'cl2000', 'cl2000.exe', 'cl430', 'cl430.exe', 'armcl', 'armcl.exe', 'cl6x', 'cl6x.exe'}:
-            # TI compiler
-            arg = '-version'
-        elif compiler_name in {'icl', 'icl.exe'}:
-            # if you pass anything to icl you get stuck in a pager
-            arg = ''
-        else:
-            arg = '--version'
+        arg = _get_c_or_cpp_version_arg(compiler)
+        if arg is None:
+            continue
 
         cmd = compiler + [arg]
         try:
-            p, out, err = Popen_safe_logged(cmd, msg='Detecting compiler via')
+            p, out, err = _probe_compiler(cmd)
         except OSError as e:
             popen_exceptions[join_args(cmd)] = e
             continue
@@ -370,7 +537,7 @@ def _detect_c_or_cpp_compiler(env: 'Environment', lang: str, for_machine: Machin
             # linker version.
             with tempfile.NamedTemporaryFile(suffix='.c') as f:
                 cmd = compiler + [cls.LINKER_PREFIX + "--version", f.name]
-                _, o, _ = Popen_safe(cmd)
+                _, o, _ = Popen_safe(cmd, stderr=subprocess.DEVNULL)
 
             linker = linkers.WASMDynamicLinker(
                 compiler, for_machine, cls.LINKER_PREFIX,
@@ -432,21 +599,14 @@ def _detect_c_or_cpp_compiler(env: 'Environment', lang: str, for_machine: Machin
                 linker=linker)
 
         # must be detected here before clang because TI compilers contain 'clang' in their output and so that they can be detected as 'clang'
-        ti_compilers = {
-           'TMS320C2000 C/C++': (c.C2000CCompiler, cpp.C2000CPPCompiler, linkers.C2000DynamicLinker),
-           'TMS320C6x C/C++': (c.C6000CCompiler, cpp.C6000CPPCompiler, linkers.C6000DynamicLinker),
-           'TI ARM C/C++ Compiler': (c.TICCompiler, cpp.TICPPCompiler, linkers.TIDynamicLinker),
-           'MSP430 C/C++': (c.TICCompiler, cpp.TICPPCompiler, linkers.TIDynamicLinker)
-        }
-        for identifier, compiler_classes in ti_compilers.items():
+        ti_rules, embedded_rules = _get_c_or_cpp_rules()
+        for identifier, c_cls, cpp_cls, make_linker in ti_rules:
             if identifier in out:
-                cls = compiler_classes[0] if lang == 'c' else compiler_classes[1]
-                lnk = compiler_classes[2]
+                cls = c_cls if lang == 'c' else cpp_cls
                 env.coredata.add_lang_args(cls.language, cls, for_machine, env)
-                linker = lnk(compiler, for_machine, version=version)
                 return cls(
                     ccache, compiler, version, for_machine, is_cross, info,
-                    full_version=full_version, linker=linker)
+                    full_version=full_version, linker=make_linker(compiler, for_machine, version))
 
         if 'clang' in out or 'Clang' in out:
             linker = None
@@ -552,29 +712,13 @@ def _detect_c_or_cpp_compiler(env: 'Environment', lang: str, for_machine: Machin
             return cls(
                 ccache, compiler, version, for_machine, is_cross,
                 info, full_version=full_version, linker=linker)
-        if 'RX Family' in out:
-            cls = c.CcrxCCompiler if lang == 'c' else cpp.CcrxCPPCompiler
-            env.coredata.add_lang_args(cls.language, cls, for_machine, env)
-            linker = linkers.CcrxDynamicLinker(for_machine, version=version)
-            return cls(
-                ccache, compiler, version, for_machine, is_cross, info,
-                full_version=full_version, linker=linker)
-
-        if 'Microchip Technology' in out:
-            cls = c.Xc16CCompiler
-            env.coredata.add_lang_args(cls.language, cls, for_machine, env)
-            linker = linkers.Xc16DynamicLinker(for_machine, version=version)
-            return cls(
-                ccache, compiler, version, for_machine, is_cross, info,
-                full_version=full_version, linker=linker)
-
-        if 'CompCert' in out:
-            cls = c.CompCertCCompiler
-            env.coredata.add_lang_args(cls.language, cls, for_machine, env)
-            linker = linkers.CompCertDynamicLinker(for_machine, version=version)
-            return cls(
-                ccache, compiler, version, for_machine, is_cross, info,
-                full_version=full_version, linker=linker)
+        for identifier, c_cls, cpp_cls, make_linker in embedded_rules:
+            if identifier in out:
+                cls = c_cls if lang == 'c' else cpp_cls
+                env.coredata.add_lang_args(cls.language, cls, for_machine, env)
+                return cls(
+                    ccache, compiler, version, for_machine, is_cross, info,
+                    full_version=full_version, linker=make_linker(compiler, for_machine, version))
 
         if 'Metrowerks C/C++' in out or 'Freescale C/C++' in out:
             if 'ARM' in out:
@@ -592,7 +736,7 @@ def _detect_c_or_cpp_compiler(env: 'Environment', lang: str, for_machine: Machin
             ld = env.lookup_binary_entry(for_machine, cls.language + '_ld')
 
             if ld is not None:
-                _, o_ld, _ = Popen_safe(ld + ['--version'])
+                _, o_ld, _ = Popen_safe(ld + ['--version'], stderr=subprocess.DEVNULL)
 
                 mwld_ver_match = re.search(r'Version (\d+)\.(\d+)\.?(\d+)? build (\d+)', o_ld)
                 assert mwld_ver_match is not None, 'for mypy'  # because mypy *should* be complaning that this could be None
@@ -663,14 +807,14 @@ def detect_fortran_compiler(env: 'Environment', for_machine: MachineChoice) -> C
     for compiler in compilers:
         # capture help text for possible fallback
         try:
-            _, help_out, _ = Popen_safe_logged(compiler + ['--help'], msg='Detecting compiler via')
+            _, help_out, _ = _probe_compiler(compiler + ['--help'])
         except OSError as e:
             popen_exceptions[join_args(compiler + ['--help'])] = e
             help_out = ''
 
         for arg in ['--version', '-V']:
             try:
-                p, out, err = Popen_safe_logged(compiler + [arg], msg='Detecting compiler via')
+                p, out, err = _probe_compiler(compiler + [arg])
             except OSError as e:
                 popen_exceptions[join_args(compiler + [arg])] = e
                 continue
@@ -857,7 +1001,7 @@ def _detect_objc_or_objcpp_compiler(env: 'Environment', lang: str, for_machine:
     for compiler in compilers:
         arg = ['--version']
         try:
-            p, out, err = Popen_safe_logged(compiler + arg, msg='Detecting compiler via')
+            p, out, err = _probe_compiler(compiler + arg)
         except OSError as e:
             popen_exceptions[join_args(compiler + arg)] = e
             continue
@@ -907,7 +1051,7 @@ def detect_java_compiler(env: 'Environment', for_machine: MachineChoice) -> Comp
         exelist = [defaults['java'][0]]
 
     try:
-        p, out, err = Popen_safe_logged(exelist + ['-version'], msg='Detecting compiler via')
+        p, out, err = _probe_compiler(exelist + ['-version'])
     except OSError:
         raise EnvironmentException('Could not execute Java compiler: {}'.format(join_args(exelist)))
     if 'javac' in out or 'javac' in err:
@@ -928,7 +1072,7 @@ def detect_cs_compiler(env: 'Environment', for_machine: MachineChoice) -> Compil
     info = env.machines[for_machine]
     for comp in compilers:
         try:
-            p, out, err = Popen_safe_logged(comp + ['--version'], msg='Detecting compiler via')
+            p, out, err = _probe_compiler(comp + ['--version'])
         except OSError as e:
             popen_exceptions[join_args(comp + ['--version'])] = e
             continue
@@ -986,7 +1130,7 @@ def detect_vala_compiler(env: 'Environment', for_machine: MachineChoice) -> Comp
         exelist = [defaults['vala'][0]]
 
     try:
-        p, out = Popen_safe_logged(exelist + ['--version'], msg='Detecting compiler via')[0:2]
+        p, out = _probe_compiler(exelist + ['--version'])[0:2]
     except OSError:
         raise EnvironmentException('Could not execute Vala compiler: {}'.format(join_args(exelist)))
     version = search_version(out)
@@ -1011,7 +1155,7 @@ def detect_rust_compiler(env: 'Environment', for_machine: MachineChoice) -> Rust
     for compiler in compilers:
         arg = ['--version']
         try:
-            out = Popen_safe_logged(compiler + arg, msg='Detecting compiler via')[1]
+            out = _probe_compiler(compiler + arg)[1]
         except OSError as e:
             popen_exceptions[join_args(compiler + arg)] = e
             continue
@@ -1337,7 +1481,7 @@ def detect_masm_compiler(env: 'Environment', for_machine: MachineChoice) -> Comp
 
     popen_exceptions: T.Dict[str, Exception] = {}
     try:
-        output = Popen_safe(comp + [arg])[2]
+        output = Popen_safe(comp + [arg], stdout=subprocess.DEVNULL)[2]
         version = search_version(output)
         env.coredata.add_lang_args(comp_class.language, comp_class, for_machine, env)
         return comp_class([], comp, version, for_machine, info, cc.linker, is_cross=is_cross)
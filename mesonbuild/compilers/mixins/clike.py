@@ -1195,7 +1195,7 @@ class CLikeCompiler(Compiler):
         mlog.debug('Finding framework path by running: ', ' '.join(commands), '\n')
         os_env = os.environ.copy()
         os_env['LC_ALL'] = 'C'
-        _, _, stde = mesonlib.Popen_safe(commands, env=os_env, stdin=subprocess.PIPE)
+        _, _, stde = mesonlib.Popen_safe(commands, env=os_env, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL)
         paths: T.List[str] = []
         for line in stde.split('\n'):
             if '(framework directory)' not in line:
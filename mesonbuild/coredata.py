@@ -262,6 +262,9 @@ class CoreData:
         self.optstore = options.OptionStore()
         self.cross_files = self.__load_config_files(cmd_options, scratch_dir, 'cross')
         self.compilers: PerMachine[T.Dict[str, Compiler]] = PerMachine(OrderedDict(), OrderedDict())
+        # (mtime, size) of each compiler binary when it was detected, so that
+        # reconfiguring can tell whether it must be probed again.
+        self.compiler_stamps: PerMachine[T.Dict[str, T.Optional[T.Tuple[int, int]]]] = PerMachine({}, {})
 
         # Stores the (name, hash) of the options file, The name will be either
         # "meson_options.txt" or "meson.options".
@@ -281,6 +284,9 @@ class CoreData:
 
         self.compiler_check_cache: T.Dict['CompilerCheckCacheKey', 'CompileResult'] = OrderedDict()
         self.run_check_cache: T.Dict['RunCheckCacheKey', 'RunResult'] = OrderedDict()
+        # Versions reported by programs, with the size and mtime of the files
+        # making up the command when they were asked.
+        self.program_version_cache: T.Dict[T.Tuple[str, ...], T.Tuple[T.Tuple[T.Tuple[int, int], ...], str]] = {}
 
         # CMake cache
         self.cmake_cache: PerMachine[CMakeStateCache] = PerMachine(CMakeStateCache(), CMakeStateCache())
@@ -515,6 +521,7 @@ class CoreData:
         self.deps.build.clear()
         self.compiler_check_cache.clear()
         self.run_check_cache.clear()
+        self.program_version_cache.clear()
 
     def get_nondefault_buildtype_args(self) -> T.List[T.Union[T.Tuple[str, str, str], T.Tuple[str, bool, bool]]]:
         result: T.List[T.Union[T.Tuple[str, str, str], T.Tuple[str, bool, bool]]] = []
@@ -775,11 +782,12 @@ def get_cmd_line_file(build_dir: str) -> str:
 
 def read_cmd_line_file(build_dir: str, options: SharedCMDOptions) -> None:
     filename = get_cmd_line_file(build_dir)
-    if not os.path.isfile(filename):
-        return
-
     config = CmdLineFileParser()
-    config.read(filename)
+    try:
+        with open(filename, encoding='utf-8') as f:
+            config.read_file(f, filename)
+    except FileNotFoundError:
+        return
 
     # Do a copy because config is not really a dict. options.cmd_line_options
     # overrides values from the file.
@@ -813,7 +821,8 @@ def write_cmd_line_file(build_dir: str, options: SharedCMDOptions) -> None:
 def update_cmd_line_file(build_dir: str, options: SharedCMDOptions) -> None:
     filename = get_cmd_line_file(build_dir)
     config = CmdLineFileParser()
-    config.read(filename)
+    with open(filename, encoding='utf-8') as f:
+        config.read_file(f, filename)
     config['options'].update({str(k): str(v) for k, v in options.cmd_line_options.items()})
     with open(filename, 'w', encoding='utf-8') as f:
         config.write(f)
@@ -844,8 +853,15 @@ def save(obj: CoreData, build_dir: str) -> str:
     if major_versions_differ(obj.version, version):
         raise MesonException('Fatal version mismatch corruption.')
     if os.path.exists(filename):
-        import shutil
-        shutil.copyfile(filename, prev_filename)
+        # The new data is written to a new file and then moved in place, so
+        # the current file can be kept as the backup without copying it.
+        try:
+            if os.path.lexists(prev_filename):
+                os.unlink(prev_filename)
+            os.link(filename, prev_filename)
+        except OSError:
+            import shutil
+            shutil.copyfile(filename, prev_filename)
     with open(tempfilename, 'wb') as f:
         pickle.dump(obj, f)
         f.flush()
@@ -909,7 +925,10 @@ class OptionsView(abc.Mapping):
     def __getitem__(self, key: OptionKey) -> options.UserOption:
         # FIXME: This is fundamentally the same algorithm than interpreter.get_option_internal().
         # We should try to share the code somehow.
-        key = key.evolve(subproject=self.subproject)
+        if self.subproject is not None and key.subproject != self.subproject:
+            key = key.evolve(subproject=self.subproject)
+        # Most lookups come from the main project, where the key already is its root
+        root_key = key.as_root() if key.subproject else key
         if not isinstance(self.original_options, options.OptionStore):
             # This is only used by CUDA currently.
             # This entire class gets removed when option refactor
@@ -923,21 +942,20 @@ class OptionsView(abc.Mapping):
         if not is_project_option:
             opt = self.original_options.get(key)
             if opt is None or opt.yielding:
-                key2 = key.as_root()
                 # This hack goes away once wi start using OptionStore
                 # to hold overrides.
                 if isinstance(self.original_options, options.OptionStore):
-                    if key2 not in self.original_options:
-                        raise KeyError(f'{key} {key2}')
-                    opt = self.original_options.get_value_object(key2)
+                    if root_key not in self.original_options:
+                        raise KeyError(f'{key} {root_key}')
+                    opt = self.original_options.get_value_object(root_key)
                 else:
-                    opt = self.original_options[key2]
+                    opt = self.original_options[root_key]
         else:
             opt = self.original_options[key]
             if opt.yielding:
-                opt = self.original_options.get(key.as_root(), opt)
+                opt = self.original_options.get(root_key, opt)
         if self.overrides:
-            override_value = self.overrides.get(key.as_root())
+            override_value = self.overrides.get(root_key)
             if override_value is not None:
                 opt = copy.copy(opt)
                 opt.set_value(override_value)
@@ -8,6 +8,7 @@ from ..mesonlib import listify, Popen_safe, Popen_safe_logged, split_args, versi
 from ..programs import find_external_program
 from .. import mlog
 import re
+import subprocess
 import typing as T
 
 from mesonbuild import mesonlib
@@ -88,7 +89,8 @@ class ConfigToolDependency(ExternalDependency):
             if p.returncode != returncode:
                 if self.skip_version:
                     # maybe the executable is valid even if it doesn't support --version
-                    p = Popen_safe(tool + [self.skip_version])[0]
+                    p = Popen_safe(tool + [self.skip_version], stdout=subprocess.DEVNULL,
+                                   stderr=subprocess.DEVNULL)[0]
                     if p.returncode != returncode:
                         continue
                 else:
@@ -4,6 +4,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
+import os
 import subprocess
 import typing as T
 from enum import Enum
@@ -414,19 +416,11 @@ class BinaryTable:
 
     @staticmethod
     def detect_ccache() -> T.List[str]:
-        try:
-            subprocess.check_call(['ccache', '--version'], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        except (OSError, subprocess.CalledProcessError):
-            return []
-        return ['ccache']
+        return ['ccache'] if _cache_program_works('ccache') else []
 
     @staticmethod
     def detect_sccache() -> T.List[str]:
-        try:
-            subprocess.check_call(['sccache', '--version'], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        except (OSError, subprocess.CalledProcessError):
-            return []
-        return ['sccache']
+        return ['sccache'] if _cache_program_works('sccache') else []
 
     @staticmethod
     def detect_compiler_cache() -> T.List[str]:
@@ -446,6 +440,10 @@ class BinaryTable:
         elif compiler[0] == 'sccache':
             compiler = compiler[1:]
             ccache = cls.detect_sccache()
+        elif len(compiler) > 1 and _is_cache_program(compiler[0]):
+            # An explicit path to ccache, keep using exactly that one
+            ccache = compiler[:1] if _cache_program_works(compiler[0]) else []
+            compiler = compiler[1:]
         else:
             ccache = []
         # Return value has to be a list of compiler 'choices'
@@ -464,6 +462,21 @@ class BinaryTable:
             return None
         return command
 
+def _is_cache_program(cmd: str) -> bool:
+    name = os.path.basename(cmd.replace('\\', '/')).lower()
+    if name.endswith('.exe'):
+        name = name[:-4]
+    return name in {'ccache', 'sccache'}
+
+@lru_cache(maxsize=None)
+def _cache_program_works(cmd: str) -> bool:
+    # This gets asked for every language, but the answer does not change
+    # during a single invocation.
+    try:
+        return subprocess.run([cmd, '--version'], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL).returncode == 0
+    except OSError:
+        return False
+
 class CMakeVariables:
     def __init__(self, variables: T.Optional[T.Dict[str, T.Any]] = None) -> None:
         variables = variables or {}
@@ -51,6 +51,9 @@ if T.TYPE_CHECKING:
 
 build_filename = 'meson.build'
 
+# i386, i486, i586, i686, ...
+x86_cpu_regex = re.compile(r'i.86')
+
 
 def _get_env_var(for_machine: MachineChoice, is_cross: bool, var_name: str) -> T.Optional[str]:
     """
@@ -78,31 +81,46 @@ def _get_env_var(for_machine: MachineChoice, is_cross: bool, var_name: str) -> T
 
 
 def detect_gcovr(gcovr_exe: str = 'gcovr', min_version: str = '3.3', log: bool = False):
+    found = _detect_gcovr(gcovr_exe, min_version)
+    if found is None:
+        return None, None
+    if log:
+        mlog.log('Found gcovr-{} at {}'.format(found, quote_arg(shutil.which(gcovr_exe))))
+    return gcovr_exe, found
+
+@lru_cache(maxsize=None)
+def _detect_gcovr(gcovr_exe: str, min_version: str) -> T.Optional[str]:
     try:
         p, found = Popen_safe([gcovr_exe, '--version'])[0:2]
     except (FileNotFoundError, PermissionError):
         # Doesn't exist in PATH or isn't executable
-        return None, None
+        return None
     found = search_version(found)
     if p.returncode == 0 and mesonlib.version_compare(found, '>=' + min_version):
-        if log:
-            mlog.log('Found gcovr-{} at {}'.format(found, quote_arg(shutil.which(gcovr_exe))))
-        return gcovr_exe, found
-    return None, None
+        return found
+    return None
 
 def detect_lcov(lcov_exe: str = 'lcov', log: bool = False):
+    found = _detect_lcov(lcov_exe)
+    if found is None:
+        return None, None
+    if log:
+        mlog.log('Found lcov-{} at {}'.format(found, quote_arg(shutil.which(lcov_exe))))
+    return lcov_exe, found
+
+@lru_cache(maxsize=None)
+def _detect_lcov(lcov_exe: str) -> T.Optional[str]:
     try:
         p, found = Popen_safe([lcov_exe, '--version'])[0:2]
     except (FileNotFoundError, PermissionError):
         # Doesn't exist in PATH or isn't executable
-        return None, None
+        return None
     found = search_version(found)
     if p.returncode == 0 and found:
-        if log:
-            mlog.log('Found lcov-{} at {}'.format(found, quote_arg(shutil.which(lcov_exe))))
-        return lcov_exe, found
-    return None, None
+        return found
+    return None
 
+@lru_cache(maxsize=None)
 def detect_llvm_cov(suffix: T.Optional[str] = None):
     # If there's a known suffix or forced lack of suffix, use that
     if suffix is not None:
@@ -162,7 +180,25 @@ def detect_ninja(version: str = '1.8.2', log: bool = False) -> T.Optional[T.List
     return r[0] if r else None
 
 def detect_ninja_command_and_version(version: str = '1.8.2', log: bool = False) -> T.Tuple[T.List[str], str]:
-    env_ninja = os.environ.get('NINJA', None)
+    r = _detect_ninja(os.environ.get('NINJA', None), version)
+    if r is None:
+        return None
+    n, command, found = r
+    if log:
+        name = os.path.basename(n)
+        if name.endswith('-' + found):
+            name = name[0:-1 - len(found)]
+        if name == 'ninja-build':
+            name = 'ninja'
+        if name == 'samu':
+            name = 'samurai'
+        mlog.log('Found {}-{} at {}'.format(name, found,
+                 ' '.join([quote_arg(x) for x in command])))
+    return (list(command), found)
+
+@lru_cache(maxsize=None)
+def _detect_ninja(env_ninja: T.Optional[str], version: str) -> T.Optional[T.Tuple[str, T.Tuple[str, ...], str]]:
+    # Both the backend and most commands look for ninja, only do it once
     for n in [env_ninja] if env_ninja else ['ninja', 'ninja-build', 'samu']:
         prog = ExternalProgram(n, silent=True)
         if not prog.found():
@@ -176,17 +212,8 @@ def detect_ninja_command_and_version(version: str = '1.8.2', log: bool = False)
         # Perhaps we should add a way for the caller to know the failure mode
         # (not found or too old)
         if p.returncode == 0 and mesonlib.version_compare(found, '>=' + version):
-            if log:
-                name = os.path.basename(n)
-                if name.endswith('-' + found):
-                    name = name[0:-1 - len(found)]
-                if name == 'ninja-build':
-                    name = 'ninja'
-                if name == 'samu':
-                    name = 'samurai'
-                mlog.log('Found {}-{} at {}'.format(name, found,
-                         ' '.join([quote_arg(x) for x in prog.command])))
-            return (prog.command, found)
+            return (n, tuple(prog.command), found)
+    return None
 
 def get_llvm_tool_names(tool: str) -> T.List[str]:
     # Ordered list of possible suffixes of LLVM executables to try. Start with
@@ -336,7 +363,7 @@ def detect_cpu_family(compilers: CompilersDict) -> str:
         trial = platform.processor().lower()
     else:
         trial = platform.machine().lower()
-    if trial.startswith('i') and trial.endswith('86'):
+    if x86_cpu_regex.fullmatch(trial):
         trial = 'x86'
     elif trial == 'bepc':
         trial = 'x86'
@@ -450,6 +477,9 @@ KERNEL_MAPPINGS: T.Mapping[str, str] = {'freebsd': 'freebsd',
                                         'haiku': 'haiku',
                                         }
 
+# The machine info is detected again for every subproject, and on SunOS
+# this has to run a program.
+@lru_cache(maxsize=None)
 def detect_kernel(system: str) -> T.Optional[str]:
     if system == 'sunos':
         # Solaris 5.10 uname doesn't support the -o switch, and illumos started
@@ -500,6 +530,16 @@ def detect_machine_info(compilers: T.Optional[CompilersDict] = None) -> MachineI
         detect_kernel(system),
         detect_subsystem(system))
 
+@lru_cache(maxsize=None)
+def _detect_compiler_system_lib_dirs(exelist: T.Tuple[str, ...], index: int) -> T.Tuple[str, ...]:
+    # Spawning the compiler is expensive and the answer cannot change during a
+    # single invocation, but this is queried once per external dependency.
+    p, out, _ = Popen_safe(list(exelist) + ['-print-search-dirs'])
+    if p.returncode != 0:
+        raise mesonlib.MesonException('Could not calculate system search dirs')
+    out = out.split('\n')[index].lstrip('libraries: =').split(':')
+    return tuple(os.path.normpath(p) for p in out)
+
 # TODO make this compare two `MachineInfo`s purely. How important is the
 # `detect_cpu_family({})` distinction? It is the one impediment to that.
 def machine_info_can_run(machine_info: MachineInfo):
@@ -720,6 +760,9 @@ class Environment:
         )
 
         env_opts: T.DefaultDict[OptionKey, T.List[str]] = collections.defaultdict(list)
+        # When not cross compiling both machines read the same variables, so
+        # only split each value once.
+        split_values: T.Dict[str, T.List[str]] = {}
 
         for (evar, keyname), for_machine in itertools.product(opts, MachineChoice):
             p_env = _get_env_var(for_machine, self.is_cross_build(), evar)
@@ -736,8 +779,10 @@ class Environment:
                     p_list = list(mesonlib.OrderedSet(_p_env))
                 elif keyname == 'pkg_config_path':
                     p_list = list(mesonlib.OrderedSet(p_env.split(os.pathsep)))
+                elif p_env in split_values:
+                    p_list = split_values[p_env]
                 else:
-                    p_list = split_args(p_env)
+                    p_list = split_values[p_env] = split_args(p_env)
                 p_list = [e for e in p_list if e]  # filter out any empty elements
 
                 # Take env vars only on first invocation, if the env changes when
@@ -937,11 +982,7 @@ class Environment:
             # GCC or Clang compiler return and empty list.
             return []
 
-        p, out, _ = Popen_safe(comp.get_exelist() + ['-print-search-dirs'])
-        if p.returncode != 0:
-            raise mesonlib.MesonException('Could not calculate system search dirs')
-        out = out.split('\n')[index].lstrip('libraries: =').split(':')
-        return [os.path.normpath(p) for p in out]
+        return list(_detect_compiler_system_lib_dirs(tuple(comp.get_exelist()), index))
 
     def get_compiler_system_include_dirs(self, for_machine: MachineChoice) -> T.List[str]:
         for comp in self.coredata.compilers[for_machine].values():
@@ -109,13 +109,12 @@ class _TestMode(enum.Enum):
 
 
 class TryRunResultHolder(ObjectHolder['RunResult']):
-    def __init__(self, res: 'RunResult', interpreter: 'Interpreter'):
-        super().__init__(res, interpreter)
-        self.methods.update({'returncode': self.returncode_method,
-                             'compiled': self.compiled_method,
-                             'stdout': self.stdout_method,
-                             'stderr': self.stderr_method,
-                             })
+    METHODS = {
+        'returncode': 'returncode_method',
+        'compiled': 'compiled_method',
+        'stdout': 'stdout_method',
+        'stderr': 'stderr_method',
+    }
 
     @noPosargs
     @noKwargs
@@ -186,45 +185,47 @@ _HEADER_KWS: T.List[KwargInfo] = [REQUIRED_KW.evolve(since='0.50.0', default=Fal
 _HAS_REQUIRED_KW = REQUIRED_KW.evolve(since='1.3.0', default=False)
 
 class CompilerHolder(ObjectHolder['Compiler']):
+    METHODS = {
+        'compiles': 'compiles_method',
+        'links': 'links_method',
+        'get_id': 'get_id_method',
+        'get_linker_id': 'get_linker_id_method',
+        'compute_int': 'compute_int_method',
+        'sizeof': 'sizeof_method',
+        'get_define': 'get_define_method',
+        'has_define': 'has_define_method',
+        'check_header': 'check_header_method',
+        'has_header': 'has_header_method',
+        'has_header_symbol': 'has_header_symbol_method',
+        'run': 'run_method',
+        'has_function': 'has_function_method',
+        'has_member': 'has_member_method',
+        'has_members': 'has_members_method',
+        'has_type': 'has_type_method',
+        'alignment': 'alignment_method',
+        'version': 'version_method',
+        'cmd_array': 'cmd_array_method',
+        'find_library': 'find_library_method',
+        'has_argument': 'has_argument_method',
+        'has_function_attribute': 'has_func_attribute_method',
+        'get_supported_function_attributes': 'get_supported_function_attributes_method',
+        'has_multi_arguments': 'has_multi_arguments_method',
+        'get_supported_arguments': 'get_supported_arguments_method',
+        'first_supported_argument': 'first_supported_argument_method',
+        'has_link_argument': 'has_link_argument_method',
+        'has_multi_link_arguments': 'has_multi_link_arguments_method',
+        'get_supported_link_arguments': 'get_supported_link_arguments_method',
+        'first_supported_link_argument': 'first_supported_link_argument_method',
+        'symbols_have_underscore_prefix': 'symbols_have_underscore_prefix_method',
+        'get_argument_syntax': 'get_argument_syntax_method',
+        'preprocess': 'preprocess_method',
+    }
+
     preprocess_uid: T.Dict[str, itertools.count] = collections.defaultdict(itertools.count)
 
     def __init__(self, compiler: 'Compiler', interpreter: 'Interpreter'):
         super().__init__(compiler, interpreter)
         self.environment = self.env
-        self.methods.update({'compiles': self.compiles_method,
-                             'links': self.links_method,
-                             'get_id': self.get_id_method,
-                             'get_linker_id': self.get_linker_id_method,
-                             'compute_int': self.compute_int_method,
-                             'sizeof': self.sizeof_method,
-                             'get_define': self.get_define_method,
-                             'has_define': self.has_define_method,
-                             'check_header': self.check_header_method,
-                             'has_header': self.has_header_method,
-                             'has_header_symbol': self.has_header_symbol_method,
-                             'run': self.run_method,
-                             'has_function': self.has_function_method,
-                             'has_member': self.has_member_method,
-                             'has_members': self.has_members_method,
-                             'has_type': self.has_type_method,
-                             'alignment': self.alignment_method,
-                             'version': self.version_method,
-                             'cmd_array': self.cmd_array_method,
-                             'find_library': self.find_library_method,
-                             'has_argument': self.has_argument_method,
-                             'has_function_attribute': self.has_func_attribute_method,
-                             'get_supported_function_attributes': self.get_supported_function_attributes_method,
-                             'has_multi_arguments': self.has_multi_arguments_method,
-                             'get_supported_arguments': self.get_supported_arguments_method,
-                             'first_supported_argument': self.first_supported_argument_method,
-                             'has_link_argument': self.has_link_argument_method,
-                             'has_multi_link_arguments': self.has_multi_link_arguments_method,
-                             'get_supported_link_arguments': self.get_supported_link_arguments_method,
-                             'first_supported_link_argument': self.first_supported_link_argument_method,
-                             'symbols_have_underscore_prefix': self.symbols_have_underscore_prefix_method,
-                             'get_argument_syntax': self.get_argument_syntax_method,
-                             'preprocess': self.preprocess_method,
-                             })
 
     @property
     def compiler(self) -> 'Compiler':
@@ -85,12 +85,22 @@ class DependencyFallbacksHolder(MesonInterpreterObject):
         # module, etc.
         name = func_args[0]
         self._handle_featurenew_dependencies(name)
+        for_machine = self.interpreter.machine_from_native_kwarg(kwargs)
+        identifier = dependencies.get_dep_identifier(name, kwargs)
+        # Found dependencies are cached in coredata, but looking for a missing
+        # one again in the same run, e.g. from another subproject, would only
+        # run pkg-config and cmake again to fail in the same way. When it is
+        # required we still do so, to fail with the actual error.
+        notfound_key = (identifier, tuple(stringlistify(kwargs.get('version', []))))
+        notfound_deps = self.interpreter.notfound_deps[for_machine]
+        if notfound_key in notfound_deps and not kwargs.get('required', True):
+            mlog.log('Dependency', mlog.bold(name), 'found:', mlog.red('NO'), mlog.blue('(cached)'))
+            return None
         dep = dependencies.find_external_dependency(name, self.environment, kwargs)
         if dep.found():
-            for_machine = self.interpreter.machine_from_native_kwarg(kwargs)
-            identifier = dependencies.get_dep_identifier(name, kwargs)
             self.coredata.deps[for_machine].put(identifier, dep)
             return dep
+        notfound_deps.add(notfound_key)
         return None
 
     def _do_existing_subproject(self, kwargs: TYPE_nkwargs, func_args: TYPE_nvar, func_kwargs: TYPE_nkwargs) -> T.Optional[Dependency]:
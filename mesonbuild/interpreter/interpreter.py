@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 
+import contextlib
 import hashlib
 
 from .. import mparser
@@ -112,6 +113,7 @@ import copy
 if T.TYPE_CHECKING:
     from . import kwargs as kwtypes
     from ..backend.backends import Backend
+    from ..dependencies.detect import TV_DepID
     from ..interpreterbase.baseobjects import InterpreterObject, TYPE_var, TYPE_kwargs
     from ..programs import OverrideProgram
     from .type_checking import SourcesVarargsType
@@ -130,6 +132,10 @@ if T.TYPE_CHECKING:
     ProgramVersionFunc = T.Callable[[T.Union[ExternalProgram, build.Executable, OverrideProgram]], str]
 
 
+# Target classes build_target() knows how to create
+_BUILD_TARGET_CLASSES = frozenset({build.Executable, build.SharedLibrary, build.SharedModule, build.StaticLibrary, build.Jar})
+
+
 def _project_version_validator(value: T.Union[T.List, str, mesonlib.File, None]) -> T.Optional[str]:
     if isinstance(value, list):
         if len(value) != 1:
@@ -258,8 +264,74 @@ implicit_check_false_warning = """You should add the boolean check kwarg to the
          It currently defaults to false,
          but it will default to true in future releases of meson.
          See also: https://github.com/mesonbuild/meson/issues/9300"""
+
+# The usual man page extensions, which install_man() accepts without parsing
+man_page_extensions = tuple(f'.{i}' for i in range(1, 10))
+
 class Interpreter(InterpreterBase, HoldableObject):
 
+    FUNCTIONS = {
+        'add_global_arguments': 'func_add_global_arguments',
+        'add_global_link_arguments': 'func_add_global_link_arguments',
+        'add_languages': 'func_add_languages',
+        'add_project_arguments': 'func_add_project_arguments',
+        'add_project_dependencies': 'func_add_project_dependencies',
+        'add_project_link_arguments': 'func_add_project_link_arguments',
+        'add_test_setup': 'func_add_test_setup',
+        'alias_target': 'func_alias_target',
+        'assert': 'func_assert',
+        'benchmark': 'func_benchmark',
+        'both_libraries': 'func_both_lib',
+        'build_target': 'func_build_target',
+        'configuration_data': 'func_configuration_data',
+        'configure_file': 'func_configure_file',
+        'custom_target': 'func_custom_target',
+        'debug': 'func_debug',
+        'declare_dependency': 'func_declare_dependency',
+        'dependency': 'func_dependency',
+        'disabler': 'func_disabler',
+        'environment': 'func_environment',
+        'error': 'func_error',
+        'executable': 'func_executable',
+        'files': 'func_files',
+        'find_program': 'func_find_program',
+        'generator': 'func_generator',
+        'get_option': 'func_get_option',
+        'get_variable': 'func_get_variable',
+        'import': 'func_import',
+        'include_directories': 'func_include_directories',
+        'install_data': 'func_install_data',
+        'install_emptydir': 'func_install_emptydir',
+        'install_headers': 'func_install_headers',
+        'install_man': 'func_install_man',
+        'install_subdir': 'func_install_subdir',
+        'install_symlink': 'func_install_symlink',
+        'is_disabler': 'func_is_disabler',
+        'is_variable': 'func_is_variable',
+        'jar': 'func_jar',
+        'join_paths': 'func_join_paths',
+        'library': 'func_library',
+        'message': 'func_message',
+        'option': 'func_option',
+        'project': 'func_project',
+        'range': 'func_range',
+        'run_command': 'func_run_command',
+        'run_target': 'func_run_target',
+        'set_variable': 'func_set_variable',
+        'structured_sources': 'func_structured_sources',
+        'subdir': 'func_subdir',
+        'shared_library': 'func_shared_lib',
+        'shared_module': 'func_shared_module',
+        'static_library': 'func_static_lib',
+        'subdir_done': 'func_subdir_done',
+        'subproject': 'func_subproject',
+        'summary': 'func_summary',
+        'test': 'func_test',
+        'unset_variable': 'func_unset_variable',
+        'vcs_tag': 'func_vcs_tag',
+        'warning': 'func_warning',
+    }
+
     def __init__(
                 self,
                 _build: build.Build,
@@ -275,9 +347,14 @@ class Interpreter(InterpreterBase, HoldableObject):
             ) -> None:
         super().__init__(_build.environment.get_source_dir(), subdir, subproject)
         self.active_projectname = ''
+        # Absolute path of self.subdir, kept in step with it by func_subdir()
+        self.source_subdir = os.path.join(self.source_root, subdir)
         self.build = _build
         self.environment = self.build.environment
         self.coredata = self.environment.get_coredata()
+        # Relative path from the build dir to the source dir, see ModuleState
+        self.build_to_src = mesonlib.relpath(self.environment.get_source_dir(),
+                                             self.environment.get_build_dir())
         self.backend = backend
         self.summary: T.Dict[str, 'Summary'] = {}
         self.modules: T.Dict[str, NewExtensionModule] = {}
@@ -286,6 +363,9 @@ class Interpreter(InterpreterBase, HoldableObject):
         self.subproject_directory_name = subdir.split(os.path.sep)[-1]
         self.subproject_dir = subproject_dir
         self.relaxations = relaxations or set()
+        # Build files parsed in this configure run, by path, with the mtime and
+        # size they were parsed at. Shared with subproject interpreters.
+        self.ast_cache: T.Dict[str, T.Tuple[int, int, mparser.CodeBlockNode]] = {}
         if ast is None:
             self.load_root_meson_file()
         else:
@@ -309,6 +389,15 @@ class Interpreter(InterpreterBase, HoldableObject):
         self.build_holder_map()
         self.user_defined_options = user_defined_options
         self.compilers: PerMachine[T.Dict[str, 'compilers.Compiler']] = PerMachine({}, {})
+        # Programs found by name for run_command(), by name and search dir
+        self.run_command_progs: T.Dict[T.Tuple[str, str], ExternalProgram] = {}
+        # Include directories already known to exist, by source path. Targets
+        # in the same subdir usually pass the same include_directories strings.
+        self.existing_include_dirs: T.Set[str] = set()
+        # External dependencies not found in this run, with the versions asked for
+        self.notfound_deps: PerMachine[T.Set[T.Tuple[TV_DepID, T.Tuple[str, ...]]]] = PerMachine(set(), set())
+        # What detect_vcs() found for vcs_tag(), by source subdir
+        self.detected_vcs: T.Dict[str, T.Optional[T.Dict[str, str]]] = {}
 
         # build_def_files needs to be defined before parse_project is called
         #
@@ -316,6 +405,9 @@ class Interpreter(InterpreterBase, HoldableObject):
         # exist we don't want to add a dependency on it, it's autogenerated
         # from the actual build files, and is just for reference.
         self.build_def_files: mesonlib.OrderedSet[str] = mesonlib.OrderedSet()
+        # What add_build_def_file() made of each existing file, None if it is
+        # in the build directory
+        self.resolved_build_def_files: T.Dict[str, T.Optional[str]] = {}
         build_filename = os.path.join(self.subdir, environment.build_filename)
         if not is_translated:
             self.build_def_files.add(build_filename)
@@ -344,66 +436,6 @@ class Interpreter(InterpreterBase, HoldableObject):
             OBJ.MachineHolder(self.build.environment.machines.target, self)
 
     def build_func_dict(self) -> None:
-        self.funcs.update({'add_global_arguments': self.func_add_global_arguments,
-                           'add_global_link_arguments': self.func_add_global_link_arguments,
-                           'add_languages': self.func_add_languages,
-                           'add_project_arguments': self.func_add_project_arguments,
-                           'add_project_dependencies': self.func_add_project_dependencies,
-                           'add_project_link_arguments': self.func_add_project_link_arguments,
-                           'add_test_setup': self.func_add_test_setup,
-                           'alias_target': self.func_alias_target,
-                           'assert': self.func_assert,
-                           'benchmark': self.func_benchmark,
-                           'both_libraries': self.func_both_lib,
-                           'build_target': self.func_build_target,
-                           'configuration_data': self.func_configuration_data,
-                           'configure_file': self.func_configure_file,
-                           'custom_target': self.func_custom_target,
-                           'debug': self.func_debug,
-                           'declare_dependency': self.func_declare_dependency,
-                           'dependency': self.func_dependency,
-                           'disabler': self.func_disabler,
-                           'environment': self.func_environment,
-                           'error': self.func_error,
-                           'executable': self.func_executable,
-                           'files': self.func_files,
-                           'find_program': self.func_find_program,
-                           'generator': self.func_generator,
-                           'get_option': self.func_get_option,
-                           'get_variable': self.func_get_variable,
-                           'import': self.func_import,
-                           'include_directories': self.func_include_directories,
-                           'install_data': self.func_install_data,
-                           'install_emptydir': self.func_install_emptydir,
-                           'install_headers': self.func_install_headers,
-                           'install_man': self.func_install_man,
-                           'install_subdir': self.func_install_subdir,
-                           'install_symlink': self.func_install_symlink,
-                           'is_disabler': self.func_is_disabler,
-                           'is_variable': self.func_is_variable,
-                           'jar': self.func_jar,
-                           'join_paths': self.func_join_paths,
-                           'library': self.func_library,
-                           'message': self.func_message,
-                           'option': self.func_option,
-                           'project': self.func_project,
-                           'range': self.func_range,
-                           'run_command': self.func_run_command,
-                           'run_target': self.func_run_target,
-                           'set_variable': self.func_set_variable,
-                           'structured_sources': self.func_structured_sources,
-                           'subdir': self.func_subdir,
-                           'shared_library': self.func_shared_lib,
-                           'shared_module': self.func_shared_module,
-                           'static_library': self.func_static_lib,
-                           'subdir_done': self.func_subdir_done,
-                           'subproject': self.func_subproject,
-                           'summary': self.func_summary,
-                           'test': self.func_test,
-                           'unset_variable': self.func_unset_variable,
-                           'vcs_tag': self.func_vcs_tag,
-                           'warning': self.func_warning,
-                           })
         if 'MESON_UNIT_TEST' in os.environ:
             self.funcs.update({'exception': self.func_exception})
         if 'MESON_RUNNING_IN_PROJECT_TESTS' in os.environ:
@@ -486,14 +518,17 @@ class Interpreter(InterpreterBase, HoldableObject):
         })
 
     def process_new_values(self, invalues: T.List[T.Union[TYPE_var, ExecutableSerialisation]]) -> None:
-        invalues = listify(invalues)
-        for v in invalues:
+        # Handled in order, nested values are expanded in place as they come
+        todo = listify(invalues)
+        todo.reverse()
+        while todo:
+            v = todo.pop()
             if isinstance(v, ObjectHolder):
                 raise InterpreterException('Modules must not return ObjectHolders')
             if isinstance(v, (build.BuildTarget, build.CustomTarget, build.RunTarget)):
                 self.add_target(v.name, v)
             elif isinstance(v, list):
-                self.process_new_values(v)
+                todo.extend(reversed(v))
             elif isinstance(v, ExecutableSerialisation):
                 v.subproject = self.subproject
                 self.build.install_scripts.append(v)
@@ -504,7 +539,7 @@ class Interpreter(InterpreterBase, HoldableObject):
             elif isinstance(v, dependencies.InternalDependency):
                 # FIXME: This is special cased and not ideal:
                 # The first source is our new VapiTarget, the rest are deps
-                self.process_new_values(v.sources[0])
+                todo.append(v.sources[0])
             elif isinstance(v, build.InstallDir):
                 self.build.install_dirs.append(v)
             elif isinstance(v, Test):
@@ -520,6 +555,27 @@ class Interpreter(InterpreterBase, HoldableObject):
             raise InterpreterException.from_node(f'Meson version is {coredata.version} but project requires {pv}', node=location)
         mesonlib.project_meson_versions[self.subproject] = pv
 
+    def parse_buildfile(self, fname: str, errname: str, allow_empty: bool = True) -> T.Optional[mparser.CodeBlockNode]:
+        # The interpreter never modifies the AST, so a build file parsed again
+        # in this configure run can reuse it. The AstInterpreter does not use
+        # this, the rewriter edits the tree it gets.
+        try:
+            st = os.stat(fname)
+        except OSError:
+            return None
+        if not stat.S_ISREG(st.st_mode):
+            return None
+        cached = self.ast_cache.get(fname)
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            return cached[2]
+        warnings = mlog.get_warning_count()
+        ast = super().parse_buildfile(fname, errname, allow_empty)
+        # Files the parser warned about are parsed again so that the warnings
+        # are repeated
+        if ast is not None and mlog.get_warning_count() == warnings:
+            self.ast_cache[fname] = (st.st_mtime_ns, st.st_size, ast)
+        return ast
+
     def handle_meson_version_from_ast(self) -> None:
         if not self.ast.lines:
             return
@@ -546,31 +602,43 @@ class Interpreter(InterpreterBase, HoldableObject):
             if f.is_built:
                 return
             f = os.path.normpath(f.relative_name())
+        elif f in self.resolved_build_def_files:
+            # The same files come by many times and resolving them is not free
+            resolved = self.resolved_build_def_files[f]
+            if resolved is None:
+                return
+            f = resolved
         elif os.path.isfile(f) and not f.startswith('/dev/'):
-            srcdir = Path(self.environment.get_source_dir())
-            builddir = Path(self.environment.get_build_dir())
-            try:
-                f_ = Path(f).resolve()
-            except OSError:
-                f_ = Path(f)
-                s = f_.stat()
-                if (hasattr(s, 'st_file_attributes') and
-                        s.st_file_attributes & stat.FILE_ATTRIBUTE_REPARSE_POINT != 0 and
-                        s.st_reparse_tag == stat.IO_REPARSE_TAG_APPEXECLINK):
-                    # This is a Windows Store link which we can't
-                    # resolve, so just do our best otherwise.
-                    f_ = f_.parent.resolve() / f_.name
-                else:
-                    raise
-            if builddir in f_.parents:
+            resolved = self._resolve_build_def_file(f)
+            self.resolved_build_def_files[f] = resolved
+            if resolved is None:
                 return
-            if srcdir in f_.parents:
-                f_ = f_.relative_to(srcdir)
-            f = str(f_)
+            f = resolved
         else:
             return
-        if f not in self.build_def_files:
-            self.build_def_files.add(f)
+        self.build_def_files.add(f)
+
+    def _resolve_build_def_file(self, f: str) -> T.Optional[str]:
+        srcdir = Path(self.environment.get_source_dir())
+        builddir = Path(self.environment.get_build_dir())
+        try:
+            f_ = Path(f).resolve()
+        except OSError:
+            f_ = Path(f)
+            s = f_.stat()
+            if (hasattr(s, 'st_file_attributes') and
+                    s.st_file_attributes & stat.FILE_ATTRIBUTE_REPARSE_POINT != 0 and
+                    s.st_reparse_tag == stat.IO_REPARSE_TAG_APPEXECLINK):
+                # This is a Windows Store link which we can't
+                # resolve, so just do our best otherwise.
+                f_ = f_.parent.resolve() / f_.name
+            else:
+                raise
+        if builddir in f_.parents:
+            return None
+        if srcdir in f_.parents:
+            f_ = f_.relative_to(srcdir)
+        return str(f_)
 
     def get_variables(self) -> T.Dict[str, InterpreterObject]:
         return self.variables
@@ -814,10 +882,13 @@ class Interpreter(InterpreterBase, HoldableObject):
             if isinstance(cmd, mesonlib.File):
                 cmd = cmd.absolute_path(srcdir, builddir)
             # Prefer scripts in the current source directory
-            search_dir = os.path.join(srcdir, self.subdir)
-            prog = ExternalProgram(cmd, silent=True, search_dir=search_dir)
-            if not prog.found():
-                raise InterpreterException(f'Program or command {cmd!r} not found or not executable')
+            search_dir = self.source_subdir
+            prog = self.run_command_progs.get((cmd, search_dir))
+            if prog is None:
+                prog = ExternalProgram(cmd, silent=True, search_dir=search_dir)
+                if not prog.found():
+                    raise InterpreterException(f'Program or command {cmd!r} not found or not executable')
+                self.run_command_progs[(cmd, search_dir)] = prog
             cmd = prog
         for a in cargs:
             if isinstance(a, str):
@@ -982,6 +1053,8 @@ class Interpreter(InterpreterBase, HoldableObject):
             subi.holder_map = self.holder_map
             subi.bound_holder_map = self.bound_holder_map
             subi.summary = self.summary
+            subi.notfound_deps = self.notfound_deps
+            subi.ast_cache = self.ast_cache
 
             subi.subproject_stack = self.subproject_stack + [subp_name]
             current_active = self.active_projectname
@@ -1182,8 +1255,8 @@ class Interpreter(InterpreterBase, HoldableObject):
         # Load "meson.options" before "meson_options.txt", and produce a warning if
         # it is being used with an old version. I have added check that if both
         # exist the warning isn't raised
-        option_file = os.path.join(self.source_root, self.subdir, 'meson.options')
-        old_option_file = os.path.join(self.source_root, self.subdir, 'meson_options.txt')
+        option_file = os.path.join(self.source_subdir, 'meson.options')
+        old_option_file = os.path.join(self.source_subdir, 'meson_options.txt')
 
         if os.path.exists(option_file):
             if os.path.exists(old_option_file):
@@ -1195,11 +1268,15 @@ class Interpreter(InterpreterBase, HoldableObject):
                 FeatureNew.single_use('meson.options file', '1.1', self.subproject, 'Use meson_options.txt instead')
         else:
             option_file = old_option_file
-        if os.path.exists(option_file):
+        try:
             with open(option_file, 'rb') as f:
-                # We want fast  not cryptographically secure, this is just to
-                # see if the option file has changed
-                self.coredata.options_files[self.subproject] = (option_file, hashlib.sha1(f.read()).hexdigest())
+                option_data: T.Optional[bytes] = f.read()
+        except FileNotFoundError:
+            option_data = None
+        if option_data is not None:
+            # We want fast  not cryptographically secure, this is just to
+            # see if the option file has changed
+            self.coredata.options_files[self.subproject] = (option_file, hashlib.sha1(option_data).hexdigest())
             oi = optinterpreter.OptionInterpreter(self.environment.coredata.optstore, self.subproject)
             oi.process(option_file)
             self.coredata.update_project_options(oi.options, self.subproject)
@@ -1314,8 +1391,9 @@ class Interpreter(InterpreterBase, HoldableObject):
             force_vsenv = vsenv or backend.startswith('vs')
             mesonlib.setup_vsenv(force_vsenv)
 
-        self.add_languages(proj_langs, True, MachineChoice.HOST)
-        self.add_languages(proj_langs, False, MachineChoice.BUILD)
+        with self._prefetch_compiler_probes_for_both_machines(proj_langs):
+            self.add_languages(proj_langs, True, MachineChoice.HOST)
+            self.add_languages(proj_langs, False, MachineChoice.BUILD)
 
         self.set_backend()
         if not self.is_subproject():
@@ -1342,8 +1420,9 @@ class Interpreter(InterpreterBase, HoldableObject):
                 mlog.warning('add_languages is missing native:, assuming languages are wanted for both host and build.',
                              location=node)
 
-            success = self.add_languages(langs, False, MachineChoice.BUILD)
-            success &= self.add_languages(langs, required, MachineChoice.HOST)
+            with self._prefetch_compiler_probes_for_both_machines(langs):
+                success = self.add_languages(langs, False, MachineChoice.BUILD)
+                success &= self.add_languages(langs, required, MachineChoice.HOST)
             return success
 
     def _stringify_user_arguments(self, args: T.List[TYPE_var], func_name: str) -> T.List[str]:
@@ -1489,6 +1568,19 @@ class Interpreter(InterpreterBase, HoldableObject):
         self._redetect_machines()
         return success
 
+    @contextlib.contextmanager
+    def _prefetch_compiler_probes_for_both_machines(self, langs: T.List[str]) -> T.Iterator[None]:
+        # In a cross build the compilers of the build machine are different
+        # programs, detected right after those of the host machine, so probe
+        # all of them at once.
+        with contextlib.ExitStack() as stack:
+            if self.coredata.is_cross_build():
+                for for_machine in (MachineChoice.HOST, MachineChoice.BUILD):
+                    to_detect = [l.lower() for l in langs]
+                    to_detect = [l for l in to_detect if l not in self.coredata.compilers[for_machine]]
+                    stack.enter_context(compilers.prefetch_compiler_probes(self.environment, to_detect, for_machine))
+            yield
+
     def should_skip_sanity_check(self, for_machine: MachineChoice) -> bool:
         should = self.environment.properties.host.get('skip_sanity_check', False)
         if not isinstance(should, bool):
@@ -1516,56 +1608,75 @@ class Interpreter(InterpreterBase, HoldableObject):
             FeatureNew.single_use('Adding NASM language', '0.64.0', self.subproject, location=self.current_node)
 
         success = True
-        for lang in sorted(args, key=compilers.sort_clink):
-            if lang in self.compilers[for_machine]:
-                continue
-            machine_name = for_machine.get_lower_case_name()
-            comp = self.coredata.compilers[for_machine].get(lang)
-            if not comp:
-                try:
-                    skip_sanity_check = self.should_skip_sanity_check(for_machine)
-                    if skip_sanity_check:
-                        mlog.log('Cross compiler sanity tests disabled via the cross file.', once=True)
-                    comp = compilers.detect_compiler_for(self.environment, lang, for_machine, skip_sanity_check, self.subproject)
-                    if comp is None:
-                        raise InvalidArguments(f'Tried to use unknown language "{lang}".')
-                except mesonlib.MesonException:
-                    if not required:
-                        mlog.log('Compiler for language',
-                                 mlog.bold(lang), 'for the', machine_name,
-                                 'machine not found.')
-                        success = False
-                        continue
-                    else:
-                        raise
-                if lang == 'cuda' and hasattr(self.backend, 'allow_thin_archives'):
-                    # see NinjaBackend.__init__() why we need to disable thin archives for cuda
-                    mlog.debug('added cuda as language, disabling thin archives for {}, since nvcc/nvlink cannot handle thin archives natively'.format(for_machine))
-                    self.backend.allow_thin_archives[for_machine] = False
-            else:
-                # update new values from commandline, if it applies
-                self.coredata.process_compiler_options(lang, comp, self.environment, self.subproject)
-
-            # Add per-subproject compiler options. They inherit value from main project.
-            if self.subproject:
-                options = {}
-                for k in comp.get_options():
-                    v = copy.copy(self.coredata.optstore.get_value_object(k))
-                    k = k.evolve(subproject=self.subproject)
-                    options[k] = v
-                self.coredata.add_compiler_options(options, lang, for_machine, self.environment, self.subproject)
-
-            if for_machine == MachineChoice.HOST or self.environment.is_cross_build():
-                logger_fun = mlog.log
-            else:
-                logger_fun = mlog.debug
-            logger_fun(comp.get_display_language(), 'compiler for the', machine_name, 'machine:',
-                       mlog.bold(' '.join(comp.get_exelist())), comp.get_version_string())
-            if comp.linker is not None:
-                logger_fun(comp.get_display_language(), 'linker for the', machine_name, 'machine:',
-                           mlog.bold(' '.join(comp.linker.get_exelist())), comp.linker.id, comp.linker.version)
-            self.build.ensure_static_linker(comp)
-            self.compilers[for_machine][lang] = comp
+        # Compilers are still detected one by one below, but the processes
+        # that detection starts with can run concurrently.
+        to_detect = [l for l in args if l not in self.coredata.compilers[for_machine]]
+        with compilers.prefetch_compiler_probes(self.environment, to_detect, for_machine):
+            for lang in sorted(args, key=compilers.sort_clink):
+                if lang in self.compilers[for_machine]:
+                    continue
+                machine_name = for_machine.get_lower_case_name()
+                comp = self.coredata.compilers[for_machine].get(lang)
+                # Make sure a changed compiler is detected again from the same
+                # binary, not whatever the default is in the current environment.
+                binaries = self.environment.binaries[for_machine].binaries
+                pinned_binary = False
+                if comp and compilers.compiler_is_stale(self.environment, lang, comp):
+                    mlog.log('Compiler for language', mlog.bold(lang), 'for the', machine_name,
+                             'machine has changed, detecting it again.')
+                    if lang not in binaries:
+                        binaries[lang] = comp.get_exelist()
+                        pinned_binary = True
+                    comp = None
+                if not comp:
+                    try:
+                        skip_sanity_check = self.should_skip_sanity_check(for_machine)
+                        if skip_sanity_check:
+                            mlog.log('Cross compiler sanity tests disabled via the cross file.', once=True)
+                        try:
+                            comp = compilers.detect_compiler_for(self.environment, lang, for_machine, skip_sanity_check, self.subproject)
+                        finally:
+                            if pinned_binary:
+                                del binaries[lang]
+                        if comp is None:
+                            raise InvalidArguments(f'Tried to use unknown language "{lang}".')
+                    except mesonlib.MesonException:
+                        if not required:
+                            mlog.log('Compiler for language',
+                                     mlog.bold(lang), 'for the', machine_name,
+                                     'machine not found.')
+                            success = False
+                            continue
+                        else:
+                            raise
+                    if lang == 'cuda' and hasattr(self.backend, 'allow_thin_archives'):
+                        # see NinjaBackend.__init__() why we need to disable thin archives for cuda
+                        mlog.debug('added cuda as language, disabling thin archives for {}, since nvcc/nvlink cannot handle thin archives natively'.format(for_machine))
+                        self.backend.allow_thin_archives[for_machine] = False
+                else:
+                    # update new values from commandline, if it applies
+                    self.coredata.process_compiler_options(lang, comp, self.environment, self.subproject)
+
+                # Add per-subproject compiler options. They inherit value from main project.
+                if self.subproject:
+                    options = {}
+                    for k in comp.get_options():
+                        v = copy.copy(self.coredata.optstore.get_value_object(k))
+                        k = k.evolve(subproject=self.subproject)
+                        options[k] = v
+                    self.coredata.add_compiler_options(options, lang, for_machine, self.environment, self.subproject)
+
+                if for_machine == MachineChoice.HOST or self.environment.is_cross_build():
+                    logger_fun = mlog.log
+                else:
+                    logger_fun = mlog.debug
+                logger_fun(comp.get_display_language(), 'compiler for the', machine_name, 'machine:',
+                           mlog.bold(' '.join(comp.get_exelist())), comp.get_version_string())
+                if comp.linker is not None:
+                    logger_fun(comp.get_display_language(), 'linker for the', machine_name, 'machine:',
+                               mlog.bold(' '.join(comp.linker.get_exelist())), comp.linker.id, comp.linker.version)
+                self.build.ensure_static_linker(comp)
+                self.compilers[for_machine][lang] = comp
 
         return success
 
@@ -1588,7 +1699,7 @@ class Interpreter(InterpreterBase, HoldableObject):
         # Search for scripts relative to current subdir.
         # Do not cache found programs because find_program('foobar')
         # might give different results when run from different source dirs.
-        source_dir = os.path.join(self.environment.get_source_dir(), self.subdir)
+        source_dir = self.source_subdir
         for exename in args:
             if isinstance(exename, mesonlib.File):
                 if exename.is_built:
@@ -1734,7 +1845,7 @@ class Interpreter(InterpreterBase, HoldableObject):
                 assert isinstance(interp, Interpreter), 'for mypy'
                 version = interp.project_version
             else:
-                version = progobj.get_version(self)
+                version = self.get_program_version(progobj)
             is_found, not_found, _ = mesonlib.version_compare_many(version, wanted)
             if not is_found:
                 extra_info[:0] = ['found', mlog.normal_cyan(version), 'but need:',
@@ -1743,6 +1854,25 @@ class Interpreter(InterpreterBase, HoldableObject):
             extra_info.insert(0, mlog.normal_cyan(version))
         return True
 
+    def get_program_version(self, progobj: ExternalProgram) -> str:
+        # Getting the version means running the program, so the answer is
+        # kept in coredata for as long as the files of the command are the
+        # same ones. Those are build definition files either way.
+        cmd = progobj.get_command()
+        try:
+            stamp = tuple((st.st_mtime_ns, st.st_size) for st in (os.stat(c) for c in cmd))
+        except OSError:
+            return progobj.get_version(self)
+        key = (*cmd, progobj.version_arg)
+        cached = self.coredata.program_version_cache.get(key)
+        if cached is not None and cached[0] == stamp:
+            self.add_build_def_file(progobj.get_path())
+            progobj.cached_version = cached[1]
+            return cached[1]
+        version = progobj.get_version(self)
+        self.coredata.program_version_cache[key] = (stamp, version)
+        return version
+
     def find_program_fallback(self, fallback: str, args: T.List[mesonlib.FileOrString],
                               default_options: T.Dict[OptionKey, T.Union[str, int, bool, T.List[str]]],
                               required: bool, extra_info: T.List[mlog.TV_Loggable]
@@ -1949,7 +2079,7 @@ class Interpreter(InterpreterBase, HoldableObject):
         replace_string = kwargs['replace_string']
         regex_selector = '(.*)' # default regex selector for custom command: use complete output
         vcs_cmd = kwargs['command']
-        source_dir = os.path.normpath(os.path.join(self.environment.get_source_dir(), self.subdir))
+        source_dir = os.path.normpath(self.source_subdir)
         if vcs_cmd:
             if isinstance(vcs_cmd[0], (str, mesonlib.File)):
                 if isinstance(vcs_cmd[0], mesonlib.File):
@@ -1960,7 +2090,9 @@ class Interpreter(InterpreterBase, HoldableObject):
             else:
                 FeatureNew.single_use('vcs_tag with custom_tgt, external_program, or exe as the first argument', '0.63.0', self.subproject, location=node)
         else:
-            vcs = mesonlib.detect_vcs(source_dir)
+            if source_dir not in self.detected_vcs:
+                self.detected_vcs[source_dir] = mesonlib.detect_vcs(source_dir)
+            vcs = self.detected_vcs[source_dir]
             if vcs:
                 mlog.log('Found {} repository at {}'.format(vcs['name'], vcs['wc_dir']))
                 vcs_cmd = vcs['get_rev'].split()
@@ -2333,6 +2465,9 @@ class Interpreter(InterpreterBase, HoldableObject):
         # Strings as inputs, so only Files will be returned
         sources = self.source_strings_to_files(args[0])
         for s in sources:
+            if s.endswith(man_page_extensions):
+                continue
+            # Anything else int() reads as 1 to 9 is accepted too, e.g. foo.01
             try:
                 num = int(s.rsplit('.', 1)[-1])
             except (IndexError, ValueError):
@@ -2432,6 +2567,7 @@ class Interpreter(InterpreterBase, HoldableObject):
                 return
 
         prev_subdir = self.subdir
+        prev_source_subdir = self.source_subdir
         subdir = os.path.join(prev_subdir, args[0])
         if os.path.isabs(subdir):
             raise InvalidArguments('Subdir argument must be a relative path.')
@@ -2442,24 +2578,26 @@ class Interpreter(InterpreterBase, HoldableObject):
             raise InvalidArguments(f'Tried to enter directory "{subdir}", which has already been visited.')
         self.processed_buildfiles.add(build_file)
         self.subdir = subdir
+        self.source_subdir = absdir
         os.makedirs(os.path.join(self.environment.build_dir, subdir), exist_ok=True)
         buildfilename = os.path.join(self.subdir, environment.build_filename)
         self.build_def_files.add(buildfilename)
         absname = os.path.join(self.environment.get_source_dir(), buildfilename)
-        if not os.path.isfile(absname):
-            self.subdir = prev_subdir
-            raise InterpreterException(f"Nonexistent build file '{buildfilename!s}'")
-        code = self.read_buildfile(absname, buildfilename)
         try:
-            codeblock = mparser.Parser(code, absname).parse()
+            codeblock = self.parse_buildfile(absname, buildfilename)
         except mesonlib.MesonException as me:
             me.file = absname
             raise me
+        if codeblock is None:
+            self.subdir = prev_subdir
+            self.source_subdir = prev_source_subdir
+            raise InterpreterException(f"Nonexistent build file '{buildfilename!s}'")
         try:
             self.evaluate_codeblock(codeblock)
         except SubdirDoneRequest:
             pass
         self.subdir = prev_subdir
+        self.source_subdir = prev_source_subdir
 
     # This is either ignored on basically any OS nowadays, or silently gets
     # ignored (Solaris) or triggers an "illegal operation" error (FreeBSD).
@@ -2559,7 +2697,7 @@ class Interpreter(InterpreterBase, HoldableObject):
                             kwargs: 'kwtypes.FuncInstallSubdir') -> build.InstallDir:
         exclude = (set(kwargs['exclude_files']), set(kwargs['exclude_directories']))
 
-        srcdir = os.path.join(self.environment.source_dir, self.subdir, args[0])
+        srcdir = os.path.join(self.source_subdir, args[0])
         if not os.path.isdir(srcdir) or not any(os.listdir(srcdir)):
             FeatureNew.single_use('install_subdir with empty directory', '0.47.0', self.subproject, location=node)
             FeatureDeprecated.single_use('install_subdir with empty directory', '0.60.0', self.subproject,
@@ -2861,9 +2999,12 @@ class Interpreter(InterpreterBase, HoldableObject):
                         This warning will become a hard error in a future Meson release.
                         '''))
             absdir_src = os.path.join(absbase_src, a)
+            if absdir_src in self.existing_include_dirs:
+                continue
             absdir_build = os.path.join(absbase_build, a)
             if not os.path.isdir(absdir_src) and not os.path.isdir(absdir_build):
                 raise InvalidArguments(f'Include dir {a} does not exist.')
+            self.existing_include_dirs.add(absdir_src)
         i = build.IncludeDirs(self.subdir, incdir_strings, is_system)
         return i
 
@@ -3078,6 +3219,14 @@ class Interpreter(InterpreterBase, HoldableObject):
     # subproject than it is defined in (due to e.g. a
     # declare_dependency).
     def validate_within_subproject(self, subdir, fname):
+        if type(fname) is str and '..' not in fname and not os.path.isabs(fname) and not os.path.splitdrive(fname)[0]:
+            # By far the most common case, a plain name below the current
+            # subdir. That is within the project, the nested subprojects are
+            # the only place it can still reach.
+            name = os.path.normcase(os.path.normpath(os.path.join(subdir, fname)))
+            nested = os.path.normcase(os.path.normpath(os.path.join(self.root_subdir, self.subproject_dir)))
+            if name != nested and not name.startswith(nested + os.sep):
+                return
         srcdir = Path(self.environment.source_dir)
         builddir = Path(self.environment.build_dir)
         if isinstance(fname, P_OBJ.DependencyVariableString):
@@ -3148,9 +3297,10 @@ class Interpreter(InterpreterBase, HoldableObject):
         if not isinstance(sources, list):
             sources = [sources]
         results: T.List['SourceOutputs'] = []
+        build_dir = self.environment.get_build_dir()
         for s in sources:
             if isinstance(s, str):
-                if not strict and s.startswith(self.environment.get_build_dir()):
+                if not strict and s.startswith(build_dir):
                     results.append(s)
                     mlog.warning(f'Source item {s!r} cannot be converted to File object, because it is a generated file. '
                                  'This will become a hard error in the future.', location=self.current_node)
@@ -3205,7 +3355,8 @@ class Interpreter(InterpreterBase, HoldableObject):
         if idname in self.build.targets:
             raise InvalidCode(f'Tried to create target "{name}", but a target of that name already exists.')
 
-        if isinstance(tobj, build.Executable) and namedir in self.build.targetnames:
+        is_executable = isinstance(tobj, build.Executable)
+        if is_executable and namedir in self.build.targetnames:
             FeatureNew.single_use(f'multiple executables with the same name, "{tobj.name}", but different suffixes in the same directory',
                                   '1.3.0', self.subproject, location=self.current_node)
 
@@ -3216,8 +3367,8 @@ class Interpreter(InterpreterBase, HoldableObject):
 
         self.build.targets[idname] = tobj
         # Only need to add executables to this set
-        if isinstance(tobj, build.Executable):
-            self.build.targetnames.update([namedir])
+        if is_executable:
+            self.build.targetnames.add(namedir)
         if idname not in self.coredata.target_guids:
             self.coredata.target_guids[idname] = str(uuid.uuid4()).upper()
 
@@ -3281,13 +3432,11 @@ class Interpreter(InterpreterBase, HoldableObject):
         """
         depend_files: T.List[mesonlib.File] = []
         args: T.List[str] = []
-        build_to_source = mesonlib.relpath(self.environment.get_source_dir(),
-                                           self.environment.get_build_dir())
 
         for a in raw:
             if isinstance(a, mesonlib.File):
                 depend_files.append(a)
-                args.append(a.rel_to_builddir(build_to_source))
+                args.append(a.rel_to_builddir(self.build_to_src))
             else:
                 args.append(a)
 
@@ -3365,8 +3514,8 @@ class Interpreter(InterpreterBase, HoldableObject):
         objs = kwargs['objects']
         kwargs['dependencies'] = extract_as_list(kwargs, 'dependencies')
         kwargs['extra_files'] = self.source_strings_to_files(kwargs['extra_files'])
-        self.check_sources_exist(os.path.join(self.source_root, self.subdir), sources)
-        if targetclass not in {build.Executable, build.SharedLibrary, build.SharedModule, build.StaticLibrary, build.Jar}:
+        self.check_sources_exist(self.source_subdir, sources)
+        if targetclass not in _BUILD_TARGET_CLASSES:
             mlog.debug('Unknown target type:', str(targetclass))
             raise RuntimeError('Unreachable code')
         self.__process_language_args(kwargs)
@@ -3385,7 +3534,8 @@ class Interpreter(InterpreterBase, HoldableObject):
 
         # Filter out kwargs from other target types. For example 'soversion'
         # passed to library() when default_library == 'static'.
-        kwargs = {k: v for k, v in kwargs.items() if k in targetclass.known_kwargs | {'language_args'}}
+        known_kwargs = targetclass.known_kwargs | {'language_args'}
+        kwargs = {k: v for k, v in kwargs.items() if k in known_kwargs}
 
         srcs: T.List['SourceInputs'] = []
         struct: T.Optional[build.StructuredSources] = build.StructuredSources()
@@ -3466,7 +3616,7 @@ class Interpreter(InterpreterBase, HoldableObject):
                     if os.path.normpath(i).startswith(self.environment.get_source_dir()):
                         mlog.warning('''Building a path to the source dir is not supported. Use a relative path instead.
 This will become a hard error in the future.''', location=self.current_node)
-                        i = os.path.relpath(i, os.path.join(self.environment.get_source_dir(), self.subdir))
+                        i = os.path.relpath(i, self.source_subdir)
                         i = self.build_incdir_object([i])
                 cleaned_items.append(i)
             kwargs['d_import_dirs'] = cleaned_items
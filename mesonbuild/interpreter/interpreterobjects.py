@@ -231,7 +231,9 @@ class RunProcess(MesonInterpreterObject):
                     mesonintrospect: T.List[str],
                     in_builddir: bool,
                     check: bool = False) -> T.Tuple[int, str, str]:
-        command_array = cmd.get_command() + args
+        # get_command() already returns a copy that we can extend in place
+        command_array = cmd.get_command()
+        command_array.extend(args)
         menv = {'MESON_SOURCE_ROOT': source_dir,
                 'MESON_BUILD_ROOT': build_dir,
                 'MESON_SUBDIR': subdir,
@@ -241,9 +243,7 @@ class RunProcess(MesonInterpreterObject):
             cwd = os.path.join(build_dir, subdir)
         else:
             cwd = os.path.join(source_dir, subdir)
-        child_env = os.environ.copy()
-        child_env.update(menv)
-        child_env = env.get_env(child_env)
+        child_env = env.get_env({**os.environ, **menv})
         stdout = subprocess.PIPE if self.capture else subprocess.DEVNULL
         mlog.debug('Running command:', mesonlib.join_args(command_array))
         try:
@@ -335,18 +335,16 @@ _CONF_DATA_SET_KWS: KwargInfo[T.Optional[str]] = KwargInfo('description', (str,
 
 
 class ConfigurationDataHolder(ObjectHolder[build.ConfigurationData], MutableInterpreterObject):
-
-    def __init__(self, obj: build.ConfigurationData, interpreter: 'Interpreter'):
-        super().__init__(obj, interpreter)
-        self.methods.update({'set': self.set_method,
-                             'set10': self.set10_method,
-                             'set_quoted': self.set_quoted_method,
-                             'has': self.has_method,
-                             'get': self.get_method,
-                             'keys': self.keys_method,
-                             'get_unquoted': self.get_unquoted_method,
-                             'merge_from': self.merge_from_method,
-                             })
+    METHODS = {
+        'set': 'set_method',
+        'set10': 'set10_method',
+        'set_quoted': 'set_quoted_method',
+        'has': 'has_method',
+        'get': 'get_method',
+        'keys': 'keys_method',
+        'get_unquoted': 'get_unquoted_method',
+        'merge_from': 'merge_from_method',
+    }
 
     def __deepcopy__(self, memo: T.Dict) -> 'ConfigurationDataHolder':
         return ConfigurationDataHolder(copy.deepcopy(self.held_object), self.interpreter)
@@ -355,7 +353,7 @@ class ConfigurationDataHolder(ObjectHolder[build.ConfigurationData], MutableInte
         return self.held_object.used
 
     def __check_used(self) -> None:
-        if self.is_used():
+        if self.held_object.used:
             raise InterpreterException("Can not set values on configuration object that has been used.")
 
     @typed_pos_args('configuration_data.set', str, (str, int, bool))
@@ -867,18 +865,17 @@ class MutableModuleObjectHolder(ModuleObjectHolder, MutableInterpreterObject):
 _BuildTarget = T.TypeVar('_BuildTarget', bound=T.Union[build.BuildTarget, build.BothLibraries])
 
 class BuildTargetHolder(ObjectHolder[_BuildTarget]):
-    def __init__(self, target: _BuildTarget, interp: 'Interpreter'):
-        super().__init__(target, interp)
-        self.methods.update({'extract_objects': self.extract_objects_method,
-                             'extract_all_objects': self.extract_all_objects_method,
-                             'name': self.name_method,
-                             'get_id': self.get_id_method,
-                             'outdir': self.outdir_method,
-                             'full_path': self.full_path_method,
-                             'path': self.path_method,
-                             'found': self.found_method,
-                             'private_dir_include': self.private_dir_include_method,
-                             })
+    METHODS = {
+        'extract_objects': 'extract_objects_method',
+        'extract_all_objects': 'extract_all_objects_method',
+        'name': 'name_method',
+        'get_id': 'get_id_method',
+        'outdir': 'outdir_method',
+        'full_path': 'full_path_method',
+        'path': 'path_method',
+        'found': 'found_method',
+        'private_dir_include': 'private_dir_include_method',
+    }
 
     def __repr__(self) -> str:
         r = '<{} {}: {}>'
@@ -968,14 +965,14 @@ class StaticLibraryHolder(BuildTargetHolder[build.StaticLibrary]):
 class SharedLibraryHolder(BuildTargetHolder[build.SharedLibrary]):
     pass
 
+# FIXME: This build target always represents the shared library, but
+# that should be configurable.
 class BothLibrariesHolder(BuildTargetHolder[build.BothLibraries]):
-    def __init__(self, libs: build.BothLibraries, interp: 'Interpreter'):
-        # FIXME: This build target always represents the shared library, but
-        # that should be configurable.
-        super().__init__(libs, interp)
-        self.methods.update({'get_shared_lib': self.get_shared_lib_method,
-                             'get_static_lib': self.get_static_lib_method,
-                             })
+    METHODS = {
+        **BuildTargetHolder.METHODS,
+        'get_shared_lib': 'get_shared_lib_method',
+        'get_static_lib': 'get_static_lib_method',
+    }
 
     def __repr__(self) -> str:
         r = '<{} {}: {}, {}: {}>'
@@ -1000,10 +997,9 @@ class JarHolder(BuildTargetHolder[build.Jar]):
     pass
 
 class CustomTargetIndexHolder(ObjectHolder[build.CustomTargetIndex]):
-    def __init__(self, target: build.CustomTargetIndex, interp: 'Interpreter'):
-        super().__init__(target, interp)
-        self.methods.update({'full_path': self.full_path_method,
-                             })
+    METHODS = {
+        'full_path': 'full_path_method',
+    }
 
     @FeatureNew('custom_target[i].full_path', '0.54.0')
     @noPosargs
@@ -1015,12 +1011,13 @@ class CustomTargetIndexHolder(ObjectHolder[build.CustomTargetIndex]):
 _CT = T.TypeVar('_CT', bound=build.CustomTarget)
 
 class _CustomTargetHolder(ObjectHolder[_CT]):
+    METHODS = {
+        'full_path': 'full_path_method',
+        'to_list': 'to_list_method',
+    }
+
     def __init__(self, target: _CT, interp: 'Interpreter'):
         super().__init__(target, interp)
-        self.methods.update({'full_path': self.full_path_method,
-                             'to_list': self.to_list_method,
-                             })
-
         self.operators.update({
             MesonOperator.INDEX: self.op_index,
         })
@@ -1065,9 +1062,9 @@ class GeneratedListHolder(ObjectHolder[build.GeneratedList]):
     pass
 
 class GeneratorHolder(ObjectHolder[build.Generator]):
-    def __init__(self, gen: build.Generator, interpreter: 'Interpreter'):
-        super().__init__(gen, interpreter)
-        self.methods.update({'process': self.process_method})
+    METHODS = {
+        'process': 'process_method',
+    }
 
     @typed_pos_args('generator.process', min_varargs=1, varargs=(str, mesonlib.File, build.CustomTarget, build.CustomTargetIndex, build.GeneratedList))
     @typed_kwargs(
@@ -50,42 +50,44 @@ if T.TYPE_CHECKING:
 
 
 class MesonMain(MesonInterpreterObject):
+    METHODS = {
+        'add_devenv': 'add_devenv_method',
+        'add_dist_script': 'add_dist_script_method',
+        'add_install_script': 'add_install_script_method',
+        'add_postconf_script': 'add_postconf_script_method',
+        'backend': 'backend_method',
+        'build_options': 'build_options_method',
+        'build_root': 'build_root_method',
+        'can_run_host_binaries': 'can_run_host_binaries_method',
+        'current_source_dir': 'current_source_dir_method',
+        'current_build_dir': 'current_build_dir_method',
+        'get_compiler': 'get_compiler_method',
+        'get_cross_property': 'get_cross_property_method',
+        'get_external_property': 'get_external_property_method',
+        'global_build_root': 'global_build_root_method',
+        'global_source_root': 'global_source_root_method',
+        'has_exe_wrapper': 'has_exe_wrapper_method',
+        'has_external_property': 'has_external_property_method',
+        'install_dependency_manifest': 'install_dependency_manifest_method',
+        'is_cross_build': 'is_cross_build_method',
+        'is_subproject': 'is_subproject_method',
+        'is_unity': 'is_unity_method',
+        'override_dependency': 'override_dependency_method',
+        'override_find_program': 'override_find_program_method',
+        'project_build_root': 'project_build_root_method',
+        'project_license': 'project_license_method',
+        'project_license_files': 'project_license_files_method',
+        'project_name': 'project_name_method',
+        'project_source_root': 'project_source_root_method',
+        'project_version': 'project_version_method',
+        'source_root': 'source_root_method',
+        'version': 'version_method',
+    }
+
     def __init__(self, build: 'build.Build', interpreter: 'Interpreter'):
         super().__init__(subproject=interpreter.subproject)
         self.build = build
         self.interpreter = interpreter
-        self.methods.update({'add_devenv': self.add_devenv_method,
-                             'add_dist_script': self.add_dist_script_method,
-                             'add_install_script': self.add_install_script_method,
-                             'add_postconf_script': self.add_postconf_script_method,
-                             'backend': self.backend_method,
-                             'build_options': self.build_options_method,
-                             'build_root': self.build_root_method,
-                             'can_run_host_binaries': self.can_run_host_binaries_method,
-                             'current_source_dir': self.current_source_dir_method,
-                             'current_build_dir': self.current_build_dir_method,
-                             'get_compiler': self.get_compiler_method,
-                             'get_cross_property': self.get_cross_property_method,
-                             'get_external_property': self.get_external_property_method,
-                             'global_build_root': self.global_build_root_method,
-                             'global_source_root': self.global_source_root_method,
-                             'has_exe_wrapper': self.has_exe_wrapper_method,
-                             'has_external_property': self.has_external_property_method,
-                             'install_dependency_manifest': self.install_dependency_manifest_method,
-                             'is_cross_build': self.is_cross_build_method,
-                             'is_subproject': self.is_subproject_method,
-                             'is_unity': self.is_unity_method,
-                             'override_dependency': self.override_dependency_method,
-                             'override_find_program': self.override_find_program_method,
-                             'project_build_root': self.project_build_root_method,
-                             'project_license': self.project_license_method,
-                             'project_license_files': self.project_license_files_method,
-                             'project_name': self.project_name_method,
-                             'project_source_root': self.project_source_root_method,
-                             'project_version': self.project_version_method,
-                             'source_root': self.source_root_method,
-                             'version': self.version_method,
-                             })
 
     def _find_source_script(
             self, name: str, prog: T.Union[str, mesonlib.File, build.Executable, ExternalProgram],
@@ -27,13 +27,14 @@ if T.TYPE_CHECKING:
     from ...interpreterbase import TYPE_kwargs
 
 class ArrayHolder(ObjectHolder[T.List[TYPE_var]], IterableObject):
+    METHODS = {
+        'contains': 'contains_method',
+        'length': 'length_method',
+        'get': 'get_method',
+    }
+
     def __init__(self, obj: T.List[TYPE_var], interpreter: 'Interpreter') -> None:
         super().__init__(obj, interpreter)
-        self.methods.update({
-            'contains': self.contains_method,
-            'length': self.length_method,
-            'get': self.get_method,
-        })
 
         self.trivial_operators.update({
             MesonOperator.EQUALS: (list, lambda x: self.held_object == x),
@@ -64,16 +65,16 @@ class ArrayHolder(ObjectHolder[T.List[TYPE_var]], IterableObject):
     @noKwargs
     @typed_pos_args('array.contains', object)
     def contains_method(self, args: T.Tuple[object], kwargs: TYPE_kwargs) -> bool:
-        def check_contains(el: T.List[TYPE_var]) -> bool:
-            for element in el:
-                if isinstance(element, list):
-                    found = check_contains(element)
-                    if found:
-                        return True
-                if element == args[0]:
-                    return True
-            return False
-        return check_contains(self.held_object)
+        # Nested arrays are searched too, the `in` test of each one runs at C
+        # level
+        item = args[0]
+        stack = [self.held_object]
+        while stack:
+            el = stack.pop()
+            if item in el:
+                return True
+            stack.extend(e for e in el if isinstance(e, list))
+        return False
 
     @noKwargs
     @noPosargs
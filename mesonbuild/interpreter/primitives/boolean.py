@@ -20,12 +20,13 @@ if T.TYPE_CHECKING:
     from ...interpreterbase import TYPE_var, TYPE_kwargs
 
 class BooleanHolder(ObjectHolder[bool]):
+    METHODS = {
+        'to_int': 'to_int_method',
+        'to_string': 'to_string_method',
+    }
+
     def __init__(self, obj: bool, interpreter: 'Interpreter') -> None:
         super().__init__(obj, interpreter)
-        self.methods.update({
-            'to_int': self.to_int_method,
-            'to_string': self.to_string_method,
-        })
 
         self.trivial_operators.update({
             MesonOperator.BOOL: (None, lambda x: self.held_object),
@@ -25,13 +25,14 @@ if T.TYPE_CHECKING:
     from ...interpreterbase import TYPE_kwargs
 
 class DictHolder(ObjectHolder[T.Dict[str, TYPE_var]], IterableObject):
+    METHODS = {
+        'has_key': 'has_key_method',
+        'keys': 'keys_method',
+        'get': 'get_method',
+    }
+
     def __init__(self, obj: T.Dict[str, TYPE_var], interpreter: 'Interpreter') -> None:
         super().__init__(obj, interpreter)
-        self.methods.update({
-            'has_key': self.has_key_method,
-            'keys': self.keys_method,
-            'get': self.get_method,
-        })
 
         self.trivial_operators.update({
             # Arithmetic
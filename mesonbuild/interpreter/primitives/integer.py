@@ -15,13 +15,14 @@ if T.TYPE_CHECKING:
     from ...interpreterbase import TYPE_var, TYPE_kwargs
 
 class IntegerHolder(ObjectHolder[int]):
+    METHODS = {
+        'is_even': 'is_even_method',
+        'is_odd': 'is_odd_method',
+        'to_string': 'to_string_method',
+    }
+
     def __init__(self, obj: int, interpreter: 'Interpreter') -> None:
         super().__init__(obj, interpreter)
-        self.methods.update({
-            'is_even': self.is_even_method,
-            'is_odd': self.is_odd_method,
-            'to_string': self.to_string_method,
-        })
 
         self.trivial_operators.update({
             # Arithmetic
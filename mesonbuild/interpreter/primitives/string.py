@@ -28,26 +28,30 @@ if T.TYPE_CHECKING:
     from ...interpreter import Interpreter
     from ...interpreterbase import TYPE_var, TYPE_kwargs
 
+format_regex = re.compile(r'@(\d+)@')
+underscorify_regex = re.compile(r'[^a-zA-Z0-9]')
+
 class StringHolder(ObjectHolder[str]):
+    METHODS = {
+        'contains': 'contains_method',
+        'startswith': 'startswith_method',
+        'endswith': 'endswith_method',
+        'format': 'format_method',
+        'join': 'join_method',
+        'replace': 'replace_method',
+        'split': 'split_method',
+        'splitlines': 'splitlines_method',
+        'strip': 'strip_method',
+        'substring': 'substring_method',
+        'to_int': 'to_int_method',
+        'to_lower': 'to_lower_method',
+        'to_upper': 'to_upper_method',
+        'underscorify': 'underscorify_method',
+        'version_compare': 'version_compare_method',
+    }
+
     def __init__(self, obj: str, interpreter: 'Interpreter') -> None:
         super().__init__(obj, interpreter)
-        self.methods.update({
-            'contains': self.contains_method,
-            'startswith': self.startswith_method,
-            'endswith': self.endswith_method,
-            'format': self.format_method,
-            'join': self.join_method,
-            'replace': self.replace_method,
-            'split': self.split_method,
-            'splitlines': self.splitlines_method,
-            'strip': self.strip_method,
-            'substring': self.substring_method,
-            'to_int': self.to_int_method,
-            'to_lower': self.to_lower_method,
-            'to_upper': self.to_upper_method,
-            'underscorify': self.underscorify_method,
-            'version_compare': self.version_compare_method,
-        })
 
         self.trivial_operators.update({
             # Arithmetic
@@ -106,7 +110,7 @@ class StringHolder(ObjectHolder[str]):
                 raise InvalidArguments(f'Format placeholder @{idx}@ out of range.')
             return arg_strings[idx]
 
-        return re.sub(r'@(\d+)@', arg_replace, self.held_object)
+        return format_regex.sub(arg_replace, self.held_object)
 
     @noKwargs
     @noPosargs
@@ -166,7 +170,7 @@ class StringHolder(ObjectHolder[str]):
     @noKwargs
     @noPosargs
     def underscorify_method(self, args: T.List[TYPE_var], kwargs: TYPE_kwargs) -> str:
-        return re.sub(r'[^a-zA-Z0-9]', '_', self.held_object)
+        return underscorify_regex.sub('_', self.held_object)
 
     @noKwargs
     @typed_pos_args('str.version_compare', str)
@@ -137,9 +137,8 @@ def variables_validator(contents: T.Union[str, T.List[str], T.Dict[str, str]]) -
     else:
         variables = {}
         for v in contents:
-            try:
-                key, val = v.split('=', 1)
-            except ValueError:
+            key, sep, val = v.partition('=')
+            if not sep:
                 return f'variable {v!r} must have a value separated by equals sign.'
             variables[key.strip()] = val.strip()
     for k, v in variables.items():
@@ -157,7 +156,7 @@ def variables_convertor(contents: T.Union[str, T.List[str], T.Dict[str, str]]) -
         return contents
     variables = {}
     for v in contents:
-        key, val = v.split('=', 1)
+        key, _, val = v.partition('=')
         variables[key.strip()] = val.strip()
     return variables
 
@@ -195,8 +194,7 @@ DISABLER_KW: KwargInfo[bool] = KwargInfo('disabler', bool, default=False)
 def _env_validator(value: T.Union[EnvironmentVariables, T.List['TYPE_var'], T.Dict[str, 'TYPE_var'], str, None],
                    only_dict_str: bool = True) -> T.Optional[str]:
     def _splitter(v: str) -> T.Optional[str]:
-        split = v.split('=', 1)
-        if len(split) == 1:
+        if '=' not in v:
             return f'"{v}" is not two string values separated by an "="'
         return None
 
@@ -235,7 +233,7 @@ def split_equal_string(input: str) -> T.Tuple[str, str]:
 
     This assumes that the string has already been validated to split properly.
     """
-    a, b = input.split('=', 1)
+    a, _, b = input.partition('=')
     return (a, b)
 
 # Split _env_convertor() and env_convertor_with_method() to make mypy happy.
@@ -38,6 +38,12 @@ TYPE_key_resolver = T.Callable[[mparser.BaseNode], str]
 SubProject = T.NewType('SubProject', str)
 
 class InterpreterObject:
+    # Methods that are the same for every instance of a class, as a mapping
+    # from the name used in meson.build to the name of the Python method.
+    # Objects that are created very often use this instead of filling
+    # self.methods with bound methods in __init__.
+    METHODS: T.ClassVar[T.Dict[str, str]] = {}
+
     def __init__(self, *, subproject: T.Optional['SubProject'] = None) -> None:
         self.methods: T.Dict[
             str,
@@ -72,8 +78,10 @@ class InterpreterObject:
                 args: T.List[TYPE_var],
                 kwargs: TYPE_kwargs
             ) -> TYPE_var:
-        if method_name in self.methods:
-            method = self.methods[method_name]
+        method = self.methods.get(method_name)
+        if method is None and method_name in self.METHODS:
+            method = getattr(self, self.METHODS[method_name])
+        if method is not None:
             if not getattr(method, 'no-args-flattening', False):
                 args = flatten(args)
             if not getattr(method, 'no-second-level-holder-flattening', False):
@@ -44,11 +44,12 @@ def get_callee_args(wrapped_args: T.Sequence[T.Any]) -> T.Tuple['mparser.BaseNod
         kwargs = wrapped_args[-1]
     return node, args, kwargs, subproject
 
+# noPosargs and noKwargs wrap almost every method, so they pick args and
+# kwargs out directly instead of going through get_callee_args().
 def noPosargs(f: TV_func) -> TV_func:
     @wraps(f)
     def wrapped(*wrapped_args: T.Any, **wrapped_kwargs: T.Any) -> T.Any:
-        args = get_callee_args(wrapped_args)[1]
-        if args:
+        if len(wrapped_args) >= 3 and wrapped_args[-2]:
             raise InvalidArguments('Function does not take positional arguments.')
         return f(*wrapped_args, **wrapped_kwargs)
     return T.cast('TV_func', wrapped)
@@ -56,8 +57,7 @@ def noPosargs(f: TV_func) -> TV_func:
 def noKwargs(f: TV_func) -> TV_func:
     @wraps(f)
     def wrapped(*wrapped_args: T.Any, **wrapped_kwargs: T.Any) -> T.Any:
-        kwargs = get_callee_args(wrapped_args)[2]
-        if kwargs:
+        if len(wrapped_args) >= 3 and wrapped_args[-1]:
             raise InvalidArguments('Function does not take keyword arguments.')
         return f(*wrapped_args, **wrapped_kwargs)
     return T.cast('TV_func', wrapped)
@@ -69,7 +69,7 @@ def stringArgs(f: TV_func) -> TV_func:
         if not isinstance(args, list):
             mlog.debug('Not a list:', str(args))
             raise InvalidArguments('Argument not a list.')
-        if not all(isinstance(s, str) for s in args):
+        if not all(map(isinstance, args, itertools.repeat(str))):
             mlog.debug('Element not a string:', str(args))
             raise InvalidArguments('Arguments must be strings.')
         return f(*wrapped_args, **wrapped_kwargs)
@@ -181,21 +181,36 @@ def typed_pos_args(name: str, *types: T.Union[T.Type, T.Tuple[T.Type, ...]],
     correct, all of the arguments are string names of files. If the first
     argument is something else the it should be separated.
     """
+    num_types = len(types)
+
     def inner(f: TV_func) -> TV_func:
 
         @wraps(f)
         def wrapper(*wrapped_args: T.Any, **wrapped_kwargs: T.Any) -> T.Any:
-            args = get_callee_args(wrapped_args)[1]
+            # Picked out directly, see noPosargs()
+            args = wrapped_args[-2]
 
             # These are implementation programming errors, end users should never see them.
-            assert isinstance(args, list), args
+            assert len(wrapped_args) >= 3 and isinstance(args, list), args
             assert max_varargs >= 0, 'max_varags cannot be negative'
             assert min_varargs >= 0, 'min_varags cannot be negative'
             assert optargs is None or varargs is None, \
                 'varargs and optargs not supported together as this would be ambiguous'
 
             num_args = len(args)
-            num_types = len(types)
+
+            if not varargs and not optargs:
+                # Most functions take a fixed number of arguments
+                if num_args != num_types:
+                    raise InvalidArguments(f'{name} takes exactly {num_types} arguments, but got {num_args}.')
+                for arg, type_ in zip(args, types):
+                    if not isinstance(arg, type_):
+                        break
+                else:
+                    nargs = list(wrapped_args)
+                    nargs[-2] = tuple(args)
+                    return f(*nargs, **wrapped_kwargs)
+
             a_types = types
 
             if varargs:
@@ -229,7 +244,7 @@ def typed_pos_args(name: str, *types: T.Union[T.Type, T.Tuple[T.Type, ...]],
             # Depending on what kind of function we're calling the length of
             # wrapped_args can vary.
             nargs = list(wrapped_args)
-            i = nargs.index(args)
+            i = len(nargs) - 2  # where get_callee_args() found them
             if varargs:
                 # if we have varargs we need to split them into a separate
                 # tuple, as python's typing doesn't understand tuples with
@@ -286,7 +301,7 @@ class ContainerTypeInfo:
         if not isinstance(value, self.container):
             return False
         iter_ = iter(value.values()) if isinstance(value, dict) else iter(value)
-        if any(not isinstance(i, self.contains) for i in iter_):
+        if not all(map(isinstance, iter_, itertools.repeat(self.contains))):
             return False
         if self.pairs and len(value) % 2 != 0:
             return False
@@ -485,47 +500,54 @@ def typed_kwargs(name: str, *types: KwargInfo, allow_unknown: bool = False) -> T
                     return True
             return False
 
+        def emit_feature_change(values: T.Dict[_T, T.Union[str, T.Tuple[str, str]]], feature: T.Union[T.Type['FeatureDeprecated'], T.Type['FeatureNew']],
+                                info: KwargInfo, value: T.Any, subproject: 'SubProject', node: 'mparser.BaseNode') -> None:
+            for n, version in values.items():
+                if isinstance(version, tuple):
+                    version, msg = version
+                else:
+                    msg = None
+
+                warning: T.Optional[str] = None
+                if isinstance(n, ContainerTypeInfo):
+                    if n.check_any(value):
+                        warning = f'of type {n.description()}'
+                elif isinstance(n, type):
+                    if isinstance(value, n):
+                        warning = f'of type {n.__name__}'
+                elif isinstance(value, list):
+                    if n in value:
+                        warning = f'value "{n}" in list'
+                elif isinstance(value, dict):
+                    if n in value.keys():
+                        warning = f'value "{n}" in dict keys'
+                elif n == value:
+                    warning = f'value "{n}"'
+                if warning:
+                    feature.single_use(f'"{name}" keyword argument "{info.name}" {warning}', version, subproject, msg, location=node)
+
+        # Worked out once here instead of on every call. Without any
+        # ContainerTypeInfo the type check is a single isinstance() call.
+        all_names = frozenset(t.name for t in types)
+        checks: T.List[T.Tuple[KwargInfo, T.Tuple[T.Union[T.Type, ContainerTypeInfo], ...], T.Optional[T.Tuple[T.Type, ...]]]] = []
+        for info in types:
+            types_tuple = info.types if isinstance(info.types, tuple) else (info.types,)
+            plain_types = None if any(isinstance(t, ContainerTypeInfo) for t in types_tuple) else T.cast('T.Tuple[T.Type, ...]', types_tuple)
+            checks.append((info, types_tuple, plain_types))
+
         @wraps(f)
         def wrapper(*wrapped_args: T.Any, **wrapped_kwargs: T.Any) -> T.Any:
-
-            def emit_feature_change(values: T.Dict[_T, T.Union[str, T.Tuple[str, str]]], feature: T.Union[T.Type['FeatureDeprecated'], T.Type['FeatureNew']]) -> None:
-                for n, version in values.items():
-                    if isinstance(version, tuple):
-                        version, msg = version
-                    else:
-                        msg = None
-
-                    warning: T.Optional[str] = None
-                    if isinstance(n, ContainerTypeInfo):
-                        if n.check_any(value):
-                            warning = f'of type {n.description()}'
-                    elif isinstance(n, type):
-                        if isinstance(value, n):
-                            warning = f'of type {n.__name__}'
-                    elif isinstance(value, list):
-                        if n in value:
-                            warning = f'value "{n}" in list'
-                    elif isinstance(value, dict):
-                        if n in value.keys():
-                            warning = f'value "{n}" in dict keys'
-                    elif n == value:
-                        warning = f'value "{n}"'
-                    if warning:
-                        feature.single_use(f'"{name}" keyword argument "{info.name}" {warning}', version, subproject, msg, location=node)
-
             node, _, _kwargs, subproject = get_callee_args(wrapped_args)
             # Cast here, as the convertor function may place something other than a TYPE_var in the kwargs
             kwargs = T.cast('T.Dict[str, object]', _kwargs)
 
             if not allow_unknown:
-                all_names = {t.name for t in types}
-                unknowns = set(kwargs).difference(all_names)
+                unknowns = kwargs.keys() - all_names
                 if unknowns:
                     ustr = ', '.join([f'"{u}"' for u in sorted(unknowns)])
                     raise InvalidArguments(f'{name} got unknown keyword arguments {ustr}')
 
-            for info in types:
-                types_tuple = info.types if isinstance(info.types, tuple) else (info.types,)
+            for info, types_tuple, plain_types in checks:
                 value = kwargs.get(info.name)
                 if value is not None:
                     if info.since:
@@ -536,7 +558,7 @@ def typed_kwargs(name: str, *types: KwargInfo, allow_unknown: bool = False) -> T
                         FeatureDeprecated.single_use(feature_name, info.deprecated, subproject, info.deprecated_message, location=node)
                     if info.listify:
                         kwargs[info.name] = value = mesonlib.listify(value)
-                    if not check_value_type(types_tuple, value):
+                    if not (isinstance(value, plain_types) if plain_types is not None else check_value_type(types_tuple, value)):
                         shouldbe = types_description(types_tuple)
                         raise InvalidArguments(f'{name} keyword argument {info.name!r} was of type {raw_description(value)} but should have been {shouldbe}')
 
@@ -546,10 +568,10 @@ def typed_kwargs(name: str, *types: KwargInfo, allow_unknown: bool = False) -> T
                             raise InvalidArguments(f'{name} keyword argument "{info.name}" {msg}')
 
                     if info.deprecated_values is not None:
-                        emit_feature_change(info.deprecated_values, FeatureDeprecated)
+                        emit_feature_change(info.deprecated_values, FeatureDeprecated, info, value, subproject, node)
 
                     if info.since_values is not None:
-                        emit_feature_change(info.since_values, FeatureNew)
+                        emit_feature_change(info.since_values, FeatureNew, info, value, subproject, node)
 
                 elif info.required:
                     raise InvalidArguments(f'{name} is missing required keyword argument "{info.name}"')
@@ -20,27 +20,44 @@ def flatten(args: T.Union['TYPE_var', T.List['TYPE_var']]) -> T.List['TYPE_var']
         return [args.value]
     if not isinstance(args, collections.abc.Sequence):
         return [args]
-    result: T.List['TYPE_var'] = []
+    # Arguments are usually flat already, a plain copy does then
     for a in args:
-        if isinstance(a, list):
-            rest = flatten(a)
-            result = result + rest
-        elif isinstance(a, mparser.StringNode):
-            result.append(a.value)
+        if isinstance(a, (list, mparser.StringNode)):
+            break
+    else:
+        return list(args)
+    result: T.List['TYPE_var'] = []
+    # Walk nested lists with an explicit stack of iterators, appending to a
+    # single result list
+    stack = [iter(args)]
+    while stack:
+        for a in stack[-1]:
+            if isinstance(a, list):
+                stack.append(iter(a))
+                break
+            elif isinstance(a, mparser.StringNode):
+                result.append(a.value)
+            else:
+                result.append(a)
         else:
-            result.append(a)
+            stack.pop()
     return result
 
-def resolve_second_level_holders(args: T.List['TYPE_var'], kwargs: 'TYPE_kwargs') -> T.Tuple[T.List['TYPE_var'], 'TYPE_kwargs']:
-    def resolver(arg: 'TYPE_var') -> 'TYPE_var':
-        if isinstance(arg, list):
-            return [resolver(x) for x in arg]
-        if isinstance(arg, dict):
-            return {k: resolver(v) for k, v in arg.items()}
-        if isinstance(arg, mesonlib.SecondLevelHolder):
-            return arg.get_default_object()
+def _resolve_second_level_holder(arg: 'TYPE_var') -> 'TYPE_var':
+    # Plain strings are by far the most common arguments
+    if isinstance(arg, str):
         return arg
-    return [resolver(x) for x in args], {k: resolver(v) for k, v in kwargs.items()}
+    if isinstance(arg, list):
+        return [_resolve_second_level_holder(x) for x in arg]
+    if isinstance(arg, dict):
+        return {k: _resolve_second_level_holder(v) for k, v in arg.items()}
+    if isinstance(arg, mesonlib.SecondLevelHolder):
+        return arg.get_default_object()
+    return arg
+
+def resolve_second_level_holders(args: T.List['TYPE_var'], kwargs: 'TYPE_kwargs') -> T.Tuple[T.List['TYPE_var'], 'TYPE_kwargs']:
+    return ([_resolve_second_level_holder(x) for x in args],
+            {k: _resolve_second_level_holder(v) for k, v in kwargs.items()})
 
 def default_resolve_key(key: mparser.BaseNode) -> str:
     if not isinstance(key, mparser.IdNode):
@@ -50,18 +67,38 @@ def default_resolve_key(key: mparser.BaseNode) -> str:
 def stringifyUserArguments(args: TYPE_var, subproject: SubProject, quote: bool = False) -> str:
     if isinstance(args, str):
         return f"'{args}'" if quote else args
+    out: T.List[str] = []
+    _stringify_user_argument(args, subproject, quote, out)
+    return ''.join(out)
+
+def _stringify_user_argument(args: TYPE_var, subproject: SubProject, quote: bool, out: T.List[str]) -> None:
+    # Appends to a single output list so nested values don't build
+    # intermediate strings at every level
+    if isinstance(args, str):
+        out.append(f"'{args}'" if quote else args)
     elif isinstance(args, bool):
-        return 'true' if args else 'false'
+        out.append('true' if args else 'false')
     elif isinstance(args, int):
-        return str(args)
+        out.append(str(args))
     elif isinstance(args, list):
-        return '[%s]' % ', '.join([stringifyUserArguments(x, subproject, True) for x in args])
+        out.append('[')
+        for i, x in enumerate(args):
+            if i:
+                out.append(', ')
+            _stringify_user_argument(x, subproject, True, out)
+        out.append(']')
     elif isinstance(args, dict):
-        l = ['{} : {}'.format(stringifyUserArguments(k, subproject, True),
-                              stringifyUserArguments(v, subproject, True)) for k, v in args.items()]
-        return '{%s}' % ', '.join(l)
+        out.append('{')
+        for i, (k, v) in enumerate(args.items()):
+            if i:
+                out.append(', ')
+            _stringify_user_argument(k, subproject, True, out)
+            out.append(' : ')
+            _stringify_user_argument(v, subproject, True, out)
+        out.append('}')
     elif isinstance(args, UserOption):
         from .decorators import FeatureNew
         FeatureNew.single_use('User option in string format', '1.3.0', subproject)
-        return stringifyUserArguments(args.printable_value(), subproject)
-    raise InvalidArguments('Value other than strings, integers, bools, options, dictionaries and lists thereof.')
+        _stringify_user_argument(args.printable_value(), subproject, False, out)
+    else:
+        raise InvalidArguments('Value other than strings, integers, bools, options, dictionaries and lists thereof.')
@@ -60,6 +60,12 @@ if T.TYPE_CHECKING:
     ]
 
 
+# Checked on every assignment
+varname_regex = re.compile(r'[_a-zA-Z][_0-9a-zA-Z]*$')
+# Placeholders of f-strings
+fstring_regex = re.compile(r'@([_a-zA-Z][_0-9a-zA-Z]*)@')
+
+
 class InvalidCodeOnVoid(InvalidCode):
 
     def __init__(self, op_type: str) -> None:
@@ -67,9 +73,15 @@ class InvalidCodeOnVoid(InvalidCode):
 
 
 class InterpreterBase:
+    # Build file functions by name, resolved to a method on first use rather
+    # than filling self.funcs with bound methods for every interpreter.
+    FUNCTIONS: T.ClassVar[T.Dict[str, str]] = {}
+
     def __init__(self, source_root: str, subdir: str, subproject: 'SubProject'):
         self.source_root = source_root
         self.funcs: FunctionType = {}
+        # Functions called so far, with their argument flattening flags
+        self.resolved_funcs: T.Dict[str, T.Tuple[T.Callable[[mparser.BaseNode, T.List[TYPE_var], T.Dict[str, TYPE_var]], TYPE_var], bool, bool]] = {}
         self.builtin: T.Dict[str, InterpreterObject] = {}
         # Holder maps store a mapping from an HoldableObject to a class ObjectHolder
         self.holder_map: HolderMapType = {}
@@ -94,23 +106,36 @@ class InterpreterBase:
         return
 
     def read_buildfile(self, fname: str, errname: str) -> str:
+        # Decoding the whole file at once is faster than reading it in text
+        # mode, newlines are then translated only if there is anything to do.
+        with open(fname, 'rb') as f:
+            data = f.read()
         try:
-            with open(fname, encoding='utf-8') as f:
-                return f.read()
+            code = data.decode('utf-8')
         except UnicodeDecodeError as e:
             node = mparser.BaseNode(1, 1, errname)
             raise InvalidCode.from_node(f'Build file failed to parse as unicode: {e}', node=node)
+        if '\r' in code:
+            code = code.replace('\r\n', '\n').replace('\r', '\n')
+        return code
+
+    def parse_buildfile(self, fname: str, errname: str, allow_empty: bool = True) -> T.Optional[mparser.CodeBlockNode]:
+        # Returns None if fname is not a file. Every call returns a new AST,
+        # which the caller may modify.
+        if not os.path.isfile(fname):
+            return None
+        code = self.read_buildfile(fname, errname)
+        if not allow_empty and code.isspace():
+            raise InvalidCode('Builder file is empty.')
+        return mparser.Parser(code, fname).parse()
 
     def load_root_meson_file(self) -> None:
         mesonfile = os.path.join(self.source_root, self.subdir, environment.build_filename)
-        if not os.path.isfile(mesonfile):
-            raise InvalidArguments(f'Missing Meson file in {mesonfile}')
-        code = self.read_buildfile(mesonfile, mesonfile)
-        if code.isspace():
-            raise InvalidCode('Builder file is empty.')
-        assert isinstance(code, str)
         try:
-            self.ast = mparser.Parser(code, mesonfile).parse()
+            ast = self.parse_buildfile(mesonfile, mesonfile, allow_empty=False)
+            if ast is None:
+                raise InvalidArguments(f'Missing Meson file in {mesonfile}')
+            self.ast = ast
             self.handle_meson_version_from_ast()
         except mparser.ParseException as me:
             me.file = mesonfile
@@ -178,82 +203,42 @@ class InterpreterBase:
             e.lineno = node.lineno
             e.colno = node.colno
             raise e
-        statements = node.lines[start:end]
-        i = 0
-        while i < len(statements):
-            cur = statements[i]
-            try:
+        # Bound once, this loop runs for every statement of every block. The
+        # error handling only looks at self.current_node, so it can be set up
+        # once for the whole block too.
+        evaluate_statement = self.evaluate_statement
+        try:
+            for cur in (node.lines if start == 0 and end is None else node.lines[start:end]):
                 self.current_lineno = cur.lineno
-                self.evaluate_statement(cur)
-            except Exception as e:
-                if getattr(e, 'lineno', None) is None:
-                    # We are doing the equivalent to setattr here and mypy does not like it
-                    # NOTE: self.current_node is continually updated during processing
-                    e.lineno = self.current_node.lineno                                               # type: ignore
-                    e.colno = self.current_node.colno                                                 # type: ignore
-                    e.file = os.path.join(self.source_root, self.subdir, environment.build_filename)  # type: ignore
-                raise e
-            i += 1 # In THE FUTURE jump over blocks and stuff.
+                evaluate_statement(cur)
+        except Exception as e:
+            if getattr(e, 'lineno', None) is None:
+                # We are doing the equivalent to setattr here and mypy does not like it
+                # NOTE: self.current_node is continually updated during processing
+                e.lineno = self.current_node.lineno                                               # type: ignore
+                e.colno = self.current_node.colno                                                 # type: ignore
+                e.file = os.path.join(self.source_root, self.subdir, environment.build_filename)  # type: ignore
+            raise e
 
     def evaluate_statement(self, cur: mparser.BaseNode) -> T.Optional[InterpreterObject]:
         self.current_node = cur
-        if isinstance(cur, mparser.FunctionNode):
-            return self.function_call(cur)
-        elif isinstance(cur, mparser.PlusAssignmentNode):
-            self.evaluate_plusassign(cur)
-        elif isinstance(cur, mparser.AssignmentNode):
-            self.assignment(cur)
-        elif isinstance(cur, mparser.MethodNode):
-            return self.method_call(cur)
-        elif isinstance(cur, mparser.StringNode):
-            if cur.is_fstring:
-                if cur.is_multiline:
-                    return self.evaluate_multiline_fstring(cur)
-                else:
-                    return self.evaluate_fstring(cur)
+        evaluator = _STATEMENT_EVALUATORS.get(type(cur))
+        if evaluator is None:
+            # Subclasses of the node types still work, just more slowly
+            for node_type, evaluator in _STATEMENT_EVALUATORS.items():
+                if isinstance(cur, node_type):
+                    break
             else:
-                return self._holderify(cur.value)
-        elif isinstance(cur, mparser.BooleanNode):
-            return self._holderify(cur.value)
-        elif isinstance(cur, mparser.IfClauseNode):
-            return self.evaluate_if(cur)
-        elif isinstance(cur, mparser.IdNode):
-            return self.get_variable(cur.value)
-        elif isinstance(cur, mparser.ComparisonNode):
-            return self.evaluate_comparison(cur)
-        elif isinstance(cur, mparser.ArrayNode):
-            return self.evaluate_arraystatement(cur)
-        elif isinstance(cur, mparser.DictNode):
-            return self.evaluate_dictstatement(cur)
-        elif isinstance(cur, mparser.NumberNode):
-            return self._holderify(cur.value)
-        elif isinstance(cur, mparser.AndNode):
-            return self.evaluate_andstatement(cur)
-        elif isinstance(cur, mparser.OrNode):
-            return self.evaluate_orstatement(cur)
-        elif isinstance(cur, mparser.NotNode):
-            return self.evaluate_notstatement(cur)
-        elif isinstance(cur, mparser.UMinusNode):
-            return self.evaluate_uminusstatement(cur)
-        elif isinstance(cur, mparser.ArithmeticNode):
-            return self.evaluate_arithmeticstatement(cur)
-        elif isinstance(cur, mparser.ForeachClauseNode):
-            self.evaluate_foreach(cur)
-        elif isinstance(cur, mparser.IndexNode):
-            return self.evaluate_indexing(cur)
-        elif isinstance(cur, mparser.TernaryNode):
-            return self.evaluate_ternary(cur)
-        elif isinstance(cur, mparser.ContinueNode):
-            raise ContinueRequest()
-        elif isinstance(cur, mparser.BreakNode):
-            raise BreakRequest()
-        elif isinstance(cur, mparser.ParenthesizedNode):
-            return self.evaluate_statement(cur.inner)
-        elif isinstance(cur, mparser.TestCaseClauseNode):
-            return self.evaluate_testcase(cur)
-        else:
-            raise InvalidCode("Unknown statement.")
-        return None
+                raise InvalidCode("Unknown statement.")
+        return evaluator(self, cur)
+
+    def evaluate_string(self, cur: mparser.StringNode) -> InterpreterObject:
+        if cur.is_fstring:
+            if cur.is_multiline:
+                return self.evaluate_multiline_fstring(cur)
+            else:
+                return self.evaluate_fstring(cur)
+        return self._holderify(cur.value)
 
     def evaluate_arraystatement(self, cur: mparser.ArrayNode) -> InterpreterObject:
         (arguments, kwargs) = self.reduce_arguments(cur.args)
@@ -450,7 +435,7 @@ class InterpreterBase:
             except KeyError:
                 raise InvalidCode(f'Identifier "{var}" does not name a variable.')
 
-        res = re.sub(r'@([_a-zA-Z][_0-9a-zA-Z]*)@', replace, node.value)
+        res = fstring_regex.sub(replace, node.value)
         return self._holderify(res)
 
     def evaluate_foreach(self, node: mparser.ForeachClauseNode) -> None:
@@ -463,20 +448,26 @@ class InterpreterBase:
         if len(node.varnames) != (tsize or 1):
             raise InvalidArguments(f'Foreach expects exactly {tsize or 1} variables for iterating over objects of type {items.display_name()}')
 
+        # Bound once, the loop body runs for every item
+        varnames = [v.value for v in node.varnames]
+        block = node.block
+        set_variable = self.set_variable
+        holderify = self._holderify
+        evaluate_codeblock = self.evaluate_codeblock
         for i in items.iter_self():
             if tsize is None:
                 if isinstance(i, tuple):
                     raise mesonlib.MesonBugException(f'Iteration of {items} returned a tuple even though iter_tuple_size() is None')
-                self.set_variable(node.varnames[0].value, self._holderify(i))
+                set_variable(varnames[0], holderify(i))
             else:
                 if not isinstance(i, tuple):
                     raise mesonlib.MesonBugException(f'Iteration of {items} did not return a tuple even though iter_tuple_size() is {tsize}')
                 if len(i) != tsize:
                     raise mesonlib.MesonBugException(f'Iteration of {items} did not return a tuple even though iter_tuple_size() is {tsize}')
                 for j in range(tsize):
-                    self.set_variable(node.varnames[j].value, self._holderify(i[j]))
+                    set_variable(varnames[j], holderify(i[j]))
             try:
-                self.evaluate_codeblock(node.block)
+                evaluate_codeblock(block)
             except ContinueRequest:
                 continue
             except BreakRequest:
@@ -517,19 +508,27 @@ class InterpreterBase:
         (posargs, kwargs) = self._unholder_args(h_posargs, h_kwargs)
         if is_disabled(posargs, kwargs) and func_name not in {'get_variable', 'set_variable', 'unset_variable', 'is_disabler'}:
             return Disabler()
-        if func_name in self.funcs:
-            func = self.funcs[func_name]
-            func_args = posargs
-            if not getattr(func, 'no-args-flattening', False):
-                func_args = flatten(posargs)
-            if not getattr(func, 'no-second-level-holder-flattening', False):
-                func_args, kwargs = resolve_second_level_holders(func_args, kwargs)
-            self.current_node = node
-            res = func(node, func_args, kwargs)
-            return self._holderify(res) if res is not None else None
-        else:
-            self.unknown_function_called(func_name)
-            return None
+        resolved = self.resolved_funcs.get(func_name)
+        if resolved is None:
+            func = self.funcs.get(func_name)
+            if func is None and func_name in self.FUNCTIONS:
+                func = getattr(self, self.FUNCTIONS[func_name])
+            if func is None:
+                self.unknown_function_called(func_name)
+                return None
+            resolved = (func,
+                        not getattr(func, 'no-args-flattening', False),
+                        not getattr(func, 'no-second-level-holder-flattening', False))
+            self.resolved_funcs[func_name] = resolved
+        func, flatten_args, resolve_holders = resolved
+        func_args = posargs
+        if flatten_args:
+            func_args = flatten(posargs)
+        if resolve_holders:
+            func_args, kwargs = resolve_second_level_holders(func_args, kwargs)
+        self.current_node = node
+        res = func(node, func_args, kwargs)
+        return self._holderify(res) if res is not None else None
 
     def method_call(self, node: mparser.MethodNode) -> T.Optional[InterpreterObject]:
         invocable = node.source_object
@@ -597,23 +596,26 @@ class InterpreterBase:
         if args.incorrect_order():
             raise InvalidArguments('All keyword arguments must be after positional arguments.')
         self.argument_depth += 1
-        reduced_pos = [self.evaluate_statement(arg) for arg in args.arguments]
+        evaluate_statement = self.evaluate_statement
+        reduced_pos = [evaluate_statement(arg) for arg in args.arguments]
         if any(x is None for x in reduced_pos):
             raise InvalidArguments('At least one value in the arguments is void.')
         reduced_kw: T.Dict[str, InterpreterObject] = {}
-        for key, val in args.kwargs.items():
-            reduced_key = key_resolver(key)
-            assert isinstance(val, mparser.BaseNode)
-            reduced_val = self.evaluate_statement(val)
-            if reduced_val is None:
-                raise InvalidArguments(f'Value of key {reduced_key} is void.')
-            self.current_node = key
-            if duplicate_key_error and reduced_key in reduced_kw:
-                raise InvalidArguments(duplicate_key_error.format(reduced_key))
-            reduced_kw[reduced_key] = reduced_val
+        # Most calls have no keyword arguments at all
+        if args.kwargs:
+            for key, val in args.kwargs.items():
+                reduced_key = key_resolver(key)
+                reduced_val = evaluate_statement(val)
+                if reduced_val is None:
+                    raise InvalidArguments(f'Value of key {reduced_key} is void.')
+                self.current_node = key
+                if duplicate_key_error and reduced_key in reduced_kw:
+                    raise InvalidArguments(duplicate_key_error.format(reduced_key))
+                reduced_kw[reduced_key] = reduced_val
         self.argument_depth -= 1
-        final_kw = self.expand_default_kwargs(reduced_kw)
-        return reduced_pos, final_kw
+        if reduced_kw:
+            reduced_kw = self.expand_default_kwargs(reduced_kw)
+        return reduced_pos, reduced_kw
 
     def expand_default_kwargs(self, kwargs: T.Dict[str, T.Optional[InterpreterObject]]) -> T.Dict[str, T.Optional[InterpreterObject]]:
         if 'kwargs' not in kwargs:
@@ -656,18 +658,58 @@ class InterpreterBase:
                 raise mesonlib.MesonBugException(f'set_variable in InterpreterBase called with a non InterpreterObject {variable} of type {type(variable).__name__}')
         if not isinstance(varname, str):
             raise InvalidCode('First argument to set_variable must be a string.')
-        if re.match('[_a-zA-Z][_0-9a-zA-Z]*$', varname) is None:
+        if varname_regex.match(varname) is None:
             raise InvalidCode('Invalid variable name: ' + varname)
         if varname in self.builtin:
             raise InvalidCode(f'Tried to overwrite internal variable "{varname}"')
         self.variables[varname] = variable
 
     def get_variable(self, varname: str) -> InterpreterObject:
-        if varname in self.builtin:
-            return self.builtin[varname]
-        if varname in self.variables:
-            return self.variables[varname]
-        raise InvalidCode(f'Unknown variable "{varname}".')
+        # set_variable() keeps variables and builtins apart and never stores
+        # None, so the far more common variables can be looked up first.
+        var = self.variables.get(varname)
+        if var is None:
+            var = self.builtin.get(varname)
+            if var is None:
+                raise InvalidCode(f'Unknown variable "{varname}".')
+        return var
 
     def validate_extraction(self, buildtarget: mesonlib.HoldableObject) -> None:
         raise InterpreterException('validate_extraction is not implemented in this context (please file a bug)')
+
+
+def _raise_continue(self: InterpreterBase, cur: mparser.ContinueNode) -> T.NoReturn:
+    raise ContinueRequest()
+
+def _raise_break(self: InterpreterBase, cur: mparser.BreakNode) -> T.NoReturn:
+    raise BreakRequest()
+
+# evaluate_statement() looks up the exact node type here instead of running a
+# chain of isinstance() checks. Subclasses must come before their bases for
+# the isinstance() fallback.
+_STATEMENT_EVALUATORS: T.Dict[T.Type[mparser.BaseNode], T.Callable[[T.Any, T.Any], T.Optional[InterpreterObject]]] = {
+    mparser.FunctionNode: lambda self, cur: self.function_call(cur),
+    mparser.PlusAssignmentNode: lambda self, cur: self.evaluate_plusassign(cur),
+    mparser.AssignmentNode: lambda self, cur: self.assignment(cur),
+    mparser.MethodNode: lambda self, cur: self.method_call(cur),
+    mparser.StringNode: lambda self, cur: self.evaluate_string(cur),
+    mparser.BooleanNode: lambda self, cur: self._holderify(cur.value),
+    mparser.IfClauseNode: lambda self, cur: self.evaluate_if(cur),
+    mparser.IdNode: lambda self, cur: self.get_variable(cur.value),
+    mparser.ComparisonNode: lambda self, cur: self.evaluate_comparison(cur),
+    mparser.ArrayNode: lambda self, cur: self.evaluate_arraystatement(cur),
+    mparser.DictNode: lambda self, cur: self.evaluate_dictstatement(cur),
+    mparser.NumberNode: lambda self, cur: self._holderify(cur.value),
+    mparser.AndNode: lambda self, cur: self.evaluate_andstatement(cur),
+    mparser.OrNode: lambda self, cur: self.evaluate_orstatement(cur),
+    mparser.NotNode: lambda self, cur: self.evaluate_notstatement(cur),
+    mparser.UMinusNode: lambda self, cur: self.evaluate_uminusstatement(cur),
+    mparser.ArithmeticNode: lambda self, cur: self.evaluate_arithmeticstatement(cur),
+    mparser.ForeachClauseNode: lambda self, cur: self.evaluate_foreach(cur),
+    mparser.IndexNode: lambda self, cur: self.evaluate_indexing(cur),
+    mparser.TernaryNode: lambda self, cur: self.evaluate_ternary(cur),
+    mparser.ContinueNode: _raise_continue,
+    mparser.BreakNode: _raise_break,
+    mparser.ParenthesizedNode: lambda self, cur: self.evaluate_statement(cur.inner),
+    mparser.TestCaseClauseNode: lambda self, cur: self.evaluate_testcase(cur),
+}
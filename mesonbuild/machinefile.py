@@ -4,6 +4,7 @@
 import typing as T
 import configparser
 import os
+import re
 
 from . import mparser
 
@@ -30,6 +31,11 @@ class CmdLineFileParser(configparser.ConfigParser):
         return optionstr
 
 
+# A quoted string without any escapes, which is what most entries are
+_PLAIN_STRING_RE = re.compile(r"'[^'\\\n]*'")
+_PLAIN_NUMBER_RE = re.compile(r'0|[1-9][0-9]*')
+
+
 class MachineFileParser():
     def __init__(self, filenames: T.List[str], sourcedir: str) -> None:
         self.parser = CmdLineFileParser()
@@ -65,6 +71,11 @@ class MachineFileParser():
         for entry, value in self.parser.items(s):
             if ' ' in entry or '\t' in entry or "'" in entry or '"' in entry:
                 raise MesonException(f'Malformed variable name {entry!r} in machine file.')
+            res = self._evaluate_literal(value)
+            if res is not None:
+                section[entry] = res
+                self.scope[entry] = res
+                continue
             # Windows paths...
             value = value.replace('\\', '\\\\')
             try:
@@ -80,6 +91,19 @@ class MachineFileParser():
             self.scope[entry] = res
         return section
 
+    @staticmethod
+    def _evaluate_literal(value: str) -> T.Union[str, bool, int, None]:
+        """Evaluate trivial values without running the full parser."""
+        if _PLAIN_STRING_RE.fullmatch(value):
+            return value[1:-1]
+        if value == 'true':
+            return True
+        if value == 'false':
+            return False
+        if _PLAIN_NUMBER_RE.fullmatch(value):
+            return int(value)
+        return None
+
     def _evaluate_statement(self, node: mparser.BaseNode) -> T.Union[str, bool, int, T.List[str]]:
         if isinstance(node, (mparser.StringNode)):
             return node.value
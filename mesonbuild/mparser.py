@@ -6,6 +6,7 @@ from dataclasses import dataclass, field
 import re
 import codecs
 import os
+import sys
 import typing as T
 
 from .mesonlib import MesonException
@@ -215,6 +216,10 @@ class Lexer:
                             if value in self.future_keywords:
                                 mlog.warning(f"Identifier '{value}' will become a reserved keyword in a future release. Please rename it.",
                                              location=BaseNode(lineno, col, filename))
+                            # Identifiers end up as keys of the function, method,
+                            # keyword argument and variable dicts, interning them
+                            # lets those lookups compare by identity.
+                            value = sys.intern(value)
                     yield Token(tid, filename, curline_start, curline, col, bytespan, value)
                     break
             if not matched:
@@ -313,7 +318,9 @@ class StringNode(ElementaryNode[str]):
         self.raw_value = token.value
 
         if escape and not self.is_multiline:
-            self.value = self.escape()
+            # Short literals such as language, option and dependency names are
+            # looked up in dicts, interned they match the keys by identity.
+            self.value = sys.intern(self.escape())
 
     def escape(self) -> str:
         return ESCAPE_SEQUENCE_SINGLE_RE.sub(decode_match, self.raw_value)
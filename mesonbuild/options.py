@@ -519,11 +519,23 @@ class BuiltinOption(T.Generic[_T, _U]):
                  choices: T.Any = None, readonly: bool = False):
         self.opt_type = opt_type
         self.description = description
-        self.default = default
+        self._default = default
         self.choices = choices
         self.yielding = yielding
         self.readonly = readonly
 
+    @property
+    def default(self) -> T.Any:
+        # Some defaults have to ask the system, which is left until they are
+        # needed instead of being done whenever this module is imported.
+        if callable(self._default):
+            self._default = self._default()
+        return self._default
+
+    @default.setter
+    def default(self, value: T.Any) -> None:
+        self._default = value
+
     def init_option(self, name: 'OptionKey', value: T.Optional[T.Any], prefix: str) -> _U:
         """Create an instance of opt_type and return it."""
         if value is None:
@@ -594,7 +606,7 @@ BUILTIN_DIR_OPTIONS: T.Dict['OptionKey', 'BuiltinOption'] = OrderedDict([
     (OptionKey('datadir'),         BuiltinOption(UserStringOption, 'Data file directory', default_datadir())),
     (OptionKey('includedir'),      BuiltinOption(UserStringOption, 'Header file directory', default_includedir())),
     (OptionKey('infodir'),         BuiltinOption(UserStringOption, 'Info page directory', default_infodir())),
-    (OptionKey('libdir'),          BuiltinOption(UserStringOption, 'Library directory', default_libdir())),
+    (OptionKey('libdir'),          BuiltinOption(UserStringOption, 'Library directory', default_libdir)),
     (OptionKey('licensedir'),      BuiltinOption(UserStringOption, 'Licenses directory', '')),
     (OptionKey('libexecdir'),      BuiltinOption(UserStringOption, 'Library executable directory', default_libexecdir())),
     (OptionKey('localedir'),       BuiltinOption(UserStringOption, 'Locale data directory', default_localedir())),
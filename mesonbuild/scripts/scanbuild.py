@@ -42,7 +42,8 @@ def run(args: T.List[str]) -> int:
     # if any cross or native files are specified we should use them
     cmd = get_cmd_line_file(blddir)
     data = CmdLineFileParser()
-    data.read(cmd)
+    with open(cmd, encoding='utf-8') as f:
+        data.read_file(f, cmd)
 
     if 'cross_file' in data['properties']:
         meson_cmd.extend([f'--cross-file={os.path.abspath(f)}' for f in literal_eval(data['properties']['cross_file'])])
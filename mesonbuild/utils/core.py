@@ -16,7 +16,7 @@ import abc
 import typing as T
 
 if T.TYPE_CHECKING:
-    from hashlib import _Hash
+    from hashlib import _Hash, blake2b
     from typing_extensions import Literal
     from ..mparser import BaseNode
     from .. import programs
@@ -76,7 +76,7 @@ class EnvironmentVariables(HoldableObject):
         repr_str = "<{0}: {1}>"
         return repr_str.format(self.__class__.__name__, self.envvars)
 
-    def hash(self, hasher: _Hash) -> None:
+    def hash(self, hasher: T.Union[_Hash, blake2b]) -> None:
         myenv = self.get_env({})
         for key in sorted(myenv.keys()):
             hasher.update(bytes(key, encoding='utf-8'))
@@ -961,44 +961,46 @@ def version_compare_condition_with_min(condition: str, minimum: str) -> bool:
 
     return T.cast('bool', cmpop(Version(minimum), Version(condition)))
 
-def search_version(text: str) -> str:
-    # Usually of the type 4.1.4 but compiler output may contain
-    # stuff like this:
-    # (Sourcery CodeBench Lite 2014.05-29) 4.8.3 20140320 (prerelease)
-    # Limiting major version number to two digits seems to work
-    # thus far. When we get to GCC 100, this will break, but
-    # if we are still relevant when that happens, it can be
-    # considered an achievement in itself.
-    #
-    # This regex is reaching magic levels. If it ever needs
-    # to be updated, do not complexify but convert to something
-    # saner instead.
-    # We'll demystify it a bit with a verbose definition.
-    version_regex = re.compile(r"""
-    (?<!                # Zero-width negative lookbehind assertion
-        (
-            \d          # One digit
-            | \.        # Or one period
-        )               # One occurrence
-    )
-    # Following pattern must not follow a digit or period
+# Usually of the type 4.1.4 but compiler output may contain
+# stuff like this:
+# (Sourcery CodeBench Lite 2014.05-29) 4.8.3 20140320 (prerelease)
+# Limiting major version number to two digits seems to work
+# thus far. When we get to GCC 100, this will break, but
+# if we are still relevant when that happens, it can be
+# considered an achievement in itself.
+#
+# This regex is reaching magic levels. If it ever needs
+# to be updated, do not complexify but convert to something
+# saner instead.
+# We'll demystify it a bit with a verbose definition.
+_VERSION_REGEX = re.compile(r"""
+(?<!                # Zero-width negative lookbehind assertion
+    (
+        \d          # One digit
+        | \.        # Or one period
+    )               # One occurrence
+)
+# Following pattern must not follow a digit or period
+(
+    \d{1,2}         # One or two digits
+    (
+        \.\d+       # Period and one or more digits
+    )+              # One or more occurrences
     (
-        \d{1,2}         # One or two digits
-        (
-            \.\d+       # Period and one or more digits
-        )+              # One or more occurrences
-        (
-            -[a-zA-Z0-9]+   # Hyphen and one or more alphanumeric
-        )?              # Zero or one occurrence
-    )                   # One occurrence
-    """, re.VERBOSE)
-    match = version_regex.search(text)
+        -[a-zA-Z0-9]+   # Hyphen and one or more alphanumeric
+    )?              # Zero or one occurrence
+)                   # One occurrence
+""", re.VERBOSE)
+
+# A simpler regex for things like "blah 2020.01.100 foo" or "blah 2020.01 foo"
+_SIMPLE_VERSION_REGEX = re.compile(r"(\d{1,4}\.\d{1,4}\.?\d{0,4})")
+
+def search_version(text: str) -> str:
+    match = _VERSION_REGEX.search(text)
     if match:
         return match.group(0)
 
-    # try a simpler regex that has like "blah 2020.01.100 foo" or "blah 2020.01 foo"
-    version_regex = re.compile(r"(\d{1,4}\.\d{1,4}\.?\d{0,4})")
-    match = version_regex.search(text)
+    match = _SIMPLE_VERSION_REGEX.search(text)
     if match:
         return match.group(0)
 
@@ -1332,14 +1334,26 @@ def do_conf_file(src: str, dst: str, confdata: 'ConfigurationData',
         raise MesonException(f'Could not read input file {src}: {e!s}')
 
     (result, missing_variables, confdata_useless) = do_conf_str(src, data, confdata, variable_format, subproject)
+    try:
+        contents = ''.join(result).encode(encoding)
+    except Exception as e:
+        raise MesonException(f'Could not write output file {dst}: {e!s}')
+    # Compare in memory first, an unchanged output is neither written to a
+    # temporary file nor read back, and keeps its timestamp.
+    try:
+        with open(dst, 'rb') as f:
+            if f.read() == contents:
+                return missing_variables, confdata_useless
+    except FileNotFoundError:
+        pass
     dst_tmp = dst + '~'
     try:
-        with open(dst_tmp, 'w', encoding=encoding, newline='') as f:
-            f.writelines(result)
+        with open(dst_tmp, 'wb') as f:
+            f.write(contents)
     except Exception as e:
         raise MesonException(f'Could not write output file {dst}: {e!s}')
     shutil.copymode(src, dst_tmp)
-    replace_if_different(dst, dst_tmp)
+    os.replace(dst_tmp, dst)
     return missing_variables, confdata_useless
 
 CONF_C_PRELUDE = '''/*
@@ -1526,7 +1540,9 @@ def Popen_safe(args: T.List[str], write: T.Optional[str] = None,
                stderr: T.Union[None, T.TextIO, T.BinaryIO, int] = subprocess.PIPE,
                **kwargs: T.Any) -> T.Tuple['subprocess.Popen[str]', str, str]:
     import locale
-    encoding = locale.getpreferredencoding()
+    # Don't let it call setlocale(), that is process wide state and probes may
+    # be started from several threads at once.
+    encoding = locale.getpreferredencoding(False)
     # Stdin defaults to DEVNULL otherwise the command run by us here might mess
     # up the console and ANSI colors will stop working on Windows.
     # If write is not None, set stdin to PIPE so data can be sent.
@@ -1563,16 +1579,20 @@ def Popen_safe_legacy(args: T.List[str], write: T.Optional[str] = None,
     if write is not None:
         input_ = write.encode('utf-8')
     o, e = p.communicate(input_)
+    # Normalize line endings before decoding, so that only one string of the
+    # full output size is built.
     if o is not None:
+        o = o.replace(b'\r\n', b'\n')
         if sys.stdout.encoding is not None:
-            o = o.decode(encoding=sys.stdout.encoding, errors='replace').replace('\r\n', '\n')
+            o = o.decode(encoding=sys.stdout.encoding, errors='replace')
         else:
-            o = o.decode(errors='replace').replace('\r\n', '\n')
+            o = o.decode(errors='replace')
     if e is not None:
+        e = e.replace(b'\r\n', b'\n')
         if sys.stderr is not None and sys.stderr.encoding:
-            e = e.decode(encoding=sys.stderr.encoding, errors='replace').replace('\r\n', '\n')
+            e = e.decode(encoding=sys.stderr.encoding, errors='replace')
         else:
-            e = e.decode(errors='replace').replace('\r\n', '\n')
+            e = e.decode(errors='replace')
     return p, o, e
 
 
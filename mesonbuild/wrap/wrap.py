@@ -6,8 +6,6 @@ from __future__ import annotations
 from .. import mlog
 import contextlib
 from dataclasses import dataclass
-import urllib.request
-import urllib.error
 import urllib.parse
 import os
 import hashlib
@@ -40,13 +38,15 @@ if T.TYPE_CHECKING:
 
     Method = Literal['meson', 'cmake', 'cargo']
 
-try:
-    # Importing is just done to check if SSL exists, so all warnings
-    # regarding 'imported but unused' can be safely ignored
-    import ssl  # noqa
-    has_ssl = True
-except ImportError:
-    has_ssl = False
+# urllib.request and ssl pull in http.client, email and friends, which
+# most configure runs never need, so they are imported on first download.
+@lru_cache(maxsize=None)
+def _has_ssl() -> bool:
+    try:
+        import ssl  # noqa: F401
+    except ImportError:
+        return False
+    return True
 
 REQ_TIMEOUT = 30.0
 WHITELIST_SUBDOMAIN = 'wrapdb.mesonbuild.com'
@@ -62,7 +62,7 @@ def whitelist_wrapdb(urlstr: str) -> urllib.parse.ParseResult:
         raise WrapException(f'{urlstr} is not a valid URL')
     if not url.hostname.endswith(WHITELIST_SUBDOMAIN):
         raise WrapException(f'{urlstr} is not a whitelisted WrapDB URL')
-    if has_ssl and not url.scheme == 'https':
+    if _has_ssl() and not url.scheme == 'https':
         raise WrapException(f'WrapDB did not have expected SSL https url, instead got {urlstr}')
     return url
 
@@ -72,8 +72,11 @@ def open_wrapdburl(urlstring: str, allow_insecure: bool = False, have_opt: bool
     else:
         insecure_msg = ''
 
+    import urllib.request
     url = whitelist_wrapdb(urlstring)
-    if has_ssl:
+    if _has_ssl():
+        import ssl
+        import urllib.error
         try:
             return T.cast('http.client.HTTPResponse', urllib.request.urlopen(urllib.parse.urlunparse(url), timeout=REQ_TIMEOUT))
         except OSError as excp:
@@ -305,17 +308,19 @@ class Resolver:
         self.subdir_root = os.path.join(self.source_dir, self.subdir)
         self.cachedir = os.environ.get('MESON_PACKAGE_CACHE_DIR') or os.path.join(self.subdir_root, 'packagecache')
         self.wraps: T.Dict[str, PackageDefinition] = {}
+        # Only read when a download needs credentials, see get_netrc_credentials()
         self.netrc: T.Optional[netrc] = None
+        self.netrc_loaded = False
         self.provided_deps: T.Dict[str, PackageDefinition] = {}
         self.provided_programs: T.Dict[str, PackageDefinition] = {}
         self.wrapdb: T.Dict[str, T.Any] = {}
         self.wrapdb_provided_deps: T.Dict[str, str] = {}
         self.wrapdb_provided_programs: T.Dict[str, str] = {}
         self.load_wraps()
-        self.load_netrc()
         self.load_wrapdb()
 
     def load_netrc(self) -> None:
+        self.netrc_loaded = True
         try:
             self.netrc = netrc()
         except FileNotFoundError:
@@ -384,6 +389,7 @@ class Resolver:
         self.check_can_download()
         latest_version = info['versions'][0]
         version, revision = latest_version.rsplit('-', 1)
+        import urllib.request
         url = urllib.request.urlopen(f'https://wrapdb.mesonbuild.com/v2/{subp_name}_{version}-{revision}/{subp_name}.wrap')
         fname = Path(self.subdir_root, f'{subp_name}.wrap')
         with fname.open('wb') as f:
@@ -668,6 +674,8 @@ class Resolver:
                                self.directory], cwd=self.subdir_root)
 
     def get_netrc_credentials(self, netloc: str) -> T.Optional[T.Tuple[str, str]]:
+        if not self.netrc_loaded:
+            self.load_netrc()
         if self.netrc is None or netloc not in self.netrc.hosts:
             return None
 
@@ -678,6 +686,7 @@ class Resolver:
         return login, password
 
     def get_data(self, urlstring: str) -> T.Tuple[str, str]:
+        import urllib.request
         blocksize = 10 * 1024
         h = hashlib.sha256()
         tmpfile = tempfile.NamedTemporaryFile(mode='wb', dir=self.cachedir, delete=False)
@@ -141,6 +141,22 @@ class AllPlatformTests(BasePlatformTests):
         self.assertEqual(conf_file('@VAR@\n@VAR@\n', confdata), 'foo\nfoo\n')
         self.assertEqual(conf_file('@VAR@\r\n@VAR@\r\n', confdata), 'foo\r\nfoo\r\n')
 
+    def test_do_conf_file_unchanged_output(self):
+        with temp_filename() as fin:
+            with open(fin, 'w', encoding='utf-8') as fobj:
+                fobj.write('@VAR@\n')
+            with temp_filename() as fout:
+                do_conf_file(fin, fout, {'VAR': ('foo', '')}, 'meson')
+                os.utime(fout, ns=(0, 0))
+                # Same output, the file must not be touched
+                do_conf_file(fin, fout, {'VAR': ('foo', '')}, 'meson')
+                self.assertEqual(os.stat(fout).st_mtime_ns, 0)
+                self.assertFalse(os.path.exists(fout + '~'))
+                do_conf_file(fin, fout, {'VAR': ('bar', '')}, 'meson')
+                self.assertNotEqual(os.stat(fout).st_mtime_ns, 0)
+                with open(fout, encoding='utf-8') as fobj:
+                    self.assertEqual(fobj.read(), 'bar\n')
+
     def test_do_conf_file_by_format(self):
         def conf_str(in_data, confdata, vformat):
             (result, missing_variables, confdata_useless) = do_conf_str('configuration_file', in_data, confdata, variable_format = vformat)
@@ -225,7 +225,7 @@ class DataTests(unittest.TestCase):
         with open('data/syntax-highlighting/vim/syntax/meson.vim', encoding='utf-8') as f:
             res = re.search(r'syn keyword mesonBuiltin(\s+\\\s\w+)+', f.read(), re.MULTILINE)
             defined = set([a.strip() for a in res.group().split('\\')][1:])
-            self.assertEqual(defined, set(chain(interp.funcs.keys(), interp.builtin.keys())))
+            self.assertEqual(defined, set(chain(interp.FUNCTIONS.keys(), interp.funcs.keys(), interp.builtin.keys())))
 
     @mock.patch.dict(os.environ)
     @mock.patch.object(Interpreter, 'load_root_meson_file', mock.Mock(return_value=None))
@@ -241,4 +241,4 @@ class DataTests(unittest.TestCase):
         env = get_fake_env()
         interp = Interpreter(FakeBuild(env))
         astint = AstInterpreter('.', '', '')
-        self.assertEqual(set(interp.funcs.keys()), set(astint.funcs.keys()))
+        self.assertEqual(set(chain(interp.FUNCTIONS.keys(), interp.funcs.keys())), set(astint.funcs.keys()))
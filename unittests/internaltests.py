@@ -22,7 +22,9 @@ import mesonbuild.dependencies.base
 import mesonbuild.dependencies.factory
 import mesonbuild.envconfig
 import mesonbuild.environment
+import mesonbuild.interpreterbase
 import mesonbuild.modules.gnome
+import mesonbuild.mparser
 from mesonbuild import coredata
 from mesonbuild.compilers.c import ClangCCompiler, GnuCCompiler
 from mesonbuild.compilers.cpp import VisualStudioCPPCompiler
@@ -505,6 +507,16 @@ class InternalTests(unittest.TestCase):
         self.assertEqual([holder1, 2], listify([holder1, 2]))
         self.assertEqual([holder1, 2, 3], listify([holder1, 2, [3]]))
 
+    def test_interpreter_flatten(self):
+        flatten = mesonbuild.interpreterbase.flatten
+        self.assertEqual([1], flatten(1))
+        self.assertEqual([], flatten([[], [[]]]))
+        self.assertEqual([1, 2, 3, 4], flatten([1, [2, [3, []], 4]]))
+        # Only lists are flattened
+        self.assertEqual([1, (2, [3])], flatten([1, [(2, [3])]]))
+        node = mesonbuild.mparser.StringNode(mesonbuild.mparser.Token('string', '', 0, 0, 0, None, 'foo'))
+        self.assertEqual(['foo', 'foo'], flatten([node, [node]]))
+
     def test_extract_as_list(self):
         extract = mesonbuild.mesonlib.extract_as_list
         # Test sanity
@@ -1575,6 +1587,7 @@ class InternalTests(unittest.TestCase):
         cases = [
             ('x86', 'x86'),
             ('i386', 'x86'),
+            ('i686', 'x86'),
             ('bepc', 'x86'),  # Haiku
             ('earm', 'arm'),  # NetBSD
             ('arm', 'arm'),
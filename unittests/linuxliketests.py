@@ -1024,6 +1024,38 @@ class LinuxlikeTests(BasePlatformTests):
         self.init(testdir, extra_args=['-Db_coverage=true'], default_args=False)
         self.build('reconfigure')
 
+    def test_reconfigure_changed_compiler(self):
+        '''
+        Test that a stored compiler is only detected again on reconfigure
+        when its binary has changed.
+        '''
+        cc = shutil.which('cc')
+        if not cc:
+            raise SkipTest('cc not found')
+        testdir = os.path.join(self.common_test_dir, '1 trivial')
+        tmpdir = os.path.realpath(tempfile.mkdtemp())
+        self.addCleanup(windows_proof_rmtree, tmpdir)
+        wrapper = os.path.join(tmpdir, 'cc-wrapper')
+        with open(wrapper, 'w', encoding='utf-8') as f:
+            f.write(f'#!/bin/sh\nexec {cc} "$@"\n')
+        os.chmod(wrapper, 0o755)
+        env = {'CC': wrapper}
+        msg = 'machine has changed, detecting it again'
+
+        self.init(testdir, override_envvars=env)
+        out = self.init(testdir, extra_args=['--reconfigure'], override_envvars=env)
+        self.assertNotIn(msg, out)
+
+        with open(wrapper, 'a', encoding='utf-8') as f:
+            f.write('# upgraded\n')
+        out = self.init(testdir, extra_args=['--reconfigure'], override_envvars=env)
+        self.assertIn(msg, out)
+        self.build()
+
+        # The new binary has been recorded
+        out = self.init(testdir, extra_args=['--reconfigure'], override_envvars=env)
+        self.assertNotIn(msg, out)
+
     def test_vala_generated_source_buildir_inside_source_tree(self):
         '''
         Test that valac outputs generated C files in the expected location when
@@ -118,7 +118,8 @@ class PlatformAgnosticTests(BasePlatformTests):
         self.build('reconfigure')
 
     def check_connectivity(self):
-        import urllib
+        import urllib.error
+        import urllib.request
         try:
             with urllib.request.urlopen('https://wrapdb.mesonbuild.com') as p:
                 pass
@@ -407,3 +407,13 @@ class RewriterTests(BasePlatformTests):
         # Do it line per line because it is easier to debug like that
         for orig_line, new_line in zip_longest(original_contents.splitlines(), new_contents.splitlines()):
             self.assertEqual(orig_line, new_line)
+
+    def test_introspection_ast_is_not_shared(self):
+        # The rewriter edits the AST it gets, so each interpreter must parse
+        # the build file itself
+        test_path = Path(self.unit_test_dir, '120 rewrite')
+        first = IntrospectionInterpreter(test_path, '', 'ninja')
+        first.load_root_meson_file()
+        second = IntrospectionInterpreter(test_path, '', 'ninja')
+        second.load_root_meson_file()
+        self.assertIsNot(first.ast, second.ast)